@@ -21,10 +21,12 @@ from argos.controllers import (
     PlaylistsController,
     TracklistController,
 )
+from argos.controllers.callsize import CallSizeTuner
+from argos.controllers.scheduler import LibraryWorkScheduler
 from argos.download import ImageDownloader
 from argos.http import MopidyHTTPClient
 from argos.info import InformationService
-from argos.message import Message, MessageDispatchTask, MessageType
+from argos.message import Message, MessageDispatchTask, MessageQueue, MessageType
 from argos.model import Model
 from argos.notify import Notifier
 from argos.placement import WindowPlacement
@@ -65,7 +67,18 @@ class Application(Gtk.Application):
         random.seed()
 
         self._loop = asyncio.new_event_loop()
-        self._message_queue: asyncio.Queue = asyncio.Queue()
+        self._message_queue: MessageQueue = MessageQueue()
+        self._call_size_tuner = CallSizeTuner(
+            is_connected=lambda: self._model.connected
+        )
+        self._library_work_scheduler = LibraryWorkScheduler(
+            get_prioritized_keys=lambda: (
+                self._model.library.props.displayed_album_uri,
+                self._model.library.props.displayed_directory_uri,
+            )
+        )
+        # library calls share a budget, calls of the displayed album
+        # then of the displayed directory being served first
         self._tasks: list[asyncio.Task] = []
 
         self._settings = Gio.Settings(self.props.application_id)
@@ -197,13 +210,21 @@ class Application(Gtk.Application):
         return self._controllers
 
     @property
-    def message_queue(self) -> asyncio.Queue:
+    def message_queue(self) -> MessageQueue:
         return self._message_queue
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
         return self._loop
 
+    @property
+    def call_size_tuner(self) -> CallSizeTuner:
+        return self._call_size_tuner
+
+    @property
+    def library_work_scheduler(self) -> LibraryWorkScheduler:
+        return self._library_work_scheduler
+
     def _apply_application_style(self):
         LOGGER.debug("Applying application style")
         css_provider = Gtk.CssProvider()
@@ -402,6 +423,7 @@ class Application(Gtk.Application):
                 ("app.close-window", ["<Primary>W"]),
             ),
             ("quit", self.quit_activate_cb, None, ("app.quit", ["<Primary>Q"])),
+            ("dump-metrics", self.dump_metrics_activate_cb, None, None),
         ]
         for action_name, callback, params_type_desc, accel in action_descriptions:
             params_type = (
@@ -421,6 +443,10 @@ class Application(Gtk.Application):
         LOGGER.debug("Attaching event loop to calling thread")
         asyncio.set_event_loop(self._loop)
 
+        self._message_queue.put_nowait(Message(MessageType.RESTORE_LIBRARY))
+        # Library snapshot is restored while connecting to Mopidy, before
+        # any other message is consumed
+
         for coroutine in (
             self._ws.listen(),
             MessageDispatchTask(self)(),
@@ -556,6 +582,18 @@ class Application(Gtk.Application):
         if self.window is not None:
             self.window.destroy()
 
+    def dump_metrics_activate_cb(
+        self, action: Gio.SimpleAction, parameter: None
+    ) -> None:
+        metrics = self._ws.metrics
+        message_queue = self._message_queue
+
+        def dump() -> None:
+            LOGGER.info(f"Metrics of JSON-RPC commands:\n{metrics.format()}")
+            LOGGER.info(f"Statistics of message queue: {message_queue.stats()}")
+
+        self._loop.call_soon_threadsafe(dump)
+
     def new_playlist_activate_cb(
         self, action: Gio.SimpleAction, parameter: None
     ) -> None:
@@ -759,7 +797,13 @@ class Application(Gtk.Application):
         self, action: Gio.SimpleAction, parameter: GLib.Variant
     ) -> None:
         image_uris = parameter.unpack()
-        self._send_message(MessageType.FETCH_IMAGES, data={"image_uris": image_uris})
+        self._send_message(
+            MessageType.FETCH_IMAGES,
+            data={
+                "image_uris": image_uris,
+                "directory_uri": self._model.library.props.displayed_directory_uri,
+            },
+        )
 
     def _on_prefer_dark_theme_changed(
         self,
@@ -1,7 +1,10 @@
+import asyncio
 import logging
 from operator import attrgetter
 from typing import TYPE_CHECKING
 
+from gi.repository import GObject
+
 if TYPE_CHECKING:
     from argos.app import Application
 
@@ -24,7 +27,29 @@ class AlbumsController(ControllerBase):
 
         self._information: InformationService = application.props.information
 
-    @consume(MessageType.COMPLETE_ALBUM_DESCRIPTION)
+        self._lookup_tasks: dict[str, asyncio.Task] = {}
+        # ongoing lookups of album tracks by album URI
+
+        self._model.library.connect(
+            "notify::displayed-album-uri", self._on_displayed_album_uri_changed
+        )
+
+    def _on_displayed_album_uri_changed(
+        self,
+        _1: GObject.Object,
+        _2: GObject.ParamSpec,
+    ) -> None:
+        self._loop.call_soon_threadsafe(self._cancel_obsolete_lookups)
+
+    def _cancel_obsolete_lookups(self) -> None:
+        """Cancel lookups of albums the user interface moved away from."""
+        displayed_album_uri = self._model.library.props.displayed_album_uri
+        for album_uri, task in self._lookup_tasks.items():
+            if album_uri != displayed_album_uri and not task.done():
+                LOGGER.debug(f"Cancelling obsolete lookup of album {album_uri!r}")
+                task.cancel()
+
+    @consume(MessageType.COMPLETE_ALBUM_DESCRIPTION, concurrent=True, key="album_uri")
     async def complete_album_description(self, message: Message) -> None:
         album_uri = message.data.get("album_uri", "")
         if not album_uri:
@@ -41,7 +66,31 @@ class AlbumsController(ControllerBase):
             LOGGER.info(f"Album with URI {album_uri!r} already completed")
             return
 
-        tracks_dto = await self._http.lookup_library([album_uri])
+        if album_uri != self._model.library.props.displayed_album_uri:
+            LOGGER.info(
+                f"Skipping lookup of album with URI {album_uri!r} not displayed"
+            )
+            return
+
+        task = asyncio.create_task(
+            self.schedule_library_call(
+                album_uri, album.backend, self._http.lookup_library, [album_uri]
+            )
+        )
+        self._lookup_tasks[album_uri] = task
+        try:
+            tracks_dto = await task
+        except asyncio.CancelledError:
+            current_task = asyncio.current_task()
+            if current_task is not None and current_task.cancelling() > 0:
+                raise
+
+            LOGGER.info(f"Lookup of album with URI {album_uri!r} cancelled")
+            return
+        finally:
+            if self._lookup_tasks.get(album_uri) is task:
+                del self._lookup_tasks[album_uri]
+
         if tracks_dto is None:
             return
 
@@ -75,7 +124,7 @@ class AlbumsController(ControllerBase):
             tracks=parsed_tracks,
         )
 
-    @consume(MessageType.COLLECT_ALBUM_INFORMATION)
+    @consume(MessageType.COLLECT_ALBUM_INFORMATION, concurrent=True, key="album_uri")
     async def collect_album_information(self, message: Message) -> None:
         information_service = self._settings.get_boolean("information-service")
         if not information_service:
@@ -1,16 +1,25 @@
 import asyncio
-from typing import TYPE_CHECKING, Any
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Coroutine
 
 from gi.repository import Gio, GObject
 
 if TYPE_CHECKING:
     from argos.app import Application
 
+from argos.controllers.callsize import CallSizeTuner
+from argos.controllers.scheduler import LibraryWorkScheduler
 from argos.http import MopidyHTTPClient
 from argos.message import Message, MessageType
-from argos.model import Model
+from argos.model import Model, MopidyBackend
 from argos.notify import Notifier
 
+LOGGER = logging.getLogger(__name__)
+
+_RETRY_DELAY = 1.0  # s
+# Delay before the first retry of a failed library call, doubled on
+# each retry
+
 
 class ControllerBase(GObject.Object):
     """Base class for controllers.
@@ -28,6 +37,8 @@ class ControllerBase(GObject.Object):
     ):
         super().__init__()
 
+        self._call_size_tuner: CallSizeTuner = application.call_size_tuner
+        self._scheduler: LibraryWorkScheduler = application.library_work_scheduler
         self._http: MopidyHTTPClient = application.props.http
         self._loop: asyncio.AbstractEventLoop = application.loop
         self._message_queue: asyncio.Queue = application.message_queue
@@ -40,3 +51,52 @@ class ControllerBase(GObject.Object):
     ) -> None:
         message = Message(message_type, data or {})
         self._loop.call_soon_threadsafe(self._message_queue.put_nowait, message)
+
+    async def schedule_library_call(
+        self,
+        key: str,
+        backend: MopidyBackend | None,
+        func: Callable[..., Coroutine[Any, Any, Any]],
+        params: Any,
+        *,
+        low_priority: bool = False,
+    ) -> Any:
+        """Make a library call through the library work scheduler.
+
+        The call holds a slot of the budget shared by all library
+        work, on behalf of ``key`` (a directory or album URI).
+
+        When ``backend`` is given, the call also holds a slot of the
+        budget of the backend, is given the timeout of the backend,
+        and is retried with exponential backoff on failure. Calls made
+        on behalf of the root directory aren't managed by any backend.
+
+        """
+        if backend is None:
+            async with self._scheduler.slot(key, low_priority=low_priority):
+                return await func(params)
+
+        delay = _RETRY_DELAY
+        for retry in range(backend.props.retries + 1):
+            if retry > 0:
+                if not self._model.connected:
+                    break
+
+                LOGGER.debug(
+                    f"Retrying failed library call for backend {backend} "
+                    f"in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+
+            async with self._scheduler.slot(
+                key,
+                group=backend.props.name,
+                group_budget=backend.props.max_concurrency,
+                low_priority=low_priority,
+            ):
+                result = await func(params, timeout=backend.props.timeout)
+            if result is not None:
+                return result
+
+        return None
@@ -0,0 +1,206 @@
+import asyncio
+import json
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+import xdg.BaseDirectory  # type: ignore
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CALL_SIZE = 20
+MIN_CALL_SIZE = 1
+MAX_CALL_SIZE = 500
+
+FAST_CALL_DURATION = 1.0  # s
+SLOW_CALL_DURATION = 10.0  # s
+MAX_ITEMS_PER_CALL = 2000
+# Call size isn't increased once replies hold more items than this
+# threshold, to bound the size of websocket frames
+
+GROWTH_FACTOR = 1.5
+
+SAVE_DELAY = 5.0  # s
+# Delay between a size change and the save of sizes, to save once
+# when sizes change in a row
+
+
+def _count_items(result: dict[str, Any]) -> int:
+    return sum(len(v) if isinstance(v, (list, tuple)) else 1 for v in result.values())
+
+
+class CallSizePolicy:
+    """Size of the slices of a given method handled by a given backend.
+
+    The size grows when calls are fast, and shrinks when calls are
+    slow or fail (which is the case of timeouts).
+
+    """
+
+    def __init__(self, tuner: "CallSizeTuner", key: str, size: int, initial_size: int):
+        self._tuner = tuner
+        self._key = key
+        self._size = size
+        self._initial_size = initial_size
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def record(
+        self,
+        call_size: int,
+        duration: float,
+        result: dict[str, Any] | None,
+    ) -> None:
+        """Adapt size to the measures of a call.
+
+        Args:
+            call_size: Number of parameters of the call.
+
+            duration: Duration of the call in seconds.
+
+            result: Result of the call, ``None`` for a failed call.
+
+        """
+        if result is None and not self._tuner.is_connected():
+            LOGGER.debug(f"Ignoring failed call of {self._key!r} while disconnected")
+            return
+
+        size = self._size
+        if result is None or duration > SLOW_CALL_DURATION:
+            size = max(MIN_CALL_SIZE, min(size, call_size) // 2)
+        elif duration < FAST_CALL_DURATION and call_size >= size:
+            item_count = _count_items(result)
+            if item_count * GROWTH_FACTOR <= MAX_ITEMS_PER_CALL:
+                size = min(MAX_CALL_SIZE, math.ceil(size * GROWTH_FACTOR))
+
+        if size != self._size:
+            LOGGER.debug(
+                f"Call size of {self._key!r} changed from {self._size} to {size} "
+                f"after call of size {call_size} lasting {duration:.2f}s"
+            )
+            self._size = size
+            self._tuner.store(self._key, size, self._initial_size)
+
+
+class CallSizeTuner:
+    """Learn the size of slices of bulk library calls.
+
+    Sizes are learned per backend and per method from measured
+    latencies and response sizes, and are remembered between
+    sessions.
+
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        is_connected: Callable[[], bool] = lambda: True,
+    ):
+        self._path = (
+            path
+            if path is not None
+            else Path(xdg.BaseDirectory.save_cache_path("argos")) / "call-sizes.json"
+        )
+        # learned sizes by key, with the initial size they were
+        # learned from
+        self._sizes: dict[str, tuple[int, int]] = self._load()
+        self._save_handle: asyncio.TimerHandle | None = None
+        self.is_connected = is_connected
+        # failures of calls made while disconnected don't tell
+        # anything about the right size
+
+    def get_policy(
+        self, backend_name: str, method: str, *, default_size: int | None = None
+    ) -> CallSizePolicy:
+        """Get the policy of a method handled by a backend.
+
+        A learned size is forgotten when it was learned from an
+        initial size other than ``default_size``, e.g. after a change
+        of the call size of a backend profile.
+
+        """
+        key = f"{backend_name}:{method}"
+        initial_size = default_size or DEFAULT_CALL_SIZE
+        size, learned_from = self._sizes.get(key, (initial_size, initial_size))
+        if learned_from != initial_size:
+            LOGGER.info(
+                f"Forgetting call size of {key!r} learned from initial size "
+                f"{learned_from} since initial size is now {initial_size}"
+            )
+            size = initial_size
+            self.store(key, size, initial_size)
+
+        return CallSizePolicy(self, key, size, initial_size)
+
+    def store(self, key: str, size: int, initial_size: int) -> None:
+        """Store a size, sizes are saved to disk later.
+
+        Sizes are written by a worker thread once they stop changing
+        for ``SAVE_DELAY`` seconds, or right away when no event loop
+        is running.
+
+        """
+        self._sizes[key] = (size, initial_size)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save(dict(self._sizes))
+            return
+
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+
+        self._save_handle = loop.call_later(SAVE_DELAY, self._schedule_save, loop)
+
+    def _schedule_save(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._save_handle = None
+        loop.run_in_executor(None, self._save, dict(self._sizes))
+
+    def _load(self) -> dict[str, tuple[int, int]]:
+        if not self._path.exists():
+            return {}
+
+        try:
+            with self._path.open() as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as error:
+            LOGGER.warning(f"Failed to load call sizes, {error}")
+            return {}
+
+        if not isinstance(data, dict):
+            LOGGER.warning(f"Unexpected content of {str(self._path)!r}")
+            return {}
+
+        sizes: dict[str, tuple[int, int]] = {}
+        for key, value in data.items():
+            if not isinstance(value, dict):
+                continue
+
+            size, initial_size = value.get("size"), value.get("initial_size")
+            if not isinstance(size, int) or not isinstance(initial_size, int):
+                continue
+
+            sizes[str(key)] = (
+                max(MIN_CALL_SIZE, min(MAX_CALL_SIZE, size)),
+                initial_size,
+            )
+        return sizes
+
+    def _save(self, sizes: dict[str, tuple[int, int]]) -> None:
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        data = {
+            key: {"size": size, "initial_size": initial_size}
+            for key, (size, initial_size) in sizes.items()
+        }
+        try:
+            with tmp_path.open("w") as fh:
+                json.dump(data, fh)
+            os.replace(tmp_path, self._path)
+        except OSError as error:
+            LOGGER.warning(f"Failed to save call sizes, {error}")
@@ -25,4 +25,5 @@ class ImagesController(ControllerBase):
     async def fetch_images(self, message: Message) -> None:
         LOGGER.debug("Starting images download...")
         image_uris = message.data.get("image_uris", [])
-        await self._download.fetch_images(image_uris)
+        directory_uri = message.data.get("directory_uri")
+        await self._download.fetch_images(image_uris, directory_uri=directory_uri)
@@ -1,8 +1,11 @@
 import asyncio
 import gettext
 import logging
+import threading
+import time
+from functools import partial
 from operator import attrgetter
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Generator, Sequence, TypeVar
 
 from gi.repository import Gio, GLib, GObject
 
@@ -27,11 +30,28 @@ from argos.model import (
     TrackModel,
 )
 from argos.model.library import MOPIDY_LOCAL_ALBUMS_URI
+from argos.model.snapshot import LibrarySnapshot, iter_dump_directory
 
 LOGGER = logging.getLogger(__name__)
 
 _ = gettext.gettext
 
+_MAX_CONCURRENT_CALLS = 4
+# Number of slices of library calls kept in flight while completing
+# the root directory, which isn't managed by any backend, see
+# MopidyBackend.max_concurrency for other directories
+
+_SNAPSHOT_SAVE_DELAY = 10  # s
+# Delay between the completion of a directory and the save of the
+# library snapshot, to save once when directories are completed in a
+# row
+_LOCAL_UPDATES_MAX_AGES = (604800, 2592000)  # s
+# Maximum ages of Mopidy-Local "Last Week's Updates" and "Last Month's
+# Updates" directories, used to synchronize albums incrementally
+_LOCAL_ALBUMS_SYNC_PERIOD = 3600  # s
+# Period of the incremental synchronization of Mopidy-Local albums,
+# which also happens on connection to the Mopidy server
+
 
 _DIRECTORY_NAMES = {
     "Files": _("Files"),
@@ -54,6 +74,28 @@ _DIRECTORY_NAMES = {
 }
 
 
+M = TypeVar("M", AlbumModel, TrackModel)
+
+
+def _split_known_refs(
+    ref_dtos: Sequence[RefDTO], known_models: dict[str, M]
+) -> tuple[list[M], list[RefDTO]]:
+    """Split references into known models and unknown references."""
+    models: list[M] = []
+    unknown_ref_dtos: list[RefDTO] = []
+    for ref_dto in ref_dtos:
+        model = known_models.get(ref_dto.uri)
+        if model is not None:
+            models.append(model)
+        else:
+            unknown_ref_dtos.append(ref_dto)
+    return models, unknown_ref_dtos
+
+
+async def _nothing() -> list[Any]:
+    return []
+
+
 class LibraryController(ControllerBase):
     """Library controller.
 
@@ -69,12 +111,33 @@ class LibraryController(ControllerBase):
         self._download: ImageDownloader = application.props.download
 
         self._tasks: dict[str, asyncio.Task | None] = {}
+        self._snapshot = LibrarySnapshot()
+        self._snapshot_save_source_id: int | None = None
+        self._snapshot_outdated = False
+        # whether the library changed since the last save of the
+        # snapshot, maintained from the GTK thread
+        self._stale_directory_uris: set[str] = set()
+        # URIs of directories restored from the library snapshot or
+        # partially completed, and not yet revalidated against the
+        # Mopidy server
+        self._synced_at: dict[str, float] = {}
+        # time of last synchronization of directories by URI
+        self._partially_published_uris: set[str] = set()
+        # URIs of directories whose albums are being published while
+        # they're completed, maintained from the loop thread since the
+        # model is updated later from the GTK thread
+
+        self._album_tracks_to_preload: dict[str, MopidyBackend] = {}
+        # albums whose tracks are preloaded in background, by URI
+        self._album_tracks_preloading = False
 
         self._on_index_mopidy_local_albums_changed(
             self._settings, "index-mopidy-local-albums"
         )
         # Hack to set default_uri to the value derived from user settings
 
+        self._on_backend_profiles_changed(self._settings, "backend-profiles")
+
         self._settings.connect(
             "changed::index-mopidy-local-albums",
             self._on_index_mopidy_local_albums_changed,
@@ -83,8 +146,21 @@ class LibraryController(ControllerBase):
             "notify::default-uri",
             self._on_library_default_uri_changed,
         )
+        self._model.library.connect(
+            "notify::displayed-directory-uri",
+            self._on_displayed_directory_uri_changed,
+        )
+        self._settings.connect(
+            "changed::backend-profiles", self._on_backend_profiles_changed
+        )
         self._settings.connect("changed::album-sort", self._on_album_sort_changed)
         self._settings.connect("changed::track-sort", self._on_track_sort_changed)
+        self._model.connect("directory-completed", self._on_directory_completed)
+        self._model.connect("album-completed", self._on_album_completed)
+        self._model.connect("notify::connected", self._on_connected_changed)
+        GLib.timeout_add_seconds(
+            _LOCAL_ALBUMS_SYNC_PERIOD, self._on_local_albums_sync_timeout
+        )
 
     def _on_index_mopidy_local_albums_changed(
         self,
@@ -96,6 +172,14 @@ class LibraryController(ControllerBase):
             MOPIDY_LOCAL_ALBUMS_URI if index_mopidy_local_albums else ""
         )
 
+    def _on_backend_profiles_changed(self, settings: Gio.Settings, key: str) -> None:
+        overrides = settings.get_value(key).unpack()
+        if not isinstance(overrides, dict):
+            overrides = {}
+
+        for backend in self._model.backends:
+            backend.apply_profile(overrides.get(backend.props.name, {}))
+
     def _on_library_default_uri_changed(
         self,
         _1: GObject.Object,
@@ -105,6 +189,46 @@ class LibraryController(ControllerBase):
         if default_uri not in (MOPIDY_LOCAL_ALBUMS_URI, ""):
             LOGGER.error(f"Default URI {default_uri!r} not supported")
 
+    def _on_displayed_directory_uri_changed(
+        self,
+        _1: GObject.Object,
+        _2: GObject.ParamSpec,
+    ) -> None:
+        self._loop.call_soon_threadsafe(self._cancel_obsolete_browses)
+
+    def _cancel_obsolete_browses(self) -> None:
+        """Cancel browse of directories the user interface moved away from.
+
+        Albums already published by a cancelled task are kept, as
+        well as the content of a directory being revalidated; Such a
+        directory is then marked stale so that its next browse only
+        completes the missing content. Pending downloads of images of
+        the cancelled browses are cancelled too.
+
+        """
+        wanted_uris = {
+            self._model.library.props.displayed_directory_uri,
+            self._model.library.props.default_uri,
+        }
+        cancelled_uris: list[str] = []
+        for directory_uri, task in self._tasks.items():
+            if task is None or task.done() or directory_uri in wanted_uris:
+                continue
+
+            LOGGER.debug(f"Cancelling obsolete browse of directory {directory_uri!r}")
+            task.cancel()
+            self._tasks[directory_uri] = None
+            cancelled_uris.append(directory_uri)
+
+            if (
+                directory_uri in self._partially_published_uris
+                or directory_uri in self._synced_at
+            ):
+                self._stale_directory_uris.add(directory_uri)
+
+        if len(cancelled_uris) > 0:
+            self._download.cancel_downloads(cancelled_uris)
+
     def _on_album_sort_changed(self, settings: Gio.Settings, key: str) -> None:
         album_sort_id = self._settings.get_string("album-sort")
         self._model.sort_albums(album_sort_id)
@@ -113,6 +237,236 @@ class LibraryController(ControllerBase):
         track_sort_id = self._settings.get_string("track-sort")
         self._model.sort_tracks(track_sort_id)
 
+    def _on_connected_changed(self, _1: GObject.Object, _2: GObject.ParamSpec) -> None:
+        if self._model.connected:
+            self.send_message(MessageType.PRELOAD_ALBUM_TRACKS, {"resume": True})
+            self._sync_local_albums()
+
+    def _on_local_albums_sync_timeout(self) -> bool:
+        if self._model.connected:
+            self._sync_local_albums()
+        return True
+
+    def _sync_local_albums(self) -> None:
+        self.send_message(
+            MessageType.BROWSE_DIRECTORY,
+            {"uri": MOPIDY_LOCAL_ALBUMS_URI, "sync": True},
+        )
+
+    def _on_directory_completed(self, _1: GObject.Object, directory_uri: str) -> None:
+        if directory_uri in self._stale_directory_uris:
+            # content restored from the snapshot
+            return
+
+        self._snapshot_outdated = True
+        if self._snapshot_save_source_id is not None:
+            GLib.source_remove(self._snapshot_save_source_id)
+
+        self._snapshot_save_source_id = GLib.timeout_add_seconds(
+            _SNAPSHOT_SAVE_DELAY, self._save_snapshot
+        )
+
+    def _on_album_completed(self, _1: GObject.Object, album_uri: str) -> None:
+        # albums are completed in a row while their tracks are
+        # preloaded, a pending save or dump isn't postponed
+        self._snapshot_outdated = True
+        if self._snapshot_save_source_id is None:
+            self._snapshot_save_source_id = GLib.timeout_add_seconds(
+                _SNAPSHOT_SAVE_DELAY, self._save_snapshot
+            )
+
+    def _save_snapshot(self) -> bool:
+        self._snapshot_save_source_id = None
+        if not self._snapshot_outdated:
+            return False
+
+        self._snapshot_outdated = False
+        # the library is dumped from idle callbacks not to block the
+        # user interface, a directory completed in the meantime
+        # restarts the save
+        steps = iter_dump_directory(self._model.library.props.root_directory)
+        self._snapshot_save_source_id = GLib.idle_add(self._dump_snapshot_step, steps)
+        return False
+
+    def _dump_snapshot_step(self, steps: Generator[None, None, dict[str, Any]]) -> bool:
+        try:
+            next(steps)
+            return True
+        except StopIteration as stop:
+            root = stop.value
+
+        self._snapshot_save_source_id = None
+        thread = threading.Thread(
+            target=self._snapshot.save,
+            args=(
+                self._settings.get_string("mopidy-base-url"),
+                root,
+                dict(self._synced_at),
+            ),
+            name="LibrarySnapshotThread",
+            daemon=True,
+        )
+        thread.start()
+
+        if self._snapshot_outdated:
+            # albums completed while the library was dumped
+            self._snapshot_save_source_id = GLib.timeout_add_seconds(
+                _SNAPSHOT_SAVE_DELAY, self._save_snapshot
+            )
+        return False
+
+    @consume(MessageType.RESTORE_LIBRARY)
+    async def restore_library(self, message: Message) -> None:
+        restored = await asyncio.to_thread(
+            self._snapshot.load,
+            self._settings.get_string("mopidy-base-url"),
+            list(self._model.backends),
+        )
+        if restored is None or len(restored.directories) == 0:
+            return
+
+        LOGGER.info(
+            f"Restoring {len(restored.directories)} directories from library snapshot"
+        )
+        self._synced_at.update(restored.synced_at)
+        last_directory = restored.directories[-1]
+        for directory in restored.directories:
+            complete_directory = partial(
+                self._model.complete_directory,
+                directory.uri,
+                albums=directory.albums,
+                directories=directory.directories,
+                playlists=[],
+                tracks=directory.tracks,
+                wait_for_model_update=directory is last_directory,
+            )
+            if directory is last_directory:
+                await asyncio.to_thread(complete_directory)
+            else:
+                complete_directory()
+            self._stale_directory_uris.add(directory.uri)
+            GLib.idle_add(self._model.emit, "directory-completed", directory.uri)
+
+        # directories are completed in order, parents before children,
+        # since children are registered on completion of their
+        # parent; Waiting for the model update of the last directory,
+        # from a worker thread not to block the loop, ensures that
+        # restored directories are known before the next message is
+        # consumed
+
+    def _must_preload_album_tracks(
+        self, backend: MopidyBackend, *, in_background: bool = False
+    ) -> bool:
+        """Whether album tracks must be preloaded while completing directories.
+
+        Depending on user settings, tracks are preloaded when albums
+        are completed or in background.
+
+        """
+        return backend.props.preload_album_tracks and (
+            self._settings.get_boolean("background-album-tracks-preload")
+            == in_background
+        )
+
+    def _schedule_album_tracks_preload(self, albums: Sequence[AlbumModel]) -> None:
+        for album in albums:
+            if len(album.tracks) == 0:
+                self._album_tracks_to_preload[album.uri] = album.backend
+
+        if not self._album_tracks_preloading and len(self._album_tracks_to_preload):
+            LOGGER.info(
+                f"Will preload tracks of {len(self._album_tracks_to_preload)} "
+                "albums in background"
+            )
+            self._album_tracks_preloading = True
+            self.send_message(MessageType.PRELOAD_ALBUM_TRACKS)
+
+    @consume(MessageType.PRELOAD_ALBUM_TRACKS, concurrent=True)
+    async def preload_album_tracks(self, message: Message) -> None:
+        """Preload tracks of a slice of albums.
+
+        Each message handles a slice of the albums whose tracks must
+        be preloaded, then sends a message for the next slice. Since
+        those messages have a background priority, and since slices
+        wait for directory browses to finish, preloading yields to
+        interactive work. It stops on failure and is resumed on
+        reconnection.
+
+        """
+        if message.data.get("resume", False):
+            if self._album_tracks_preloading or len(self._album_tracks_to_preload) == 0:
+                return
+
+            LOGGER.info("Resuming preload of album tracks")
+            self._album_tracks_preloading = True
+
+        ongoing_browses = [
+            task
+            for task in self._tasks.values()
+            if task is not None and not task.done()
+        ]
+        if len(ongoing_browses) > 0:
+            await asyncio.wait(ongoing_browses)
+
+        if len(self._album_tracks_to_preload) == 0:
+            LOGGER.info("Preload of album tracks done")
+            self._album_tracks_preloading = False
+            self._model.sort_albums(self._settings.get_string("album-sort"))
+            # artist names, dates, etc. are known now
+            return
+
+        backend = next(iter(self._album_tracks_to_preload.values()))
+        call_size_policy = self._call_size_tuner.get_policy(
+            backend.props.name, "lookup_library", default_size=backend.props.call_size
+        )
+        album_uris = [
+            uri
+            for uri, album_backend in self._album_tracks_to_preload.items()
+            if album_backend == backend
+        ][: call_size_policy.size]
+
+        tracks_dto = await call_by_slice(
+            partial(
+                self.schedule_library_call,
+                f"preload@{backend.props.name}",
+                backend,
+                self._http.lookup_library,
+                low_priority=True,
+            ),
+            params=album_uris,
+            call_size_policy=call_size_policy,
+        )
+        if len(tracks_dto) == 0:
+            LOGGER.info("Preload of album tracks interrupted")
+            self._album_tracks_preloading = False
+            return
+
+        length_acc = LengthAcc()
+        metadata_collector = AlbumMetadataCollector()
+        parsed_tracks = parse_tracks(
+            tracks_dto, visitors=[length_acc, metadata_collector]
+        )
+        for album_uri in album_uris:
+            del self._album_tracks_to_preload[album_uri]
+
+            album_parsed_tracks = parsed_tracks.get(album_uri, [])
+            if len(album_parsed_tracks) == 0:
+                continue
+
+            album_parsed_tracks.sort(key=attrgetter("disc_no", "track_no"))
+            self._model.complete_album_description(
+                album_uri,
+                artist_name=metadata_collector.artist_name(album_uri),
+                num_tracks=metadata_collector.num_tracks(album_uri),
+                num_discs=metadata_collector.num_discs(album_uri),
+                date=metadata_collector.date(album_uri),
+                last_modified=metadata_collector.last_modified(album_uri),
+                length=length_acc.length[album_uri],
+                tracks=album_parsed_tracks,
+            )
+
+        self.send_message(MessageType.PRELOAD_ALBUM_TRACKS)
+
     def _get_backend(self, uri: str | None) -> MopidyBackend | None:
         for backend in self._model.backends:
             if backend.is_responsible_for(uri):
@@ -121,6 +475,27 @@ class LibraryController(ControllerBase):
         LOGGER.warning(f"No backend found that supports URI {uri!r}")
         return None
 
+    def _is_expired(self, directory_uri: str) -> bool:
+        """Whether a completed directory must be revalidated.
+
+        Directories expire once the cache TTL of their backend has
+        elapsed since their last synchronization.
+
+        """
+        if directory_uri == "" or directory_uri not in self._synced_at:
+            return False
+
+        backend = self._get_backend(directory_uri)
+        if backend is None or backend.props.cache_ttl == 0:
+            return False
+
+        elapsed = time.time() - self._synced_at[directory_uri]
+        if elapsed < backend.props.cache_ttl:
+            return False
+
+        directory = self._model.get_directory(directory_uri)
+        return directory is not None and directory.is_complete()
+
     async def _preload_library(self) -> None:
         default_uri = self._model.library.props.default_uri
         if default_uri != MOPIDY_LOCAL_ALBUMS_URI:
@@ -139,6 +514,14 @@ class LibraryController(ControllerBase):
         default_uri = self._model.library.props.default_uri
         directory_uri = message.data.get("uri", default_uri)
         force = message.data.get("force", False)
+        sync = message.data.get("sync", False)
+        if sync and directory_uri not in self._synced_at:
+            # nothing to synchronize yet
+            return
+
+        revalidate = directory_uri in self._stale_directory_uris or self._is_expired(
+            directory_uri
+        )
 
         task = self._tasks.get(directory_uri)
         if task is not None:
@@ -158,7 +541,16 @@ class LibraryController(ControllerBase):
 
         async def browse_and_notify() -> None:
             try:
-                await self._browse_directory(directory_uri, force=force)
+                if revalidate:
+                    GLib.idle_add(
+                        self._model.emit, "directory-completed", directory_uri
+                    )
+                    # content restored from the snapshot, partial or
+                    # expired is displayed while being revalidated
+
+                await self._browse_directory(
+                    directory_uri, force=force or revalidate or sync
+                )
                 GLib.idle_add(self._model.emit, "directory-completed", directory_uri)
             except asyncio.CancelledError:
                 LOGGER.debug(f"Cancel of task {task_name!r}")
@@ -218,7 +610,46 @@ class LibraryController(ControllerBase):
             assert backend is None
             LOGGER.info(f"Browsing directory {directory.name!r}")
 
-        refs_dto = await self._http.browse_library(directory_uri)
+        known_albums: dict[str, AlbumModel] = {}
+        known_tracks: dict[str, TrackModel] = {}
+        if backend is not None and backend.props.static_albums:
+            known_albums = {
+                album.uri: album
+                for album in directory.albums
+                if not self._must_preload_album_tracks(backend) or len(album.tracks) > 0
+            }
+            known_tracks = {track.uri: track for track in directory.tracks}
+        # models of static backends are reused when a directory is
+        # completed again, only new references are looked up
+
+        sync_started_at = time.time()
+        refs_dto: list[RefDTO] | None = None
+        if directory_uri == MOPIDY_LOCAL_ALBUMS_URI and len(known_albums) > 0:
+            updated_album_dtos = await self._find_updated_local_albums(
+                directory_uri, backend
+            )
+            if updated_album_dtos is None:
+                LOGGER.info(f"Full synchronization of directory {directory.name!r}")
+                known_albums = {}
+            else:
+                LOGGER.info(
+                    f"Found {len(updated_album_dtos)} albums updated since "
+                    f"last synchronization of directory {directory.name!r}"
+                )
+                for album_dto in updated_album_dtos:
+                    known_albums.pop(album_dto.uri, None)
+                refs_dto = updated_album_dtos + [
+                    RefDTO(type=RefType.ALBUM, uri=album.uri, name=album.name)
+                    for album in known_albums.values()
+                ]
+            # the full browse of the directory is skipped when updated
+            # albums are found, albums removed from the server are
+            # then dropped by the next full synchronization
+
+        if refs_dto is None:
+            refs_dto = await self.schedule_library_call(
+                directory_uri, backend, self._http.browse_library, directory_uri
+            )
         if refs_dto is None:
             LOGGER.warning("Failed to browse directory!")
             return
@@ -253,27 +684,59 @@ class LibraryController(ControllerBase):
             else:
                 LOGGER.debug(f"Unsupported type {ref_dto.type.name!r}")
 
+        albums, album_dtos = _split_known_refs(album_dtos, known_albums)
+        tracks, track_dtos = _split_known_refs(track_dtos, known_tracks)
+        if len(albums) > 0 or len(tracks) > 0:
+            LOGGER.debug(
+                f"Reusing {len(albums)} albums and {len(tracks)} tracks "
+                f"of directory {directory.name!r}"
+            )
+
         notifier = DirectoryCompletionProgressNotifier(
             self._model,
             directory_uri=directory_uri,
             step_count=len(album_dtos) + len(track_dtos),
         )
 
-        albums: list[AlbumModel] = []
+        on_albums: Callable[[list[AlbumModel]], None] | None = None
+        if not directory.is_complete():
+            on_albums = partial(self._publish_albums, directory_uri)
+        # albums are published while the directory is being completed,
+        # unless it's already complete since its content would then be
+        # mixed with outdated albums
+
+        completions: list[Coroutine[Any, Any, list[Any]]] = []
         if backend is not None and len(album_dtos) > 0:
-            albums = await self._complete_albums(
-                album_dtos, directory_uri, backend, notifier=notifier
+            completions.append(
+                self._complete_albums(
+                    album_dtos,
+                    directory_uri,
+                    backend,
+                    notifier=notifier.split(),
+                    on_albums=on_albums,
+                )
             )
+        else:
+            completions.append(_nothing())
 
-        subdirs: list[DirectoryModel] = []
         if len(subdir_dtos) > 0:
-            subdirs = await self._complete_subdirs(subdir_dtos, directory_uri)
+            completions.append(self._complete_subdirs(subdir_dtos, directory, backend))
+        else:
+            completions.append(_nothing())
 
-        tracks: list[TrackModel] = []
         if backend is not None and len(track_dtos) > 0:
-            tracks = await self._complete_tracks(
-                track_dtos, directory_uri, backend, notifier=notifier
+            completions.append(
+                self._complete_tracks(
+                    track_dtos, directory_uri, backend, notifier=notifier.split()
+                )
             )
+        else:
+            completions.append(_nothing())
+
+        new_albums, subdirs, new_tracks = await asyncio.gather(*completions)
+        albums += new_albums
+        tracks += new_tracks
+        # albums, sub-directories and tracks are completed concurrently
 
         playlists: list[PlaylistModel] = []
 
@@ -285,6 +748,53 @@ class LibraryController(ControllerBase):
             tracks=tracks,
             wait_for_model_update=wait_for_model_update,
         )
+        self._stale_directory_uris.discard(directory_uri)
+        self._partially_published_uris.discard(directory_uri)
+        self._synced_at[directory_uri] = sync_started_at
+
+        if backend is not None and self._must_preload_album_tracks(
+            backend, in_background=True
+        ):
+            self._schedule_album_tracks_preload(albums)
+
+    def _publish_albums(self, directory_uri: str, albums: list[AlbumModel]) -> None:
+        self._partially_published_uris.add(directory_uri)
+        self._model.extend_directory(directory_uri, albums)
+
+    async def _find_updated_local_albums(
+        self, directory_uri: str, backend: MopidyBackend | None
+    ) -> list[RefDTO] | None:
+        """Find Mopidy-Local albums updated since last synchronization.
+
+        Mopidy-Local directories of recent updates are browsed, the
+        smallest one covering the time elapsed since last
+        synchronization is used.
+
+        Returns:
+            References to updated albums, ``None`` when a full
+            synchronization is required.
+
+        """
+        synced_at = self._synced_at.get(directory_uri)
+        if synced_at is None:
+            return None
+
+        elapsed = time.time() - synced_at
+        max_age = next((a for a in _LOCAL_UPDATES_MAX_AGES if elapsed < a), None)
+        if max_age is None:
+            LOGGER.debug("Last synchronization is older than updates directories")
+            return None
+
+        refs_dto = await self.schedule_library_call(
+            directory_uri,
+            backend,
+            self._http.browse_library,
+            f"local:directory?max-age={max_age}&type=album",
+        )
+        if refs_dto is None:
+            return None
+
+        return [ref for ref in refs_dto if ref.type == RefType.ALBUM]
 
     async def _complete_albums(
         self,
@@ -293,7 +803,18 @@ class LibraryController(ControllerBase):
         backend: MopidyBackend,
         *,
         notifier: ProgressNotifierProtocol | None,
+        on_albums: Callable[[list[AlbumModel]], None] | None = None,
     ) -> list[AlbumModel]:
+        """Complete albums.
+
+        Albums are completed by slices: The URIs of the images of
+        albums are fetched concurrently with their tracks (when album
+        tracks are preloaded), each by slices of their own. Albums are
+        built and passed to ``on_albums`` as soon as their images and
+        tracks are known, thus first albums are published after a
+        single slice.
+
+        """
         LOGGER.info(
             f"Completing {len(album_dtos)} albums "
             f"for directory with URI {directory_uri!r}"
@@ -301,46 +822,21 @@ class LibraryController(ControllerBase):
 
         album_uris = [dto.uri for dto in album_dtos]
 
-        images = await call_by_slice(
-            self._http.get_images,
-            params=album_uris,
-        )
-        if images is None:
-            LOGGER.warning("Failed to fetch URIs of images")
-
+        images: dict[str, Any] = {}
         length_acc = LengthAcc()
         metadata_collector = AlbumMetadataCollector()
-        parsed_tracks: dict[str, list[TrackModel]] = {}
-        if backend.props.preload_album_tracks:
-            LOGGER.debug("Fetching albums tracks")
-            directory_tracks_dto = await call_by_slice(
-                self._http.lookup_library,
-                params=album_uris,
-                notifier=notifier,
-            )
-
-            LOGGER.debug("Parsing albums tracks")
-            parsed_tracks = parse_tracks(
-                directory_tracks_dto, visitors=[length_acc, metadata_collector]
-            )
 
-        parsed_albums: list[AlbumModel] = []
-        for album_dto in album_dtos:
+        def build_album(album_dto: RefDTO, tracks: list[TrackModel]) -> AlbumModel:
             album_uri = album_dto.uri
 
-            if (
-                images is not None
-                and album_uri in images
-                and len(images[album_uri]) > 0
-            ):
+            if len(images.get(album_uri, [])) > 0:
                 image_uri = images[album_uri][0].uri
                 filepath = self._download.get_image_filepath(image_uri)
             else:
                 image_uri = ""
                 filepath = None
 
-            album_parsed_tracks = parsed_tracks.get(album_uri, [])
-            album_parsed_tracks.sort(key=attrgetter("disc_no", "track_no"))
+            tracks.sort(key=attrgetter("disc_no", "track_no"))
 
             album_name = album_dto.name
             artist_name = metadata_collector.artist_name(album_uri)
@@ -350,7 +846,7 @@ class LibraryController(ControllerBase):
                         album_dto.name
                     )
 
-            album = AlbumModel(
+            return AlbumModel(
                 backend=backend,
                 uri=album_uri,
                 name=album_name,
@@ -363,38 +859,166 @@ class LibraryController(ControllerBase):
                 last_modified=metadata_collector.last_modified(album_uri),
                 length=length_acc.length[album_uri],
                 release_mbid=metadata_collector.release_mbid(album_uri),
-                tracks=album_parsed_tracks,
+                tracks=tracks,
+            )
+
+        album_dtos_by_uri = {dto.uri: dto for dto in album_dtos}
+        built_albums: dict[str, AlbumModel] = {}
+
+        def publish_albums(tracks: dict[str, list[TrackModel]]) -> None:
+            albums = [
+                build_album(album_dtos_by_uri[album_uri], album_tracks)
+                for album_uri, album_tracks in tracks.items()
+                if album_uri in album_dtos_by_uri and album_uri not in built_albums
+            ]
+            built_albums.update((album.uri, album) for album in albums)
+            if on_albums is not None and len(albums) > 0:
+                on_albums(albums)
+
+        get_images = partial(
+            self.schedule_library_call, directory_uri, backend, self._http.get_images
+        )
+
+        async def fetch_images(uris: list[str]) -> dict[str, Any] | None:
+            images_dto = await get_images(uris)
+            if images_dto is None:
+                LOGGER.warning("Failed to fetch URIs of images")
+                return None
+
+            return {uri: images_dto.get(uri, []) for uri in uris}
+
+        fetch_images_by_slice = partial(
+            call_by_slice,
+            fetch_images,
+            params=album_uris,
+            call_size_policy=self._call_size_tuner.get_policy(
+                backend.props.name, "get_images", default_size=backend.props.call_size
+            ),
+            max_concurrency=backend.props.max_concurrency,
+        )
+
+        if not self._must_preload_album_tracks(backend):
+            LOGGER.debug("Fetching albums images")
+
+            def on_images(images_dto: dict[str, Any]) -> None:
+                images.update(images_dto)
+                publish_albums({uri: [] for uri in images_dto})
+
+            await fetch_images_by_slice(notifier=notifier, on_result=on_images)
+        else:
+            LOGGER.debug("Fetching albums images and tracks")
+
+            # images and tracks are fetched independently, a failure to
+            # fetch some images doesn't prevent the lookup of following
+            # albums and conversely; Albums are published once both
+            # their images and tracks are fetched, or once fetching
+            # images is over
+            pending_tracks: dict[str, list[TrackModel]] = {}
+            images_fetched = False
+
+            def publish_fetched_albums() -> None:
+                fetched_tracks = {
+                    uri: tracks
+                    for uri, tracks in pending_tracks.items()
+                    if images_fetched or uri in images
+                }
+                for uri in fetched_tracks:
+                    del pending_tracks[uri]
+                publish_albums(fetched_tracks)
+
+            def on_images_fetched(images_dto: dict[str, Any]) -> None:
+                images.update(images_dto)
+                publish_fetched_albums()
+
+            def on_tracks_fetched(tracks_dto: dict[str, Any]) -> None:
+                parsed_tracks = parse_tracks(
+                    tracks_dto, visitors=[length_acc, metadata_collector]
+                )
+                pending_tracks.update((uri, parsed_tracks[uri]) for uri in tracks_dto)
+                publish_fetched_albums()
+
+            async def fetch_all_images() -> None:
+                nonlocal images_fetched
+                await fetch_images_by_slice(on_result=on_images_fetched)
+                images_fetched = True
+                publish_fetched_albums()
+
+            await asyncio.gather(
+                fetch_all_images(),
+                call_by_slice(
+                    partial(
+                        self.schedule_library_call,
+                        directory_uri,
+                        backend,
+                        self._http.lookup_library,
+                    ),
+                    params=album_uris,
+                    call_size_policy=self._call_size_tuner.get_policy(
+                        backend.props.name,
+                        "lookup_library",
+                        default_size=backend.props.call_size,
+                    ),
+                    max_concurrency=backend.props.max_concurrency,
+                    notifier=notifier,
+                    on_result=on_tracks_fetched,
+                ),
             )
-            parsed_albums.append(album)
 
-        return parsed_albums
+        return [
+            built_albums.get(album_dto.uri) or build_album(album_dto, [])
+            for album_dto in album_dtos
+        ]
 
     async def _complete_subdirs(
-        self, subdir_dtos: Sequence[RefDTO], directory_uri: str
+        self,
+        subdir_dtos: Sequence[RefDTO],
+        directory: DirectoryModel,
+        backend: MopidyBackend | None,
     ) -> list[DirectoryModel]:
         LOGGER.info(
             f"Completing {len(subdir_dtos)} sub-directories of directory "
-            f"with URI {directory_uri!r}"
+            f"with URI {directory.uri!r}"
         )
 
-        subdir_uris = [dto.uri for dto in subdir_dtos]
+        known_subdirs = {subdir.uri: subdir for subdir in directory.directories}
+        # known sub-directories are kept with their content, otherwise
+        # completing a directory would drop the content of its
+        # sub-directories
+
+        subdirs: list[DirectoryModel] = []
+        new_subdir_dtos: list[RefDTO] = []
+        for subdir_dto in subdir_dtos:
+            known_subdir = known_subdirs.get(subdir_dto.uri)
+            if known_subdir is not None:
+                subdirs.append(known_subdir)
+            else:
+                new_subdir_dtos.append(subdir_dto)
+
+        if len(new_subdir_dtos) == 0:
+            return subdirs
+
+        subdir_uris = [dto.uri for dto in new_subdir_dtos]
 
         images = await call_by_slice(
-            self._http.get_images,
+            partial(
+                self.schedule_library_call,
+                directory.uri,
+                backend,
+                self._http.get_images,
+            ),
             params=subdir_uris,
+            call_size=backend.props.call_size if backend is not None else None,
+            max_concurrency=(
+                backend.props.max_concurrency
+                if backend is not None
+                else _MAX_CONCURRENT_CALLS
+            ),
         )
-        if images is None:
-            LOGGER.warning("Failed to fetch URIs of images")
 
-        subdirs: list[DirectoryModel] = []
-        for subdir_dto in subdir_dtos:
+        for subdir_dto in new_subdir_dtos:
             subdir_uri = subdir_dto.uri
 
-            if (
-                images is not None
-                and subdir_uri in images
-                and len(images[subdir_uri]) > 0
-            ):
+            if len(images.get(subdir_uri, [])) > 0:
                 image_uri = images[subdir_uri][0].uri
                 filepath = self._download.get_image_filepath(image_uri)
             else:
@@ -426,27 +1050,47 @@ class LibraryController(ControllerBase):
 
         track_uris = [dto.uri for dto in track_dtos]
 
-        LOGGER.debug("Fetching tracks")
-        directory_tracks_dto = await call_by_slice(
-            self._http.lookup_library,
-            params=track_uris,
-            notifier=notifier,
-        )
-
-        track_uris = [dto.uri for dto in track_dtos]
-        images = await call_by_slice(
-            self._http.get_images,
-            params=track_uris,
+        LOGGER.debug("Fetching tracks and their images")
+        directory_tracks_dto, images = await asyncio.gather(
+            call_by_slice(
+                partial(
+                    self.schedule_library_call,
+                    directory_uri,
+                    backend,
+                    self._http.lookup_library,
+                ),
+                params=track_uris,
+                call_size_policy=self._call_size_tuner.get_policy(
+                    backend.props.name,
+                    "lookup_library",
+                    default_size=backend.props.call_size,
+                ),
+                max_concurrency=backend.props.max_concurrency,
+                notifier=notifier,
+            ),
+            call_by_slice(
+                partial(
+                    self.schedule_library_call,
+                    directory_uri,
+                    backend,
+                    self._http.get_images,
+                ),
+                params=track_uris,
+                call_size_policy=self._call_size_tuner.get_policy(
+                    backend.props.name,
+                    "get_images",
+                    default_size=backend.props.call_size,
+                ),
+                max_concurrency=backend.props.max_concurrency,
+            ),
         )
-        if images is None:
-            LOGGER.warning("Failed to fetch URIs of images")
 
         LOGGER.debug("Parsing tracks")
         parsed_tracks: list[TrackModel] = []
         for tracks in parse_tracks(directory_tracks_dto).values():
             for track in tracks:
                 track_uri = track.uri
-                if images is not None and len(images.get(track_uri, [])) > 0:
+                if len(images.get(track_uri, [])) > 0:
                     image_uri = images[track_uri][0].uri
                     track.props.image_uri = image_uri
                     track.props.image_path = self._download.get_image_filepath(
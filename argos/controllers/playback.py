@@ -1,3 +1,4 @@
+import asyncio
 import gettext
 import logging
 from typing import TYPE_CHECKING, cast
@@ -51,11 +52,15 @@ class PlaybackController(ControllerBase):
     @consume(MessageType.IDENTIFY_PLAYING_STATE)
     async def identify_playing_state(self, message: Message) -> None:
         LOGGER.debug("Identifying playing state...")
-        raw_state = await self._http.get_state()
+        async with self._http.batch():
+            raw_state, time_position = await asyncio.gather(
+                self._http.get_state(),
+                self._http.get_time_position(),
+            )
+
         if raw_state is not None:
             self._model.playback.set_state(raw_state)
 
-        time_position = await self._http.get_time_position()
         if time_position is not None:
             self._model.playback.set_time_position(time_position)
 
@@ -130,7 +135,7 @@ class PlaybackController(ControllerBase):
         time_position = cast(int, message.data.get("time_position"))
         self._model.playback.set_time_position(time_position)
 
-    @consume(MessageType.FETCH_TRACK_IMAGE)
+    @consume(MessageType.FETCH_TRACK_IMAGE, concurrent=True, key="track_uri")
     async def fetch_track_image(self, message: Message) -> None:
         track_uri = message.data.get("track_uri")
         if not track_uri or self._model.get_current_tl_track_uri() != track_uri:
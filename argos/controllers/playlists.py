@@ -108,7 +108,7 @@ class PlaylistsController(ControllerBase):
 
         LOGGER.debug(f"Playlist with URI {playlist_dto.uri!r} created")
 
-    @consume(MessageType.SAVE_PLAYLIST)
+    @consume(MessageType.SAVE_PLAYLIST, concurrent=True, key="uri")
     async def save_playlist(self, message: Message) -> None:
         name = message.data.get("name")
         playlist_uri = message.data.get("uri", "")
@@ -124,7 +124,7 @@ class PlaylistsController(ControllerBase):
             # happens when name is changed
             self._model.delete_playlist(playlist_uri)
 
-    @consume(MessageType.DELETE_PLAYLIST)
+    @consume(MessageType.DELETE_PLAYLIST, concurrent=True, key="uri")
     async def delete_playlist(self, message: Message) -> None:
         playlist_uri = message.data.get("uri", "")
         await self._http.delete_playlist(playlist_uri)
@@ -174,7 +174,7 @@ class PlaylistsController(ControllerBase):
         playlist_dto = await self._http.save_playlist(updated_playlist)
         return playlist_dto
 
-    @consume(MessageType.COMPLETE_PLAYLIST_DESCRIPTION)
+    @consume(MessageType.COMPLETE_PLAYLIST_DESCRIPTION, concurrent=True, key="uri")
     async def complete_playlist(self, message: Message) -> None:
         playlist_uri = message.data.get("uri")
         if playlist_uri is None:
@@ -15,6 +15,23 @@ class DirectoryCompletionProgressNotifier:
         self._signal_name = "directory-completion-progress"
         self._directory_uri = directory_uri
         self._step_count = step_count
+        self._part_steps: list[int] = []
+
+    def split(self) -> ProgressNotifierProtocol:
+        """Return a notifier of a part of the completion.
+
+        Parts can progress concurrently, the notified step is the sum
+        of the steps of all parts.
+
+        """
+        index = len(self._part_steps)
+        self._part_steps.append(0)
+
+        def notify(step: int) -> None:
+            self._part_steps[index] = step
+            self(sum(self._part_steps))
+
+        return notify
 
     def __call__(self, step: int) -> None:
         GLib.idle_add(
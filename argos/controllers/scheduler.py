@@ -0,0 +1,191 @@
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Coroutine, Sequence, TypeVar
+
+LOGGER = logging.getLogger(__name__)
+
+MAX_IN_FLIGHT_LIBRARY_CALLS = 8
+# Budget of library calls in flight at once, all directories included
+
+T = TypeVar("T")
+
+
+class LibraryWorkScheduler:
+    """Share a budget of in-flight library calls between directories.
+
+    Calls wait for a slot when the budget is exhausted. When a slot is
+    released, it's granted to a call waiting for the first prioritized
+    key (the album or directory displayed by the user interface) with
+    waiting calls if any, otherwise keys with waiting calls are served
+    in turn.
+
+    Low priority calls (e.g. background preloads) are only granted a
+    slot when no other call is waiting.
+
+    Calls may also belong to a group (a backend) with its own budget;
+    Calls exceeding the budget of their group wait without holding a
+    slot, thus a slow group can't exhaust the shared budget.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        budget: int = MAX_IN_FLIGHT_LIBRARY_CALLS,
+        get_prioritized_keys: Callable[[], Sequence[str]] = lambda: (),
+    ):
+        self._budget = max(1, budget)
+        self._get_prioritized_keys = get_prioritized_keys
+        self._in_flight = 0
+        self._waiters: dict[str, deque[asyncio.Future]] = {}
+        # waiting calls by key (a directory or album URI), keys are
+        # ordered by their next turn
+        self._low_priority_waiters: dict[str, deque[asyncio.Future]] = {}
+        self._group_semaphores: dict[str, tuple[int, asyncio.Semaphore]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return sum(
+            len(waiters)
+            for all_waiters in (self._waiters, self._low_priority_waiters)
+            for waiters in all_waiters.values()
+        )
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self,
+        key: str,
+        *,
+        group: str | None = None,
+        group_budget: int | None = None,
+        low_priority: bool = False,
+    ) -> AsyncIterator[None]:
+        """Hold a slot of the budget on behalf of ``key``, a directory or album URI.
+
+        When ``group`` is given, at most ``group_budget`` slots are
+        held at once by calls of that group.
+
+        """
+        async with self._get_group_semaphore(group, group_budget):
+            await self._acquire(key, low_priority=low_priority)
+            try:
+                yield
+            finally:
+                self._release()
+
+    def wrap(
+        self,
+        key: str,
+        func: Callable[[T], Coroutine[Any, Any, Any]],
+        *,
+        group: str | None = None,
+        group_budget: int | None = None,
+        low_priority: bool = False,
+    ) -> Callable[[T], Coroutine[Any, Any, Any]]:
+        """Wrap a coroutine function so that each call holds a slot."""
+
+        async def call(params: T) -> Any:
+            async with self.slot(
+                key,
+                group=group,
+                group_budget=group_budget,
+                low_priority=low_priority,
+            ):
+                return await func(params)
+
+        return call
+
+    def _get_group_semaphore(
+        self, group: str | None, group_budget: int | None
+    ) -> contextlib.AbstractAsyncContextManager:
+        if group is None or group_budget is None:
+            return contextlib.nullcontext()
+
+        group_budget = max(1, group_budget)
+        budget, semaphore = self._group_semaphores.get(group, (None, None))
+        if semaphore is None or budget != group_budget:
+            semaphore = asyncio.Semaphore(group_budget)
+            self._group_semaphores[group] = (group_budget, semaphore)
+            # calls holding a slot of a previous semaphore release it
+            # anyway
+
+        return semaphore
+
+    async def _acquire(self, key: str, *, low_priority: bool = False) -> None:
+        if (
+            self._in_flight < self._budget
+            and len(self._waiters) == 0
+            and len(self._low_priority_waiters) == 0
+        ):
+            self._in_flight += 1
+            return
+
+        all_waiters = self._low_priority_waiters if low_priority else self._waiters
+        future = asyncio.get_running_loop().create_future()
+        all_waiters.setdefault(key, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # slot granted before cancellation
+                self._release()
+            else:
+                self._forget_waiter(all_waiters, key, future)
+            raise
+
+    def _forget_waiter(
+        self,
+        all_waiters: dict[str, deque[asyncio.Future]],
+        key: str,
+        future: asyncio.Future,
+    ) -> None:
+        waiters = all_waiters.get(key)
+        if waiters is None:
+            return
+
+        try:
+            waiters.remove(future)
+        except ValueError:
+            pass
+
+        if len(waiters) == 0:
+            del all_waiters[key]
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        while self._in_flight < self._budget:
+            future = self._next_waiter()
+            if future is None:
+                break
+            elif future.done():
+                # cancelled, the waiting task will forget it
+                continue
+
+            self._in_flight += 1
+            future.set_result(None)
+
+    def _next_waiter(self) -> asyncio.Future | None:
+        all_waiters = (
+            self._waiters if len(self._waiters) > 0 else self._low_priority_waiters
+        )
+
+        key = next(
+            (k for k in self._get_prioritized_keys() if k in all_waiters),
+            next(iter(all_waiters), None),
+        )
+        if key is None:
+            return None
+
+        waiters = all_waiters.pop(key)
+        future = waiters.popleft()
+        if len(waiters) > 0:
+            all_waiters[key] = waiters
+            # next turn of this key comes after other keys
+
+        return future
@@ -1,3 +1,4 @@
+import asyncio
 import gettext
 import logging
 from typing import TYPE_CHECKING, cast
@@ -31,19 +32,23 @@ class TracklistController(ControllerBase):
         MessageType.OPTIONS_CHANGED,
     )
     async def get_options(self, message: Message) -> None:
-        consume = await self._http.get_consume()
+        async with self._http.batch():
+            consume, random, repeat, single = await asyncio.gather(
+                self._http.get_consume(),
+                self._http.get_random(),
+                self._http.get_repeat(),
+                self._http.get_single(),
+            )
+
         if consume is not None:
             self._model.tracklist.set_consume(consume)
 
-        random = await self._http.get_random()
         if random is not None:
             self._model.tracklist.set_random(random)
 
-        repeat = await self._http.get_repeat()
         if repeat is not None:
             self._model.tracklist.set_repeat(repeat)
 
-        single = await self._http.get_single()
         if single is not None:
             self._model.tracklist.set_single(single)
 
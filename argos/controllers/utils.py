@@ -1,14 +1,26 @@
+import asyncio
 import logging
+import time
 from collections import defaultdict
 from typing import Any, Callable, Coroutine, Mapping, Sequence
 
+from argos.controllers.callsize import DEFAULT_CALL_SIZE, CallSizePolicy
 from argos.controllers.progress import ProgressNotifierProtocol
 from argos.dto import TrackDTO
 from argos.model import TrackModel
 
 LOGGER = logging.getLogger(__name__)
 
-_CALL_SIZE = 20
+_CALL_SIZE = DEFAULT_CALL_SIZE
+
+
+async def _timed_call(
+    func: Callable[[list[str]], Coroutine[Any, Any, dict[str, Any] | None]],
+    params: list[str],
+) -> tuple[dict[str, Any] | None, float]:
+    start = time.monotonic()
+    result = await func(params)
+    return result, time.monotonic() - start
 
 
 async def call_by_slice(
@@ -16,13 +28,21 @@ async def call_by_slice(
     *,
     params: list[str],
     call_size: int | None = None,
+    call_size_policy: CallSizePolicy | None = None,
+    max_concurrency: int = 1,
     notifier: ProgressNotifierProtocol | None = None,
+    on_result: Callable[[dict[str, Any]], None] | None = None,
 ) -> dict[str, Any]:
-    """Make multiple synchronous calls.
+    """Make multiple calls.
 
     The argument ``params`` is split in slices of bounded
     length. There's one ``func`` call per slice.
 
+    At most ``max_concurrency`` calls are in flight at once, thus
+    calls are pipelined when it's greater than one. Results are
+    merged in the order of slices, and no result of a slice following
+    a slice whose call returns ``None`` is merged.
+
     Args:
         func: Callable that will be called.
 
@@ -30,25 +50,88 @@ async def call_by_slice(
 
         call_size: Number of parameters to handle through each call.
 
+        call_size_policy: Policy defining the number of parameters to
+            handle through each call, and fed with call measures;
+            Overrides ``call_size``.
+
+        max_concurrency: Maximal number of concurrent calls.
+
         notifier: Progress notifier to call on each iteration
 
+        on_result: Callable called with the result of each slice, in
+            the order of slices, as soon as the results of all
+            previous slices are known; Results that won't be merged
+            aren't passed.
+
     Returns:
         Dictionary merging all calls return values.
 
     """
     call_size = call_size if call_size is not None and call_size > 0 else _CALL_SIZE
-    call_count = len(params) // call_size + (0 if len(params) % call_size == 0 else 1)
-    result: dict[str, Any] = {}
+    max_concurrency = max(1, max_concurrency)
+
+    results: list[dict[str, Any] | None] = []
+    pending: dict[asyncio.Task, tuple[int, int]] = {}
+    offset = 0
+    stop_index: int | None = None
+    published_count = 0
     step = 0
-    for i in range(call_count):
-        params_slice = params[i * call_size : (i + 1) * call_size]
-        ith_result = await func(params_slice)
-        if notifier is not None:
-            step += len(params_slice)
-            notifier(step)
-        if ith_result is None:
-            break
-        result.update(ith_result)
+    try:
+        while (stop_index is None and offset < len(params)) or len(pending) > 0:
+            while (
+                stop_index is None
+                and offset < len(params)
+                and len(pending) < max_concurrency
+            ):
+                size = (
+                    call_size_policy.size if call_size_policy is not None else call_size
+                )
+                params_slice = params[offset : offset + size]
+                offset += len(params_slice)
+                task = asyncio.ensure_future(_timed_call(func, params_slice))
+                pending[task] = (len(results), len(params_slice))
+                results.append(None)
+
+            done, _ = await asyncio.wait(
+                pending.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=lambda t: pending[t][0]):
+                i, slice_length = pending.pop(task)
+                ith_result, duration = task.result()
+                if call_size_policy is not None:
+                    call_size_policy.record(slice_length, duration, ith_result)
+                if notifier is not None:
+                    step += slice_length
+                    notifier(step)
+                if ith_result is None:
+                    stop_index = i if stop_index is None else min(stop_index, i)
+                else:
+                    results[i] = ith_result
+
+            if on_result is not None:
+                while published_count < len(results) and (
+                    stop_index is None or published_count < stop_index
+                ):
+                    published_result = results[published_count]
+                    if published_result is None:
+                        break
+
+                    on_result(published_result)
+                    published_count += 1
+
+            if stop_index is not None:
+                for task, (i, _) in list(pending.items()):
+                    if i > stop_index:
+                        task.cancel()
+                        del pending[task]
+    finally:
+        for task in pending:
+            task.cancel()
+
+    result: dict[str, Any] = {}
+    for ith_result in results[:stop_index]:
+        if ith_result is not None:
+            result.update(ith_result)
     return result
 
 
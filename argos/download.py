@@ -3,7 +3,7 @@ import logging
 import urllib.parse
 from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Collection
 
 import aiohttp
 import xdg.BaseDirectory  # type: ignore
@@ -48,7 +48,11 @@ class ImageDownloader(GObject.GObject):
         settings.connect("changed::mopidy-base-url", self._on_mopidy_base_url_changed)
 
         self._image_dir = Path(xdg.BaseDirectory.save_cache_path("argos/images"))
-        self._ongoing_task: asyncio.Task[None] | None = None
+        self._ongoing_tasks: dict[asyncio.Task[None], tuple[str | None, list[str]]] = {}
+        # ongoing tasks with the URI of the directory they download
+        # images for, if any, and the URIs of their images
+        self._pending_image_uris: set[str] = set()
+        # URIs of images being downloaded by ongoing tasks
 
     def get_image_filepath(self, image_uri: str | None) -> Path | None:
         if image_uri == "" or image_uri is None:
@@ -137,19 +141,33 @@ class ImageDownloader(GObject.GObject):
             except OSError as err:
                 LOGGER.error(f"Failed to write image file {str(filepath)!r}, {err}")
                 return False
+            except asyncio.CancelledError:
+                LOGGER.debug(f"Removing partially written image {str(filepath)!r}")
+                filepath.unlink(missing_ok=True)
+                raise
         return True
 
-    async def fetch_images(self, image_uris: list[str]) -> None:
+    async def fetch_images(
+        self, image_uris: list[str], *, directory_uri: str | None = None
+    ) -> None:
         """Fetch multiple image files and notify.
 
         The notification consists in emitting the ``images-downloaded`` signal. Note
         that the notification is emitted even after some downloads fail.
 
         An image availability must be done by checking that the corresponding file
-        exists (See ``get_image_filepath()``)."""
+        exists (See ``get_image_filepath()``).
+
+        Images already being downloaded by a previous call aren't
+        requested again; Downloads of images of a directory, given by
+        ``directory_uri``, are cancelled through
+        ``cancel_downloads()``, e.g. when the user navigates away."""
         to_download: dict[str, Path] = {}
 
         for image_uri in image_uris:
+            if image_uri in self._pending_image_uris:
+                continue
+
             filepath = self.get_image_filepath(image_uri)
             if not filepath:
                 continue
@@ -160,7 +178,15 @@ class ImageDownloader(GObject.GObject):
         LOGGER.info(f"To download vs URIs count: {len(to_download)}/{len(image_uris)}")
 
         async def download() -> None:
-            uris = list(to_download.keys())
+            await download_by_batch(list(to_download.keys()))
+            GLib.idle_add(
+                partial(
+                    self.emit,
+                    "images-downloaded",
+                )
+            )
+
+        async def download_by_batch(uris: list[str]) -> None:
             if len(uris) > 0:
                 download_count = (len(uris) // MAX_SIMULTANEOUS_DOWNLOADS) + 1
 
@@ -174,24 +200,33 @@ class ImageDownloader(GObject.GObject):
                     await asyncio.gather(*tasks)
                     LOGGER.info("Images have been downloaded")
 
-            GLib.idle_add(
-                partial(
-                    self.emit,
-                    "images-downloaded",
-                )
-            )
-
-        if self._ongoing_task:
-            if not self._ongoing_task.done() and not self._ongoing_task.cancelled():
-                LOGGER.debug("Cancelling undone download task")
-                self._ongoing_task.cancel()
-
-        self._ongoing_task = asyncio.create_task(download())
+        self._pending_image_uris.update(to_download.keys())
+        task = asyncio.create_task(download())
+        self._ongoing_tasks[task] = (directory_uri, list(to_download.keys()))
+        task.add_done_callback(self._forget_task)
         LOGGER.debug("Download task created")
 
         # A download task is created even if no image has to be downloaded, just to emit
         # the ``images-downloaded`` signal!
 
+    def cancel_downloads(self, directory_uris: Collection[str]) -> None:
+        """Cancel ongoing download tasks of images of directories.
+
+        Images already downloaded are kept, partially written ones are
+        removed."""
+        for task, (directory_uri, _) in list(self._ongoing_tasks.items()):
+            if directory_uri not in directory_uris:
+                continue
+
+            if not task.done():
+                LOGGER.debug(f"Cancelling download task of directory {directory_uri!r}")
+                task.cancel()
+            self._forget_task(task)
+
+    def _forget_task(self, task: asyncio.Task[None]) -> None:
+        _, image_uris = self._ongoing_tasks.pop(task, (None, []))
+        self._pending_image_uris.difference_update(image_uris)
+
     def _on_mopidy_base_url_changed(
         self,
         settings: Gio.Settings,
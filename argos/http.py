@@ -4,8 +4,12 @@ Fully implemented using Mopidy websocket.
 
 """
 
+import asyncio
+import contextlib
+import contextvars
+import json
 import logging
-from typing import TYPE_CHECKING, Any, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, AsyncIterator, Mapping, Sequence
 
 from gi.repository import GObject
 
@@ -14,11 +18,87 @@ if TYPE_CHECKING:
 
 from argos.dto import ImageDTO, PlaylistDTO, RefDTO, TlTrackDTO, TrackDTO, cast_seq_of
 from argos.model import PlaybackState
-from argos.ws import MopidyWSConnection
+from argos.ws import MopidyWSConnection, is_read_only_command
 
 LOGGER = logging.getLogger(__name__)
 
 
+class _CommandBatch:
+    """Group commands to be sent as a single JSON-RPC batch.
+
+    Commands added during the same iteration of the event loop are
+    sent together at the beginning of the next iteration.
+
+    """
+
+    def __init__(self, ws: MopidyWSConnection):
+        self._ws = ws
+        self._pending: list[tuple[str, dict | None, int | None, asyncio.Future]] = []
+        self._flush_scheduled = False
+        self._tasks: set[asyncio.Task] = set()
+
+    def add(
+        self, method: str, params: dict | None, timeout: int | None
+    ) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((method, params, timeout, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._start_flush)
+        return future
+
+    def _start_flush(self) -> None:
+        task = asyncio.create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        if len(pending) == 0:
+            return
+
+        timeouts = [timeout for _, _, timeout, _ in pending if timeout is not None]
+        try:
+            results = await self._ws.send_commands(
+                [(method, params) for method, params, _, _ in pending],
+                timeout=max(timeouts) if len(timeouts) > 0 else None,
+            )
+        except asyncio.CancelledError:
+            for _, _, _, future in pending:
+                future.cancel()
+            raise
+        except Exception as error:
+            # fail like commands sent outside of a batch would
+            for _, _, _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, _, _, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        await self.flush()
+        if len(self._tasks) > 0:
+            await asyncio.wait(self._tasks)
+
+
+class _InFlightCommand:
+    """A command shared by concurrent callers."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+_CURRENT_BATCH: contextvars.ContextVar[_CommandBatch | None] = contextvars.ContextVar(
+    "current_batch", default=None
+)
+
+
 class MopidyHTTPClient(GObject.GObject):
     def __init__(
         self,
@@ -28,52 +108,135 @@ class MopidyHTTPClient(GObject.GObject):
 
         self._ws: MopidyWSConnection = application.props.ws
 
+        self._in_flight: dict[tuple[str, str], _InFlightCommand] = {}
+
+    @contextlib.asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Group commands sent concurrently in JSON-RPC batches.
+
+        Commands of this client started concurrently from the context
+        (typically through ``asyncio.gather()``) are sent in a single
+        websocket frame, thus costing a single round trip::
+
+            async with http.batch():
+                state, volume = await asyncio.gather(
+                    http.get_state(), http.get_volume()
+                )
+
+        """
+        if _CURRENT_BATCH.get() is not None:
+            yield
+            return
+
+        batch = _CommandBatch(self._ws)
+        token = _CURRENT_BATCH.set(batch)
+        try:
+            yield
+        finally:
+            _CURRENT_BATCH.reset(token)
+            await batch.close()
+
+    async def _send_command(
+        self,
+        method: str,
+        **kwargs: Any,
+    ) -> Any | None:
+        """Send a command.
+
+        Concurrent calls of a read-only method with the same
+        parameters share a single command, thus a single round trip
+        to the server. The shared command is cancelled when all its
+        callers are cancelled.
+
+        """
+        if not is_read_only_command(method):
+            return await self._send_single_command(method, **kwargs)
+
+        key = (method, json.dumps(kwargs.get("params"), sort_keys=True))
+        command = self._in_flight.get(key)
+        if command is None:
+            task = asyncio.create_task(self._send_single_command(method, **kwargs))
+            command = self._in_flight[key] = _InFlightCommand(task)
+            task.add_done_callback(lambda _: self._forget_command(key, command))
+        else:
+            LOGGER.debug(f"Sharing in-flight command with method {method}")
+
+        command.waiters += 1
+        try:
+            return await asyncio.shield(command.task)
+        except asyncio.exceptions.CancelledError:
+            if command.task.cancelled():
+                raise
+
+            command.waiters -= 1
+            if command.waiters == 0:
+                self._forget_command(key, command)
+                command.task.cancel()
+            raise
+
+    def _forget_command(self, key: tuple[str, str], command: _InFlightCommand) -> None:
+        if self._in_flight.get(key) is command:
+            del self._in_flight[key]
+
+    async def _send_single_command(
+        self,
+        method: str,
+        **kwargs: Any,
+    ) -> Any | None:
+        batch = _CURRENT_BATCH.get()
+        if batch is None:
+            return await self._ws.send_command(method, **kwargs)
+
+        return await batch.add(method, kwargs.get("params"), kwargs.get("timeout"))
+
     # API of Mopidy's core.playback controller
 
     async def get_state(self) -> str | None:
-        return await self._ws.send_command("core.playback.get_state")
+        return await self._send_command("core.playback.get_state")
 
     async def pause(self) -> None:
-        await self._ws.send_command("core.playback.pause")
+        await self._send_command("core.playback.pause")
 
     async def resume(self) -> None:
-        await self._ws.send_command("core.playback.resume")
+        await self._send_command("core.playback.resume")
 
     async def play(self, tlid: int | None = None) -> None:
         params = {}
         if tlid is not None:
             params["tlid"] = tlid
 
-        await self._ws.send_command("core.playback.play", params=params)
+        await self._send_command("core.playback.play", params=params)
 
     async def seek(self, time_position: int) -> bool | None:
         params = {"time_position": time_position}
-        successful = await self._ws.send_command("core.playback.seek", params=params)
+        successful = await self._send_command("core.playback.seek", params=params)
         return bool(successful) if successful is not None else None
 
     async def previous(self) -> None:
-        await self._ws.send_command("core.playback.previous")
+        await self._send_command("core.playback.previous")
 
     async def next(self) -> None:
-        await self._ws.send_command("core.playback.next")
+        await self._send_command("core.playback.next")
 
     async def get_time_position(self) -> int | None:
-        position = await self._ws.send_command("core.playback.get_time_position")
+        position = await self._send_command("core.playback.get_time_position")
         return int(position) if position is not None else None
 
     async def get_current_tl_track(self) -> TlTrackDTO | None:
-        data = await self._ws.send_command("core.playback.get_current_tl_track")
+        data = await self._send_command("core.playback.get_current_tl_track")
         return TlTrackDTO.factory(data)
 
     # Mopidy's API of core.library controller
 
-    async def browse_library(self, uri: str | None = None) -> list[RefDTO] | None:
+    async def browse_library(
+        self, uri: str | None = None, *, timeout: int = 60
+    ) -> list[RefDTO] | None:
         if uri == "":
             uri = None
             # From Mopidy API pov, root directory has null URI
 
-        data = await self._ws.send_command(
-            "core.library.browse", params={"uri": uri}, timeout=60
+        data = await self._send_command(
+            "core.library.browse", params={"uri": uri}, timeout=timeout
         )
         if data is None:
             return None
@@ -82,11 +245,11 @@ class MopidyHTTPClient(GObject.GObject):
         return refs
 
     async def lookup_library(
-        self, uris: Sequence[str]
+        self, uris: Sequence[str], *, timeout: int = 60
     ) -> dict[str, list[TrackDTO]] | None:
         params = {"uris": uris}
-        data = await self._ws.send_command(
-            "core.library.lookup", params=params, timeout=60
+        data = await self._send_command(
+            "core.library.lookup", params=params, timeout=timeout
         )
         if data is None:
             return None
@@ -96,9 +259,13 @@ class MopidyHTTPClient(GObject.GObject):
             tracks[uri] = cast_seq_of(TrackDTO, data.get(uri, []))
         return tracks
 
-    async def get_images(self, uris: Sequence[str]) -> dict[str, list[ImageDTO]] | None:
+    async def get_images(
+        self, uris: Sequence[str], *, timeout: int | None = None
+    ) -> dict[str, list[ImageDTO]] | None:
         params = {"uris": uris}
-        data = await self._ws.send_command("core.library.get_images", params=params)
+        data = await self._send_command(
+            "core.library.get_images", params=params, timeout=timeout
+        )
         if data is None:
             return None
 
@@ -110,7 +277,7 @@ class MopidyHTTPClient(GObject.GObject):
     # Mopidy's API of core.tracklist controller
 
     async def get_eot_tlid(self) -> int | None:
-        eot_tlid = await self._ws.send_command("core.tracklist.get_eot_tlid")
+        eot_tlid = await self._send_command("core.tracklist.get_eot_tlid")
         return int(eot_tlid) if eot_tlid is not None else None
 
     async def add_to_tracklist(self, uris: Sequence[str]) -> list[TlTrackDTO] | None:
@@ -123,7 +290,7 @@ class MopidyHTTPClient(GObject.GObject):
             Optional list of tracklist tracks.
 
         """
-        data = await self._ws.send_command("core.tracklist.add", params={"uris": uris})
+        data = await self._send_command("core.tracklist.add", params={"uris": uris})
         if data is None:
             return None
 
@@ -137,17 +304,17 @@ class MopidyHTTPClient(GObject.GObject):
             tlids: List of tracklist identifier of the tracks to remove.
 
         """
-        await self._ws.send_command(
+        await self._send_command(
             "core.tracklist.remove", params={"criteria": {"tlid": tlids}}
         )
 
     async def clear_tracklist(self) -> None:
         """Clear the tracklist."""
-        await self._ws.send_command("core.tracklist.clear")
+        await self._send_command("core.tracklist.clear")
 
     async def get_tracklist_tracks(self) -> list[TlTrackDTO] | None:
         """Get the tracklist tracks."""
-        data = await self._ws.send_command("core.tracklist.get_tl_tracks")
+        data = await self._send_command("core.tracklist.get_tl_tracks")
         if data is None:
             return None
 
@@ -156,39 +323,39 @@ class MopidyHTTPClient(GObject.GObject):
 
     async def get_tracklist_version(self) -> int | None:
         """Get the version of the tracklist."""
-        return await self._ws.send_command("core.tracklist.get_version")
+        return await self._send_command("core.tracklist.get_version")
 
     async def get_consume(self) -> bool | None:
-        consume = await self._ws.send_command("core.tracklist.get_consume")
+        consume = await self._send_command("core.tracklist.get_consume")
         return bool(consume) if consume is not None else None
 
     async def set_consume(self, consume: bool) -> None:
         params = {"value": consume}
-        await self._ws.send_command("core.tracklist.set_consume", params=params)
+        await self._send_command("core.tracklist.set_consume", params=params)
 
     async def get_random(self) -> bool | None:
-        random = await self._ws.send_command("core.tracklist.get_random")
+        random = await self._send_command("core.tracklist.get_random")
         return bool(random) if random is not None else None
 
     async def set_random(self, random: bool) -> None:
         params = {"value": random}
-        await self._ws.send_command("core.tracklist.set_random", params=params)
+        await self._send_command("core.tracklist.set_random", params=params)
 
     async def get_repeat(self) -> bool | None:
-        repeat = await self._ws.send_command("core.tracklist.get_repeat")
+        repeat = await self._send_command("core.tracklist.get_repeat")
         return bool(repeat) if repeat is not None else None
 
     async def set_repeat(self, repeat: bool) -> None:
         params = {"value": repeat}
-        await self._ws.send_command("core.tracklist.set_repeat", params=params)
+        await self._send_command("core.tracklist.set_repeat", params=params)
 
     async def get_single(self) -> bool | None:
-        single = await self._ws.send_command("core.tracklist.get_single")
+        single = await self._send_command("core.tracklist.get_single")
         return bool(single) if single is not None else None
 
     async def set_single(self, single: bool) -> None:
         params = {"value": single}
-        await self._ws.send_command("core.tracklist.set_single", params=params)
+        await self._send_command("core.tracklist.set_single", params=params)
 
     async def play_tracks(self, uris: Sequence[str] | None = None) -> None:
         """Play tracks with given URIs.
@@ -200,37 +367,37 @@ class MopidyHTTPClient(GObject.GObject):
         if uris is None or len(uris) == 0:
             return
 
-        await self._ws.send_command("core.tracklist.clear")
-        await self._ws.send_command("core.tracklist.add", params={"uris": uris})
-        state = await self._ws.send_command("core.playback.get_state")
+        await self._send_command("core.tracklist.clear")
+        await self._send_command("core.tracklist.add", params={"uris": uris})
+        state = await self._send_command("core.playback.get_state")
         if state != PlaybackState.PLAYING:
-            await self._ws.send_command("core.playback.play")
+            await self._send_command("core.playback.play")
 
     # Mopidy's API of core.mixer controller
 
     async def get_mute(self) -> bool | None:
-        mute = await self._ws.send_command("core.mixer.get_mute")
+        mute = await self._send_command("core.mixer.get_mute")
         return bool(mute) if mute is not None else None
 
     async def set_mute(self, mute: bool) -> None:
         params = {"mute": mute}
-        await self._ws.send_command("core.mixer.set_mute", params=params)
+        await self._send_command("core.mixer.set_mute", params=params)
 
     async def get_volume(self) -> int | None:
-        volume = await self._ws.send_command("core.mixer.get_volume")
+        volume = await self._send_command("core.mixer.get_volume")
         return int(volume) if volume is not None else None
 
     async def set_volume(self, volume: int) -> None:
         params = {"volume": volume}
-        await self._ws.send_command("core.mixer.set_volume", params=params)
+        await self._send_command("core.mixer.set_volume", params=params)
 
     # Mopidy's API of core.playlists controller
 
     async def get_playlists_uri_schemes(self) -> list[str] | None:
-        return await self._ws.send_command("core.playlists.get_uri_schemes")
+        return await self._send_command("core.playlists.get_uri_schemes")
 
     async def list_playlists(self) -> list[RefDTO] | None:
-        data = await self._ws.send_command("core.playlists.as_list")
+        data = await self._send_command("core.playlists.as_list")
         if data is None:
             return None
 
@@ -238,7 +405,7 @@ class MopidyHTTPClient(GObject.GObject):
         return refs
 
     async def lookup_playlist(self, uri: str) -> PlaylistDTO | None:
-        data = await self._ws.send_command("core.playlists.lookup", params={"uri": uri})
+        data = await self._send_command("core.playlists.lookup", params={"uri": uri})
         return PlaylistDTO.factory(data)
 
     async def create_playlist(
@@ -248,22 +415,22 @@ class MopidyHTTPClient(GObject.GObject):
         if uri_scheme is not None:
             params["uri_scheme"] = uri_scheme
 
-        data = await self._ws.send_command("core.playlists.create", params=params)
+        data = await self._send_command("core.playlists.create", params=params)
         return PlaylistDTO.factory(data)
 
     async def save_playlist(self, playlist: Mapping[str, Any]) -> PlaylistDTO | None:
-        data = await self._ws.send_command(
+        data = await self._send_command(
             "core.playlists.save", params={"playlist": playlist}
         )
         return PlaylistDTO.factory(data)
 
     async def delete_playlist(self, uri: str) -> bool | None:
-        return await self._ws.send_command("core.playlists.delete", params={"uri": uri})
+        return await self._send_command("core.playlists.delete", params={"uri": uri})
 
     # Mopidy's API of core.history controller
 
     async def get_history(self) -> list[tuple[int, RefDTO]] | None:
-        data = await self._ws.send_command("core.history.get_history", timeout=60)
+        data = await self._send_command("core.history.get_history", timeout=60)
         if data is None:
             return None
 
@@ -1,12 +1,16 @@
 import asyncio
 import collections.abc
+import contextlib
 import functools
+import heapq
 import inspect
+import itertools
 import logging
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Sequence, TypeVar
+from enum import Enum, IntEnum
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Sequence, TypeVar
 
 from gi.repository import GObject
 
@@ -17,6 +21,8 @@ LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+MAX_CONCURRENT_CONSUMERS = 8
+
 
 class MessageType(Enum):
     # Commands
@@ -29,8 +35,10 @@ class MessageType(Enum):
     FETCH_TRACK_IMAGE = 9
     FETCH_IMAGES = 10
     BROWSE_DIRECTORY = 11
+    RESTORE_LIBRARY = 12
     COMPLETE_ALBUM_DESCRIPTION = 13
     COLLECT_ALBUM_INFORMATION = 14
+    PRELOAD_ALBUM_TRACKS = 15
 
     IDENTIFY_PLAYING_STATE = 20
     ADD_TO_TRACKLIST = 21
@@ -66,14 +74,143 @@ class MessageType(Enum):
     PLAYLIST_LOADED = 52
 
 
+class MessagePriority(IntEnum):
+    """Priority of messages, lower values are dispatched first."""
+
+    INTERACTIVE = 0
+    EVENT = 1
+    DEFAULT = 2
+    BACKGROUND = 3
+
+
+_MESSAGE_PRIORITIES: dict[MessageType, MessagePriority] = {
+    MessageType.TOGGLE_PLAYBACK_STATE: MessagePriority.INTERACTIVE,
+    MessageType.PLAY_PREV_TRACK: MessagePriority.INTERACTIVE,
+    MessageType.PLAY_NEXT_TRACK: MessagePriority.INTERACTIVE,
+    MessageType.PLAY_TRACKS: MessagePriority.INTERACTIVE,
+    MessageType.SEEK: MessagePriority.INTERACTIVE,
+    MessageType.SET_VOLUME: MessagePriority.INTERACTIVE,
+    MessageType.ADD_TO_TRACKLIST: MessagePriority.INTERACTIVE,
+    MessageType.REMOVE_FROM_TRACKLIST: MessagePriority.INTERACTIVE,
+    MessageType.CLEAR_TRACKLIST: MessagePriority.INTERACTIVE,
+    MessageType.PLAY: MessagePriority.INTERACTIVE,
+    MessageType.SET_CONSUME: MessagePriority.INTERACTIVE,
+    MessageType.SET_RANDOM: MessagePriority.INTERACTIVE,
+    MessageType.SET_REPEAT: MessagePriority.INTERACTIVE,
+    MessageType.SET_SINGLE: MessagePriority.INTERACTIVE,
+    MessageType.RESTORE_LIBRARY: MessagePriority.INTERACTIVE,
+    MessageType.IDENTIFY_PLAYING_STATE: MessagePriority.EVENT,
+    MessageType.GET_TRACKLIST: MessagePriority.EVENT,
+    MessageType.GET_CURRENT_TRACKLIST_TRACK: MessagePriority.EVENT,
+    MessageType.TRACK_PLAYBACK_STARTED: MessagePriority.EVENT,
+    MessageType.TRACK_PLAYBACK_PAUSED: MessagePriority.EVENT,
+    MessageType.TRACK_PLAYBACK_RESUMED: MessagePriority.EVENT,
+    MessageType.TRACK_PLAYBACK_ENDED: MessagePriority.EVENT,
+    MessageType.PLAYBACK_STATE_CHANGED: MessagePriority.EVENT,
+    MessageType.MUTE_CHANGED: MessagePriority.EVENT,
+    MessageType.VOLUME_CHANGED: MessagePriority.EVENT,
+    MessageType.TRACKLIST_CHANGED: MessagePriority.EVENT,
+    MessageType.SEEKED: MessagePriority.EVENT,
+    MessageType.OPTIONS_CHANGED: MessagePriority.EVENT,
+    MessageType.FETCH_TRACK_IMAGE: MessagePriority.BACKGROUND,
+    MessageType.FETCH_IMAGES: MessagePriority.BACKGROUND,
+    MessageType.COLLECT_ALBUM_INFORMATION: MessagePriority.BACKGROUND,
+    MessageType.PRELOAD_ALBUM_TRACKS: MessagePriority.BACKGROUND,
+}
+# Message types not listed have the default priority
+
+
+def get_priority(message_type: MessageType) -> MessagePriority:
+    return _MESSAGE_PRIORITIES.get(message_type, MessagePriority.DEFAULT)
+
+
 @dataclass
 class Message:
     type: MessageType
     data: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class MessageQueueStats:
+    """Statistics of messages of a given priority."""
+
+    count: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    max_depth: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_wait_time": (
+                self.total_wait_time / self.count if self.count else None
+            ),
+            "max_wait_time": self.max_wait_time,
+            "max_depth": self.max_depth,
+        }
+
+
+class MessageQueue(asyncio.Queue):
+    """Queue of messages ordered by priority.
+
+    Messages with higher priority are retrieved first, see
+    ``MessagePriority``; Messages with the same priority are retrieved
+    in the order they were put.
+
+    Statistics on queue depth and on the time spent by messages in the
+    queue are maintained per priority.
+
+    """
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: list[tuple[MessagePriority, int, float, Message]] = []
+        self._counter = itertools.count()
+        self._depths: dict[MessagePriority, int] = defaultdict(int)
+        self._stats: dict[MessagePriority, MessageQueueStats] = {
+            priority: MessageQueueStats() for priority in MessagePriority
+        }
+
+    def _put(self, message: Message) -> None:
+        priority = get_priority(message.type)
+        heapq.heappush(
+            self._queue, (priority, next(self._counter), time.monotonic(), message)
+        )
+        self._depths[priority] += 1
+        stats = self._stats[priority]
+        stats.max_depth = max(stats.max_depth, self._depths[priority])
+
+    def _get(self) -> Message:
+        priority, _, enqueued_at, message = heapq.heappop(self._queue)
+        self._depths[priority] -= 1
+        wait_time = time.monotonic() - enqueued_at
+        stats = self._stats[priority]
+        stats.count += 1
+        stats.total_wait_time += wait_time
+        stats.max_wait_time = max(stats.max_wait_time, wait_time)
+        if wait_time > 1:
+            LOGGER.debug(
+                f"Message of type {message.type} waited {wait_time:.2f}s in queue"
+            )
+        return message
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the queue statistics."""
+        return {
+            "depth": self.qsize(),
+            "priorities": {
+                priority.name.lower(): {
+                    "depth": self._depths[priority],
+                    **self._stats[priority].as_dict(),
+                }
+                for priority in MessagePriority
+            },
+        }
+
+
 def consume(
     *args: MessageType,
+    concurrent: bool = False,
+    key: str | None = None,
 ) -> Callable[
     [Callable[[T, Message], collections.abc.Awaitable[None]]],
     Callable[[T, Message], collections.abc.Awaitable[None]],
@@ -87,6 +224,15 @@ def consume(
     the presence of the ``consume_message`` attribute. This attribute
     value is the list of message type handled by the consumer.
 
+    By default, the dispatcher awaits the end of a consumer before
+    dispatching the next message. A consumer declared ``concurrent``
+    is run in a dedicated task instead, thus long consumers don't
+    delay the processing of unrelated messages. When ``key`` is
+    given, it's the name of a message data field (for example
+    ``"album_uri"``): Concurrent consumers of messages with equal
+    values of that field are run one at a time, in the order messages
+    were dispatched.
+
     Note that it's the message dispatcher responsibility to feed
     consumers with message of type they expect.
 
@@ -110,19 +256,36 @@ def consume(
             return await method(ref, message)
 
         setattr(inner, "consume_messages", args)
+        setattr(inner, "consume_concurrently", concurrent)
+        setattr(inner, "consume_key", key)
 
         return inner
 
     return decorator
 
 
+class _KeyLock:
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
 class MessageDispatchTask(GObject.Object):
-    """Dispatch messages to consumers."""
+    """Dispatch messages to consumers.
+
+    Concurrent consumers are run in dedicated tasks, at most
+    ``MAX_CONCURRENT_CONSUMERS`` at the same time, see ``consume()``.
+
+    """
 
     def __init__(self, application: "Application"):
         super().__init__()
         self._message_queue: asyncio.Queue = application.message_queue
 
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONSUMERS)
+        self._key_locks: dict[tuple[str, Any], _KeyLock] = {}
+        self._tasks: set[asyncio.Task] = set()
+
         self._identify_message_consumers_from_objects(application.props.controllers)
 
     def _identify_message_consumers_from_objects(
@@ -154,16 +317,62 @@ class MessageDispatchTask(GObject.Object):
                     LOGGER.warning(f"No consumer for message of type {message_type}")
                 else:
                     for consumer in consumers:
-                        try:
-                            await consumer(message)
-                        except Exception as exc:
-                            if type(exc) == asyncio.exceptions.CancelledError:
-                                raise exc
-                            else:
-                                LOGGER.warning(
-                                    f"Unhandled exception in message processing",
-                                    exc_info=exc,
-                                )
-                                LOGGER.debug(f"Problematic message: {message}")
+                        if getattr(consumer, "consume_concurrently", False):
+                            task = asyncio.create_task(
+                                self._consume_concurrently(consumer, message)
+                            )
+                            self._tasks.add(task)
+                            task.add_done_callback(self._tasks.discard)
+                        else:
+                            await self._consume(consumer, message)
         except asyncio.exceptions.CancelledError:
             LOGGER.debug("Won't dispatch messages anymore")
+            for task in self._tasks:
+                task.cancel()
+
+    async def _consume(
+        self,
+        consumer: Callable[[Message], collections.abc.Awaitable[None]],
+        message: Message,
+    ) -> None:
+        try:
+            await consumer(message)
+        except Exception as exc:
+            if type(exc) == asyncio.exceptions.CancelledError:
+                raise exc
+            else:
+                LOGGER.warning(
+                    f"Unhandled exception in message processing",
+                    exc_info=exc,
+                )
+                LOGGER.debug(f"Problematic message: {message}")
+
+    async def _consume_concurrently(
+        self,
+        consumer: Callable[[Message], collections.abc.Awaitable[None]],
+        message: Message,
+    ) -> None:
+        key = getattr(consumer, "consume_key", None)
+        key_value = message.data.get(key) if key is not None else None
+        async with self._serialize(key, key_value):
+            async with self._semaphore:
+                await self._consume(consumer, message)
+
+    @contextlib.asynccontextmanager
+    async def _serialize(self, key: str | None, value: Any) -> AsyncIterator[None]:
+        if key is None or value is None:
+            yield
+            return
+
+        key_lock = self._key_locks.get((key, value))
+        if key_lock is None:
+            key_lock = self._key_locks[(key, value)] = _KeyLock()
+
+        key_lock.users += 1
+        try:
+            async with key_lock.lock:
+                yield
+        finally:
+            key_lock.users -= 1
+            if key_lock.users == 0:
+                del self._key_locks[(key, value)]
@@ -0,0 +1,158 @@
+import bisect
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+LATENCY_BUCKETS: tuple[float, ...] = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)  # s
+# Upper bounds of the buckets of latency histograms, the last bucket
+# of an histogram counts latencies above the last bound
+
+
+class CommandOutcome(Enum):
+    SUCCESS = 0
+    ERROR = 1
+    TIMEOUT = 2
+    CANCELLED = 3
+
+
+@dataclass
+class MethodMetrics:
+    """Metrics of the JSON-RPC commands with a given method."""
+
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    cancellations: int = 0
+    in_flight: int = 0
+    request_chars: int = 0
+    response_chars: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    latency_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+    @property
+    def failures(self) -> int:
+        return self.errors + self.timeouts + self.cancellations
+
+    @property
+    def responses(self) -> int:
+        return sum(self.latency_histogram)
+
+    @property
+    def mean_latency(self) -> float | None:
+        return self.total_latency / self.responses if self.responses else None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "cancellations": self.cancellations,
+            "in_flight": self.in_flight,
+            "request_chars": self.request_chars,
+            "response_chars": self.response_chars,
+            "mean_latency": self.mean_latency,
+            "max_latency": self.max_latency,
+            "latency_histogram": list(self.latency_histogram),
+        }
+
+
+class CommandMetrics:
+    """Metrics of the JSON-RPC commands sent to Mopidy.
+
+    Metrics are recorded per method. A command is counted in flight
+    from the time it is sent until its outcome is known.
+
+    """
+
+    def __init__(self) -> None:
+        self._methods: dict[str, MethodMetrics] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return sum(m.in_flight for m in self._methods.values())
+
+    def get(self, method: str) -> MethodMetrics:
+        metrics = self._methods.get(method)
+        if metrics is None:
+            metrics = self._methods[method] = MethodMetrics()
+        return metrics
+
+    def command_sent(self, method: str, request_chars: int) -> None:
+        metrics = self.get(method)
+        metrics.calls += 1
+        metrics.in_flight += 1
+        metrics.request_chars += request_chars
+
+    def command_done(
+        self,
+        method: str,
+        outcome: CommandOutcome,
+        *,
+        latency: float | None = None,
+        response_chars: int = 0,
+    ) -> None:
+        """Record the outcome of a command.
+
+        Args:
+            method: Method of the command.
+
+            outcome: Outcome of the command.
+
+            latency: Duration in seconds between the sending of the
+                command and the reception of its response, if any.
+
+            response_chars: Length of the response text, in characters.
+
+        """
+        metrics = self.get(method)
+        metrics.in_flight = max(0, metrics.in_flight - 1)
+        metrics.response_chars += response_chars
+
+        if outcome == CommandOutcome.ERROR:
+            metrics.errors += 1
+        elif outcome == CommandOutcome.TIMEOUT:
+            metrics.timeouts += 1
+        elif outcome == CommandOutcome.CANCELLED:
+            metrics.cancellations += 1
+
+        if latency is not None:
+            metrics.total_latency += latency
+            metrics.max_latency = max(metrics.max_latency, latency)
+            metrics.latency_histogram[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "latency_buckets": list(LATENCY_BUCKETS),
+            "methods": {
+                method: metrics.as_dict()
+                for method, metrics in sorted(self._methods.items())
+            },
+        }
+
+    def format(self) -> str:
+        lines = [f"JSON-RPC commands in flight: {self.in_flight}"]
+        for method, metrics in sorted(
+            self._methods.items(), key=lambda item: item[1].total_latency, reverse=True
+        ):
+            mean_latency = metrics.mean_latency
+            lines.append(
+                f"{method}: {metrics.calls} calls, {metrics.failures} failures "
+                f"({metrics.errors} errors, {metrics.timeouts} timeouts, "
+                f"{metrics.cancellations} cancellations), "
+                f"{metrics.in_flight} in flight, "
+                f"sent {metrics.request_chars} chars, "
+                f"received {metrics.response_chars} chars, "
+                "mean latency "
+                + (f"{mean_latency:.3f}s" if mean_latency is not None else "-")
+                + f", max latency {metrics.max_latency:.3f}s, "
+                f"histogram {metrics.latency_histogram}"
+            )
+        return "\n".join(lines)
@@ -1,10 +1,42 @@
 import locale
-from typing import Sequence
+from typing import Any, Sequence
 
 from gi.repository import Gio, GObject
 
 from argos.model.backends import MopidyBackend
 from argos.model.track import TrackModel
+from argos.model.utils import WithCachedSortKeys, cached_sort_key, compare_sort_keys
+
+
+@cached_sort_key
+def album_key_by_name(album: "AlbumModel") -> tuple[Any, ...]:
+    return (
+        locale.strxfrm(album.name),
+        locale.strxfrm(album.artist_name),
+        album.uri,
+    )
+
+
+@cached_sort_key
+def album_key_by_artist_name(album: "AlbumModel") -> tuple[Any, ...]:
+    return (
+        locale.strxfrm(album.artist_name),
+        album.date,
+        locale.strxfrm(album.name),
+        album.uri,
+    )
+
+
+@cached_sort_key
+def album_key_by_last_modified_date_reversed(
+    album: "AlbumModel",
+) -> tuple[Any, ...]:
+    return (-album.last_modified, locale.strxfrm(album.name), album.uri)
+
+
+@cached_sort_key
+def album_key_by_publication_date(album: "AlbumModel") -> tuple[Any, ...]:
+    return (album.date, locale.strxfrm(album.name), album.uri)
 
 
 def compare_albums_by_name_func(
@@ -12,20 +44,7 @@ def compare_albums_by_name_func(
     b: "AlbumModel",
     user_data: None,
 ) -> int:
-    names_comp = locale.strcoll(a.name, b.name)
-    if names_comp != 0:
-        return names_comp
-
-    artist_names_comp = locale.strcoll(a.artist_name, b.artist_name)
-    if artist_names_comp != 0:
-        return artist_names_comp
-
-    if a.uri < b.uri:
-        return -1
-    elif a.uri > b.uri:
-        return 1
-
-    return 0
+    return compare_sort_keys(album_key_by_name(a), album_key_by_name(b))
 
 
 def compare_albums_by_artist_name_func(
@@ -33,25 +52,7 @@ def compare_albums_by_artist_name_func(
     b: "AlbumModel",
     user_data: None,
 ) -> int:
-    artist_names_comp = locale.strcoll(a.artist_name, b.artist_name)
-    if artist_names_comp != 0:
-        return artist_names_comp
-
-    if a.date < b.date:
-        return -1
-    elif a.date > b.date:
-        return 1
-
-    names_comp = locale.strcoll(a.name, b.name)
-    if names_comp != 0:
-        return names_comp
-
-    if a.uri < b.uri:
-        return -1
-    elif a.uri > b.uri:
-        return 1
-
-    return 0
+    return compare_sort_keys(album_key_by_artist_name(a), album_key_by_artist_name(b))
 
 
 def compare_albums_by_last_modified_date_reversed_func(
@@ -59,21 +60,10 @@ def compare_albums_by_last_modified_date_reversed_func(
     b: "AlbumModel",
     user_data: None,
 ) -> int:
-    if a.last_modified > b.last_modified:
-        return -1
-    elif a.last_modified < b.last_modified:
-        return 1
-
-    names_comp = locale.strcoll(a.name, b.name)
-    if names_comp != 0:
-        return names_comp
-
-    if a.uri < b.uri:
-        return -1
-    elif a.uri > b.uri:
-        return 1
-
-    return 0
+    return compare_sort_keys(
+        album_key_by_last_modified_date_reversed(a),
+        album_key_by_last_modified_date_reversed(b),
+    )
 
 
 def compare_albums_by_publication_date_func(
@@ -81,21 +71,9 @@ def compare_albums_by_publication_date_func(
     b: "AlbumModel",
     user_data: None,
 ) -> int:
-    if a.date < b.date:
-        return -1
-    elif a.date > b.date:
-        return 1
-
-    names_comp = locale.strcoll(a.name, b.name)
-    if names_comp != 0:
-        return names_comp
-
-    if a.uri < b.uri:
-        return -1
-    elif a.uri > b.uri:
-        return 1
-
-    return 0
+    return compare_sort_keys(
+        album_key_by_publication_date(a), album_key_by_publication_date(b)
+    )
 
 
 class AlbumInformationModel(GObject.Object):
@@ -106,7 +84,7 @@ class AlbumInformationModel(GObject.Object):
     last_modified = GObject.Property(type=GObject.TYPE_DOUBLE, default=-1)
 
 
-class AlbumModel(GObject.Object):
+class AlbumModel(WithCachedSortKeys, GObject.Object):
     """Model for an album."""
 
     uri = GObject.Property(type=str)
@@ -1,9 +1,20 @@
 import logging
+from typing import Any, Mapping
 
 from gi.repository import GObject
 
 LOGGER = logging.getLogger(__name__)
 
+PROFILE_PROPERTY_NAMES = (
+    "max-concurrency",
+    "call-size",
+    "timeout",
+    "retries",
+    "cache-ttl",
+)
+# Properties of backends defining how library calls are issued, their
+# values can be overridden through the backend-profiles setting
+
 
 class MopidyBackend(GObject.Object):
 
@@ -12,6 +23,41 @@ class MopidyBackend(GObject.Object):
     preload_album_tracks = GObject.Property(type=bool, default=True)
     exclude_albums_from_random_choice = GObject.Property(type=bool, default=False)
 
+    max_concurrency = GObject.Property(type=int, default=4, minimum=1)
+    # maximal number of library calls in flight at once
+    call_size = GObject.Property(type=int, default=20, minimum=1)
+    # initial number of URIs per library call, see CallSizeTuner
+    timeout = GObject.Property(type=int, default=60, minimum=1)  # s
+    retries = GObject.Property(type=int, default=0, minimum=0)
+    # number of retries of failed library calls
+    cache_ttl = GObject.Property(type=int, default=0, minimum=0)  # s
+    # delay after which completed directories are revalidated, zero
+    # means never
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._default_profile = {
+            name: self.get_property(name) for name in PROFILE_PROPERTY_NAMES
+        }
+
+    def apply_profile(self, overrides: Mapping[str, int]) -> None:
+        """Set profile properties to overridden or default values."""
+        for name in PROFILE_PROPERTY_NAMES:
+            value = overrides.get(name, self._default_profile[name])
+            if not isinstance(value, int) or value < self.find_property(name).minimum:
+                LOGGER.warning(
+                    f"Invalid value {value!r} of {name!r} for backend {self}"
+                )
+                value = self._default_profile[name]
+
+            self.set_property(name, value)
+
+        unknown_names = set(overrides) - set(PROFILE_PROPERTY_NAMES)
+        if len(unknown_names) > 0:
+            LOGGER.warning(
+                f"Unknown profile properties {sorted(unknown_names)} for backend {self}"
+            )
+
     def is_responsible_for(self, directory_uri: str) -> bool:
         raise NotImplementedError
 
@@ -29,6 +75,11 @@ class MopidyBandcampBackend(MopidyBackend):
         super().__init__(
             name="Mopidy-Bandcamp",
             preload_album_tracks=False,
+            max_concurrency=2,
+            call_size=10,
+            timeout=120,
+            retries=2,
+            cache_ttl=86400,
         )
 
     def is_responsible_for(self, directory_uri: str) -> bool:
@@ -47,6 +98,11 @@ class MopidyPodcastBackend(MopidyBackend):
             name="Mopidy-Podcast",
             static_albums=False,
             exclude_albums_from_random_choice=True,
+            max_concurrency=2,
+            call_size=10,
+            timeout=120,
+            retries=2,
+            cache_ttl=3600,
         )
 
     def is_responsible_for(self, directory_uri: str) -> bool:
@@ -1,34 +1,31 @@
 import locale
 import logging
-from typing import Callable
+from typing import Any, Callable
 
 from gi.repository import Gio, GObject
 
 from argos.model.album import AlbumModel
 from argos.model.playlist import PlaylistModel
 from argos.model.track import TrackModel
+from argos.model.utils import WithCachedSortKeys, cached_sort_key, compare_sort_keys
 
 LOGGER = logging.getLogger(__name__)
 
 
+@cached_sort_key
+def directory_key(directory: "DirectoryModel") -> tuple[Any, ...]:
+    return (locale.strxfrm(directory.name), directory.uri)
+
+
 def compare_directories_func(
     a: "DirectoryModel",
     b: "DirectoryModel",
     user_data: None,
 ) -> int:
-    names_comp = locale.strcoll(a.name, b.name)
-    if names_comp != 0:
-        return names_comp
-
-    if a.uri < b.uri:
-        return -1
-    elif a.uri > b.uri:
-        return 1
-    # a.uri == b.uri
-    return 0
+    return compare_sort_keys(directory_key(a), directory_key(b))
 
 
-class DirectoryModel(GObject.Object):
+class DirectoryModel(WithCachedSortKeys, GObject.Object):
     """Model for a directory.
 
     The directory with URI equal to an empty string represents the
@@ -54,23 +51,19 @@ class DirectoryModel(GObject.Object):
         self.tracks = Gio.ListStore.new(TrackModel)
         self.playlists = Gio.ListStore.new(PlaylistModel)
 
-    def sort_albums(
-        self,
-        compare_func: Callable[[AlbumModel, AlbumModel, None], int],
-    ) -> None:
-        self.albums.sort(compare_func, None)
+    def sort_albums(self, sort_key: Callable[[AlbumModel], Any]) -> None:
+        albums = sorted(self.albums, key=sort_key)
+        self.albums.splice(0, len(albums), albums)
 
         for directory in self.directories:
-            directory.sort_albums(compare_func)
+            directory.sort_albums(sort_key)
 
-    def sort_tracks(
-        self,
-        compare_func: Callable[[TrackModel, TrackModel, None], int],
-    ) -> None:
-        self.tracks.sort(compare_func, None)
+    def sort_tracks(self, sort_key: Callable[[TrackModel], Any]) -> None:
+        tracks = sorted(self.tracks, key=sort_key)
+        self.tracks.splice(0, len(tracks), tracks)
 
         for directory in self.directories:
-            directory.sort_tracks(compare_func)
+            directory.sort_tracks(sort_key)
 
     def is_complete(self) -> bool:
         return (
@@ -92,142 +85,3 @@ class DirectoryModel(GObject.Object):
 
         for directory in self.directories:
             directory.visit_albums(visitor=visitor)
-
-    def get_album(self, uri: str) -> AlbumModel | None:
-        """Recursively search for an album with given URI.
-
-        Args:
-            uri: URI of the album to return.
-
-        Returns:
-            Album with URI equal to ``uri`` or None if no
-            album is found.
-
-        """
-        if self.props.uri != "":
-            if not self._has_related_scheme(uri):
-                # scheme is used by Mopidy to route browse requests to the
-                # correct backend, thus no need to search if schemes
-                # doesn't match
-                return None
-
-        for album in self.albums:
-            if album.props.uri == uri:
-                return album
-
-        for directory in self.directories:
-            found = directory.get_album(uri)
-            if found is not None:
-                return found
-
-        return None
-
-    def get_directory(self, uri: str) -> "DirectoryModel | None":
-        """Recursively search for a directory with given URI.
-
-        Args:
-            uri: URI of the directory to return.
-
-        Returns:
-            Directory with URI equal to ``uri`` or None if no
-            directory is found.
-
-        """
-        if self.props.uri == uri:
-            return self
-
-        if self.props.uri != "":
-            # not root directory
-
-            if not self._has_related_scheme(uri):
-                # scheme is used by Mopidy to route browse requests to
-                # the correct backend, thus no need to search in child
-                # directories if schemes doesn't match
-                return None
-
-        for directory in self.directories:
-            found = directory.get_directory(uri)
-            if found is not None:
-                return found
-
-        return None
-
-    def get_playlist(self, uri: str) -> PlaylistModel | None:
-        """Recursively search for an playlist with given URI.
-
-        Args:
-            uri: URI of the playlist to return.
-
-        Returns:
-            Playlist with URI equal to ``uri`` or None if no
-            playlist is found.
-
-        """
-        if self.props.uri != "":
-            if not self._has_related_scheme(uri):
-                # scheme is used by Mopidy to route browse requests to the
-                # correct backend, thus no need to search if schemes
-                # doesn't match
-                return None
-
-        for playlist in self.playlists:
-            if playlist.props.uri == uri:
-                return playlist
-
-        for directory in self.directories:
-            found = directory.get_playlist(uri)
-            if found is not None:
-                return found
-
-        return None
-
-    def get_track(self, uri: str) -> TrackModel | None:
-        """Recursively search for a track with given URI.
-
-        Args:
-            uri: URI of the track to return.
-
-        Returns:
-            Track with URI equal to ``uri`` or None if no
-            track is found.
-
-        """
-        if self.props.uri != "":
-            if not self._has_related_scheme(uri):
-                # scheme is used by Mopidy to route browse requests to the
-                # correct backend, thus no need to search if schemes
-                # doesn't match
-                return None
-
-        for track in self.tracks:
-            if track.props.uri == uri:
-                return track
-
-        for album in self.albums:
-            for track in album.tracks:
-                if track.props.uri == uri:
-                    return track
-
-        for playlist in self.playlists:
-            for track in playlist.tracks:
-                if track.props.uri == uri:
-                    return track
-
-        for directory in self.directories:
-            found = directory.get_track(uri)
-            if found is not None:
-                return found
-
-        return None
-
-    def _has_related_scheme(self, uri: str) -> bool:
-        """Check whether the given URI has a scheme related to this directory.
-
-        Args:
-            uri: URI whose scheme is to be checked.
-
-        Returns:
-            True if ``uri`` has a scheme related to this directory.
-        """
-        scheme = self.props.uri.split(":")[0].split("+")[0]
-        return uri.startswith(scheme)
@@ -1,10 +1,11 @@
 import logging
-from typing import Callable
+from typing import Any, Callable, Generic, Protocol, TypeVar
 
 from gi.repository import GObject
 
 from argos.model.album import AlbumModel
 from argos.model.directory import DirectoryModel
+from argos.model.playlist import PlaylistModel
 from argos.model.track import TrackModel
 
 LOGGER = logging.getLogger(__name__)
@@ -12,24 +13,134 @@ LOGGER = logging.getLogger(__name__)
 MOPIDY_LOCAL_ALBUMS_URI = "local:directory?type=album"
 
 
+class _HasURI(Protocol):
+    uri: str
+
+
+T = TypeVar("T", bound=_HasURI)
+
+
+class _URIIndex(Generic[T]):
+    """Index of models by URI.
+
+    The same URI may be registered by distinct models (for example an
+    album listed in several directories), the model registered first
+    is returned until it's forgotten.
+
+    """
+
+    def __init__(self) -> None:
+        self._models: dict[str, list[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def get(self, uri: str | None) -> T | None:
+        models = self._models.get(uri) if uri is not None else None
+        return models[0] if models else None
+
+    def add(self, model: T) -> None:
+        self._models.setdefault(model.uri, []).append(model)
+
+    def remove(self, model: T) -> None:
+        models = self._models.get(model.uri)
+        if models is None:
+            return
+
+        for i, m in enumerate(models):
+            if m is model:
+                del models[i]
+                break
+
+        if len(models) == 0:
+            del self._models[model.uri]
+
+
 class LibraryModel(GObject.Object):
-    """Model for whole library."""
+    """Model for whole library.
+
+    Albums, directories, tracks and playlists of the library are
+    indexed by URI. Indexes must be maintained by calling
+    ``register_directory_content()`` and ``forget_directory_content()``
+    (resp. ``register_album_tracks()`` and ``forget_album_tracks()``)
+    each time the content of a directory (resp. the tracks of an
+    album) change.
+
+    """
 
     default_uri = GObject.Property(type=str)
+    displayed_directory_uri = GObject.Property(type=str)
+    displayed_album_uri = GObject.Property(type=str)
     root_directory = GObject.Property(
         type=DirectoryModel,
         default=DirectoryModel(uri="", name="root"),
         flags=GObject.ParamFlags.READABLE,
     )
 
-    def sort_albums(
-        self,
-        compare_func: Callable[[AlbumModel, AlbumModel, None], int],
-    ) -> None:
-        self.props.root_directory.sort_albums(compare_func)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._albums: _URIIndex[AlbumModel] = _URIIndex()
+        self._directories: _URIIndex[DirectoryModel] = _URIIndex()
+        self._tracks: _URIIndex[TrackModel] = _URIIndex()
+        self._playlists: _URIIndex[PlaylistModel] = _URIIndex()
+
+        root_directory = self.props.root_directory
+        self._directories.add(root_directory)
+        self.register_directory_content(root_directory)
+
+    def register_directory_content(self, directory: DirectoryModel) -> None:
+        """Index the content of a directory, recursively."""
+        for album in directory.albums:
+            self.register_album(album)
+
+        for subdir in directory.directories:
+            self._directories.add(subdir)
+            self.register_directory_content(subdir)
+
+        for track in directory.tracks:
+            self._tracks.add(track)
+
+        for playlist in directory.playlists:
+            self._playlists.add(playlist)
+            for track in playlist.tracks:
+                self._tracks.add(track)
+
+    def forget_directory_content(self, directory: DirectoryModel) -> None:
+        """Remove the content of a directory from indexes, recursively."""
+        for album in directory.albums:
+            self._albums.remove(album)
+            self.forget_album_tracks(album)
+
+        for subdir in directory.directories:
+            self._directories.remove(subdir)
+            self.forget_directory_content(subdir)
+
+        for track in directory.tracks:
+            self._tracks.remove(track)
+
+        for playlist in directory.playlists:
+            self._playlists.remove(playlist)
+            for track in playlist.tracks:
+                self._tracks.remove(track)
+
+    def register_album(self, album: AlbumModel) -> None:
+        self._albums.add(album)
+        self.register_album_tracks(album)
+
+    def register_album_tracks(self, album: AlbumModel) -> None:
+        for track in album.tracks:
+            self._tracks.add(track)
+
+    def forget_album_tracks(self, album: AlbumModel) -> None:
+        for track in album.tracks:
+            self._tracks.remove(track)
+
+    def sort_albums(self, sort_key: Callable[[AlbumModel], Any]) -> None:
+        self.props.root_directory.sort_albums(sort_key)
 
     def get_album(self, uri: str) -> AlbumModel | None:
-        return self.props.root_directory.get_album(uri)
+        return self._albums.get(uri)
 
     def visit_albums(
         self, *, visitor=Callable[[AlbumModel, DirectoryModel], None]
@@ -37,16 +148,16 @@ class LibraryModel(GObject.Object):
         self.props.root_directory.visit_albums(visitor=visitor)
 
     def get_directory(self, uri: str | None) -> DirectoryModel | None:
-        return self.props.root_directory.get_directory(uri)
+        return self._directories.get(uri)
 
-    def sort_tracks(
-        self,
-        compare_func: Callable[[TrackModel, TrackModel, None], int],
-    ) -> None:
-        self.props.root_directory.sort_tracks(compare_func)
+    def sort_tracks(self, sort_key: Callable[[TrackModel], Any]) -> None:
+        self.props.root_directory.sort_tracks(sort_key)
 
     def get_track(self, uri: str | None) -> TrackModel | None:
-        return self.props.root_directory.get_track(uri)
+        return self._tracks.get(uri)
+
+    def get_playlist(self, uri: str | None) -> PlaylistModel | None:
+        return self._playlists.get(uri)
 
     def get_parent_uris(self, uri: str) -> list[str]:
         if uri == MOPIDY_LOCAL_ALBUMS_URI:
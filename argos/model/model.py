@@ -9,10 +9,10 @@ from gi.repository import Gio, GLib, GObject
 from argos.model.album import (
     AlbumInformationModel,
     AlbumModel,
-    compare_albums_by_artist_name_func,
-    compare_albums_by_last_modified_date_reversed_func,
-    compare_albums_by_name_func,
-    compare_albums_by_publication_date_func,
+    album_key_by_artist_name,
+    album_key_by_last_modified_date_reversed,
+    album_key_by_name,
+    album_key_by_publication_date,
 )
 from argos.model.backends import (
     GenericBackend,
@@ -20,20 +20,20 @@ from argos.model.backends import (
     MopidyBandcampBackend,
     MopidyPodcastBackend,
 )
-from argos.model.directory import DirectoryModel, compare_directories_func
+from argos.model.directory import DirectoryModel, directory_key
 from argos.model.library import LibraryModel
 from argos.model.mixer import MixerModel
 from argos.model.playback import PlaybackModel
-from argos.model.playlist import PlaylistModel, compare_playlists_func
+from argos.model.playlist import PlaylistModel, compare_playlists_func, playlist_key
 from argos.model.random import RandomTracksChoice, choose_random_tracks
 from argos.model.status import ModelFlag
 from argos.model.track import (
     TrackModel,
-    compare_tracks_by_name_func,
-    compare_tracks_by_track_number_func,
+    track_key_by_name,
+    track_key_by_track_number,
 )
 from argos.model.tracklist import TracklistModel, TracklistTrackModel
-from argos.model.utils import WithThreadSafePropertySetter
+from argos.model.utils import WithThreadSafePropertySetter, insert_sorted
 
 if TYPE_CHECKING:
     from argos.app import Application
@@ -55,6 +55,7 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
             (str, int, int),
         ),
         "directory-completed": (GObject.SIGNAL_RUN_FIRST, None, (str,)),
+        "directory-extended": (GObject.SIGNAL_RUN_FIRST, None, (str,)),
     }
 
     server_reachable = GObject.Property(type=bool, default=False)
@@ -79,6 +80,11 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         self.mixer = MixerModel()
         self.tracklist = TracklistModel()
         self.playlists = Gio.ListStore.new(PlaylistModel)
+        self._playlists_by_uri: dict[str, PlaylistModel] = {}
+        self._ambiguous_playlist_uris: set[str] = set()
+        # index of playlists store, positions are found using
+        # Gio.ListStore.find() since maintaining an index of positions
+        # would require to update it on each sorted insertion
         self.backends = Gio.ListStore.new(MopidyBackend)
 
         self.backends.append(MopidyPodcastBackend())
@@ -149,46 +155,46 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         tl_track = self.tracklist.get_tl_track(tlid)
         return tl_track.track.props.uri if tl_track else ""
 
-    def _get_album_compare_func(
+    def _get_album_sort_key(
         self, album_sort_id: str
-    ) -> Callable[[AlbumModel, AlbumModel, None], int]:
+    ) -> Callable[[AlbumModel], tuple[Any, ...]]:
         if album_sort_id == "by_album_name":
-            return compare_albums_by_name_func
+            return album_key_by_name
         elif album_sort_id == "by_last_modified_date":
-            return compare_albums_by_last_modified_date_reversed_func
+            return album_key_by_last_modified_date_reversed
         elif album_sort_id == "by_publication_date":
-            return compare_albums_by_publication_date_func
+            return album_key_by_publication_date
 
         if album_sort_id != "by_artist_name":
             LOGGER.warning(f"Unexpecting album sort identifier {album_sort_id!r}")
 
-        return compare_albums_by_artist_name_func
+        return album_key_by_artist_name
 
     def sort_albums(self, album_sort_id: str) -> None:
         def _sort_albums() -> None:
-            compare_func = self._get_album_compare_func(album_sort_id)
-            self.library.sort_albums(compare_func)
+            sort_key = self._get_album_sort_key(album_sort_id)
+            self.library.sort_albums(sort_key)
 
             LOGGER.info(f"Albums sorted with sort identifier {album_sort_id}")
             self.emit("albums-sorted")
 
         GLib.idle_add(_sort_albums)
 
-    def _get_track_compare_func(
+    def _get_track_sort_key(
         self, track_sort_id: str
-    ) -> Callable[[TrackModel, TrackModel, None], int]:
+    ) -> Callable[[TrackModel], tuple[Any, ...]]:
         if track_sort_id == "by_track_number":
-            return compare_tracks_by_track_number_func
+            return track_key_by_track_number
 
         if track_sort_id != "by_track_name":
             LOGGER.warning(f"Unexpecting track sort identifier {track_sort_id!r}")
 
-        return compare_tracks_by_name_func
+        return track_key_by_name
 
     def sort_tracks(self, track_sort_id: str) -> None:
         def _sort_tracks() -> None:
-            compare_func = self._get_track_compare_func(track_sort_id)
-            self.library.sort_tracks(compare_func)
+            sort_key = self._get_track_sort_key(track_sort_id)
+            self.library.sort_tracks(sort_key)
 
             LOGGER.info(f"Tracks sorted with sort identifier {track_sort_id}")
             self.emit("tracks-sorted")
@@ -220,30 +226,40 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         def _complete_directory():
             directory = self.get_directory(uri)
             if directory is not None:
-                directory.albums.remove_all()
-                directory.directories.remove_all()
-                directory.playlists.remove_all()
-                directory.tracks.remove_all()
+                self.library.forget_directory_content(directory)
 
+                # stores are sorted in Python with precomputed keys,
+                # then filled with a single splice to emit a single
+                # items-changed signal per store
                 album_sort_id = self._settings.get_string("album-sort")
-                album_compare_func = self._get_album_compare_func(album_sort_id)
-                for album in albums:
-                    directory.albums.insert_sorted(album, album_compare_func, None)
-
-                for subdir in directories:
-                    directory.directories.insert_sorted(
-                        subdir, compare_directories_func, None
-                    )
-
-                for playlist in playlists:
-                    directory.playlists.insert_sorted(
-                        playlist, compare_playlists_func, None
-                    )
+                album_sort_key = self._get_album_sort_key(album_sort_id)
+                directory.albums.splice(
+                    0,
+                    directory.albums.get_n_items(),
+                    sorted(albums, key=album_sort_key),
+                )
+
+                directory.directories.splice(
+                    0,
+                    directory.directories.get_n_items(),
+                    sorted(directories, key=directory_key),
+                )
+
+                directory.playlists.splice(
+                    0,
+                    directory.playlists.get_n_items(),
+                    sorted(playlists, key=playlist_key),
+                )
 
                 track_sort_id = self._settings.get_string("track-sort")
-                track_compare_func = self._get_track_compare_func(track_sort_id)
-                for track in tracks:
-                    directory.tracks.insert_sorted(track, track_compare_func, None)
+                track_sort_key = self._get_track_sort_key(track_sort_id)
+                directory.tracks.splice(
+                    0,
+                    directory.tracks.get_n_items(),
+                    sorted(tracks, key=track_sort_key),
+                )
+
+                self.library.register_directory_content(directory)
             else:
                 LOGGER.debug(f"Won't complete unknown directory with URI {uri}")
 
@@ -255,6 +271,31 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         if event is not None:
             event.wait(timeout=2.0)
 
+    def extend_directory(self, uri: str, albums: list[AlbumModel]) -> None:
+        """Publish albums of a directory being completed.
+
+        Albums are inserted in the sorted store of the directory, the
+        directory must be completed afterwards.
+
+        """
+
+        def _extend_directory() -> None:
+            directory = self.get_directory(uri)
+            if directory is None:
+                LOGGER.debug(f"Won't extend unknown directory with URI {uri}")
+                return
+
+            album_sort_id = self._settings.get_string("album-sort")
+            insert_sorted(
+                directory.albums, albums, self._get_album_sort_key(album_sort_id)
+            )
+            for album in albums:
+                self.library.register_album(album)
+
+            self.emit("directory-extended", uri)
+
+        GLib.idle_add(_extend_directory)
+
     def complete_album_description(
         self,
         uri: str,
@@ -304,11 +345,14 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         album.last_modified = last_modified or -1
         album.length = length or -1
 
+        self.library.forget_album_tracks(album)
         album.tracks.remove_all()
 
         for track in tracks:
             album.tracks.append(track)
 
+        self.library.register_album_tracks(album)
+
         GLib.idle_add(
             partial(
                 self.emit,
@@ -374,10 +418,7 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         if self.props.tracklist_loaded:
             self.props.tracklist_loaded = False
 
-        self.tracklist.tracks.remove_all()
-
-        for tl_track in tl_tracks:
-            self.tracklist.tracks.append(tl_track)
+        self.tracklist.update_tracks(tl_tracks)
 
         LOGGER.debug(f"Tracklist with version {version} loaded")
         self.props.tracklist_loaded = True
@@ -392,9 +433,20 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
 
     def _update_playlists(self, playlists: Sequence[PlaylistModel]) -> None:
         self.playlists.remove_all()
+        self._playlists_by_uri.clear()
+        self._ambiguous_playlist_uris.clear()
 
         for playlist in playlists:
-            self.playlists.insert_sorted(playlist, compare_playlists_func, None)
+            self._insert_playlist(playlist)
+
+    def _insert_playlist(self, playlist: PlaylistModel) -> None:
+        if playlist.uri in self._playlists_by_uri:
+            LOGGER.warning(f"Ambiguous playlist URI {playlist.uri!r}")
+            self._ambiguous_playlist_uris.add(playlist.uri)
+        else:
+            self._playlists_by_uri[playlist.uri] = playlist
+
+        self.playlists.insert_sorted(playlist, compare_playlists_func, None)
 
     def complete_playlist_description(
         self,
@@ -425,7 +477,7 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
                 LOGGER.debug(f"Creation of playlist with URI {playlist_uri!r}")
                 playlist = PlaylistModel(uri=playlist_uri, name=name)
                 LOGGER.debug(f"Insertion of playlist with URI {playlist.uri!r}")
-                self.playlists.insert_sorted(playlist, compare_playlists_func, None)
+                self._insert_playlist(playlist)
             else:
                 if (
                     last_modified is not None
@@ -467,28 +519,40 @@ class Model(WithThreadSafePropertySetter, GObject.Object):
         return self.library.get_track(uri)
 
     def get_playlist(self, uri: str) -> PlaylistModel | None:
-        found_playlist = [p for p in self.playlists if p.uri == uri]
-        if len(found_playlist) == 0:
+        playlist = self._playlists_by_uri.get(uri)
+        if playlist is None:
             LOGGER.debug(f"No playlist found with URI {uri!r}")
-            return None
-        elif len(found_playlist) > 1:
-            LOGGER.warning(f"Ambiguous playlist URI {uri!r}")
 
-        return found_playlist[0]
+        return playlist
 
     def delete_playlist(self, uri: str) -> None:
-        found_playlist = [
-            (i, p) for (i, p) in enumerate(self.playlists) if p.uri == uri
-        ]
-        if len(found_playlist) == 0:
+        if uri not in self._playlists_by_uri:
             LOGGER.debug(f"No playlist found with URI {uri!r}")
             return None
-        elif len(found_playlist) > 1:
-            LOGGER.warning(f"Ambiguous playlist URI {uri!r}")
-
-        LOGGER.debug(f"Deletion of playlist with URI {uri!r}")
 
         GLib.idle_add(
-            self.playlists.remove,
-            found_playlist[0][0],
+            partial(
+                self._delete_playlist,
+                uri,
+            )
         )
+
+    def _delete_playlist(self, uri: str) -> None:
+        playlist = self._playlists_by_uri.pop(uri, None)
+        if playlist is None:
+            LOGGER.debug(f"No playlist found with URI {uri!r}")
+            return
+
+        found, position = self.playlists.find(playlist)
+        if not found:
+            return
+
+        LOGGER.debug(f"Deletion of playlist with URI {uri!r}")
+        self.playlists.remove(position)
+
+        if uri in self._ambiguous_playlist_uris:
+            self._ambiguous_playlist_uris.discard(uri)
+            for other in self.playlists:
+                if other.uri == uri:
+                    self._playlists_by_uri[uri] = other
+                    break
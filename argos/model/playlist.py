@@ -1,9 +1,18 @@
 import locale
+from typing import Any
 
 from gi.repository import Gio, GObject
 
 from argos.model.status import ModelFlag
 from argos.model.track import TrackModel
+from argos.model.utils import WithCachedSortKeys, cached_sort_key, compare_sort_keys
+
+
+@cached_sort_key
+def playlist_key(playlist: "PlaylistModel") -> tuple[Any, ...]:
+    # Virtual playlists aren't handled by Mopidy service, and are
+    # expected to always be at the end of playlist lists
+    return (playlist.is_virtual, locale.strxfrm(playlist.name), playlist.uri)
 
 
 def compare_playlists_func(
@@ -11,26 +20,10 @@ def compare_playlists_func(
     b: "PlaylistModel",
     user_data: None,
 ) -> int:
-    # Virtual playlists aren't handled by Mopidy service, and are
-    # expected to always be at the end of playlist lists
-    if a.is_virtual and not b.is_virtual:
-        return 1
-    elif not a.is_virtual and b.is_virtual:
-        return -1
-
-    names_comp = locale.strcoll(a.name, b.name)
-    if names_comp != 0:
-        return names_comp
-
-    if a.uri < b.uri:
-        return -1
-    elif a.uri > b.uri:
-        return 1
-    # a.uri == b.uri
-    return 0
+    return compare_sort_keys(playlist_key(a), playlist_key(b))
 
 
-class PlaylistModel(GObject.Object):
+class PlaylistModel(WithCachedSortKeys, GObject.Object):
     """Model for a playlist."""
 
     uri = GObject.Property(type=str)
@@ -0,0 +1,310 @@
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Generator, Iterable
+
+import xdg.BaseDirectory  # type: ignore
+from gi.repository import GObject
+
+from argos.model.album import AlbumModel
+from argos.model.backends import MopidyBackend
+from argos.model.directory import DirectoryModel
+from argos.model.track import TrackModel
+
+LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+# Must be incremented each time the layout of snapshots changes,
+# snapshots with another version are ignored
+SNAPSHOT_COMPRESSION_LEVEL = 1
+# Snapshots are mostly made of repeated keys, the lowest level
+# already divides their size by 30 at a fraction of the cost of
+# higher levels
+DUMP_CHUNK_SIZE = 100
+# Number of albums dumped between two iterations of the main loop
+
+_DIRECTORY_PROPERTIES = ("uri", "name", "image_path", "image_uri")
+_ALBUM_PROPERTIES = (
+    "uri",
+    "name",
+    "image_path",
+    "image_uri",
+    "artist_name",
+    "num_tracks",
+    "num_discs",
+    "date",
+    "last_modified",
+    "length",
+    "release_mbid",
+)
+_TRACK_PROPERTIES = (
+    "uri",
+    "name",
+    "track_no",
+    "disc_no",
+    "length",
+    "album_name",
+    "artist_name",
+    "last_modified",
+    "image_path",
+    "image_uri",
+)
+
+
+@dataclass
+class RestoredDirectory:
+    """Content of a directory restored from a snapshot.
+
+    Sub-directories are empty directory models, their content is
+    restored by following restored directories.
+
+    """
+
+    uri: str
+    albums: list[AlbumModel]
+    directories: list[DirectoryModel]
+    tracks: list[TrackModel]
+
+
+@dataclass
+class RestoredLibrary:
+    """Library restored from a snapshot."""
+
+    directories: list[RestoredDirectory]
+    # parents before their children
+
+    synced_at: dict[str, float]
+    # time of last synchronization of directories with the Mopidy
+    # server, by directory URI
+
+
+def _property_defaults(
+    cls: type[GObject.Object], names: Iterable[str]
+) -> dict[str, Any]:
+    return {name: cls.find_property(name).default_value for name in names}
+
+
+_DIRECTORY_DEFAULTS = _property_defaults(DirectoryModel, _DIRECTORY_PROPERTIES)
+_ALBUM_DEFAULTS = _property_defaults(AlbumModel, _ALBUM_PROPERTIES)
+_TRACK_DEFAULTS = _property_defaults(TrackModel, _TRACK_PROPERTIES)
+
+
+def _dump_properties(model: Any, defaults: dict[str, Any]) -> dict[str, Any]:
+    # properties with their default value are omitted, it makes
+    # snapshots smaller and models faster to restore
+    dump = {}
+    for name, default in defaults.items():
+        value = getattr(model, name)
+        if value != default:
+            dump[name] = value
+    return dump
+
+
+def iter_dump_directory(
+    directory: DirectoryModel,
+) -> Generator[None, None, dict[str, Any]]:
+    """Dump the content of a directory, recursively.
+
+    Must be run from the main thread. The generator yields every
+    ``DUMP_CHUNK_SIZE`` albums so that the main loop can be iterated
+    while a large library is dumped, the returned data is plain and
+    can be serialized from another thread.
+
+    """
+    albums: list[dict[str, Any]] = []
+    for album in list(directory.albums):
+        albums.append(
+            {
+                **_dump_properties(album, _ALBUM_DEFAULTS),
+                "backend": album.backend.props.name,
+                "tracks": [_dump_properties(t, _TRACK_DEFAULTS) for t in album.tracks],
+            }
+        )
+        if len(albums) % DUMP_CHUNK_SIZE == 0:
+            yield
+
+    directories: list[dict[str, Any]] = []
+    for subdir in list(directory.directories):
+        directories.append((yield from iter_dump_directory(subdir)))
+
+    return {
+        **_dump_properties(directory, _DIRECTORY_DEFAULTS),
+        "albums": albums,
+        "directories": directories,
+        "tracks": [_dump_properties(t, _TRACK_DEFAULTS) for t in directory.tracks],
+    }
+
+
+def dump_directory(directory: DirectoryModel) -> dict[str, Any]:
+    """Dump the content of a directory at once, see ``iter_dump_directory()``."""
+    steps = iter_dump_directory(directory)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def _load_properties(data: dict[str, Any], names: Iterable[str]) -> dict[str, Any]:
+    return {name: data[name] for name in names if name in data}
+
+
+def _load_directory(
+    data: dict[str, Any],
+    backends: dict[str, MopidyBackend],
+    restored: list[RestoredDirectory],
+) -> None:
+    albums: list[AlbumModel] = []
+    for album_data in data.get("albums", []):
+        backend = backends.get(album_data.get("backend"))
+        if backend is None:
+            LOGGER.debug(f"Unknown backend of album {album_data.get('uri')!r}")
+            continue
+
+        tracks = [
+            TrackModel(**_load_properties(track_data, _TRACK_PROPERTIES))
+            for track_data in album_data.get("tracks", [])
+        ]
+        albums.append(
+            AlbumModel(
+                backend=backend,
+                tracks=tracks,
+                **_load_properties(album_data, _ALBUM_PROPERTIES),
+            )
+        )
+
+    subdirs_data = data.get("directories", [])
+    directories = [
+        DirectoryModel(**_load_properties(subdir_data, _DIRECTORY_PROPERTIES))
+        for subdir_data in subdirs_data
+    ]
+    tracks = [
+        TrackModel(**_load_properties(track_data, _TRACK_PROPERTIES))
+        for track_data in data.get("tracks", [])
+    ]
+    if len(albums) > 0 or len(directories) > 0 or len(tracks) > 0:
+        restored.append(
+            RestoredDirectory(
+                uri=data.get("uri", ""),
+                albums=albums,
+                directories=directories,
+                tracks=tracks,
+            )
+        )
+
+    for subdir_data in subdirs_data:
+        _load_directory(subdir_data, backends, restored)
+
+
+class LibrarySnapshot:
+    """Snapshot of the library stored on disk.
+
+    Completed directories are saved to a versioned and compressed JSON
+    file in the cache directory, so that the library can be displayed
+    at startup before the Mopidy server answers. Snapshots taken for
+    another server are ignored.
+
+    """
+
+    def __init__(self, path: Path | None = None):
+        self._path = (
+            path
+            if path is not None
+            else Path(xdg.BaseDirectory.save_cache_path("argos")) / "library.json.gz"
+        )
+        self._lock = threading.Lock()
+
+    def save(
+        self,
+        base_url: str,
+        root: dict[str, Any],
+        synced_at: dict[str, float] | None = None,
+    ) -> None:
+        """Save a snapshot of the root directory.
+
+        Can be called from any thread, the snapshot file is replaced
+        atomically. The root directory is dumped by
+        ``dump_directory()``.
+
+        """
+        start = time.perf_counter()
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "base_url": base_url,
+            "saved_at": time.time(),
+            "synced_at": synced_at or {},
+            "root": root,
+        }
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        with self._lock:
+            try:
+                encoded = json.dumps(data, separators=(",", ":")).encode("utf-8")
+                tmp_path.write_bytes(
+                    gzip.compress(encoded, compresslevel=SNAPSHOT_COMPRESSION_LEVEL)
+                )
+                os.replace(tmp_path, self._path)
+            except (OSError, TypeError, ValueError) as error:
+                LOGGER.warning(f"Failed to save library snapshot, {error}")
+                return
+
+        LOGGER.debug(
+            f"Library snapshot saved in {time.perf_counter() - start:.3f}s "
+            f"to {str(self._path)!r}"
+        )
+
+    def load(
+        self, base_url: str, backends: Iterable[MopidyBackend]
+    ) -> RestoredLibrary | None:
+        """Load the snapshot of the library.
+
+        Returns:
+            The restored library, ``None`` if there's no usable
+            snapshot.
+
+        """
+        if not self._path.exists():
+            return None
+
+        start = time.perf_counter()
+        try:
+            with self._lock:
+                compressed = self._path.read_bytes()
+            data = json.loads(gzip.decompress(compressed))
+        except (OSError, EOFError, ValueError, zlib.error) as error:
+            LOGGER.warning(f"Failed to load library snapshot, {error}")
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            LOGGER.info("Ignoring library snapshot with unsupported version")
+            return None
+
+        if data.get("base_url") != base_url:
+            LOGGER.info("Ignoring library snapshot of another Mopidy server")
+            return None
+
+        restored: list[RestoredDirectory] = []
+        try:
+            _load_directory(
+                data["root"],
+                {backend.props.name: backend for backend in backends},
+                restored,
+            )
+            synced_at = {
+                str(uri): float(timestamp)
+                for uri, timestamp in data.get("synced_at", {}).items()
+            }
+        except (KeyError, TypeError, ValueError, AttributeError) as error:
+            LOGGER.warning(f"Unexpected content of library snapshot, {error}")
+            return None
+
+        LOGGER.debug(
+            f"Library snapshot with {len(restored)} directories loaded "
+            f"in {time.perf_counter() - start:.3f}s"
+        )
+        return RestoredLibrary(directories=restored, synced_at=synced_at)
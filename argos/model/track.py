@@ -1,8 +1,24 @@
 import locale
+from typing import Any
 
 from gi.repository import GObject
 
 from argos.dto import TrackDTO
+from argos.model.utils import WithCachedSortKeys, cached_sort_key, compare_sort_keys
+
+
+@cached_sort_key
+def track_key_by_name(track: "TrackModel") -> tuple[Any, ...]:
+    return (
+        locale.strxfrm(track.name),
+        locale.strxfrm(track.artist_name),
+        track.uri,
+    )
+
+
+@cached_sort_key
+def track_key_by_track_number(track: "TrackModel") -> tuple[Any, ...]:
+    return (track.track_no,) + track_key_by_name(track)
 
 
 def compare_tracks_by_name_func(
@@ -10,20 +26,7 @@ def compare_tracks_by_name_func(
     b: "TrackModel",
     user_data: None,
 ) -> int:
-    names_comp = locale.strcoll(a.name, b.name)
-    if names_comp != 0:
-        return names_comp
-
-    artist_names_comp = locale.strcoll(a.artist_name, b.artist_name)
-    if artist_names_comp != 0:
-        return artist_names_comp
-
-    if a.uri < b.uri:
-        return -1
-    elif a.uri > b.uri:
-        return 1
-
-    return 0
+    return compare_sort_keys(track_key_by_name(a), track_key_by_name(b))
 
 
 def compare_tracks_by_track_number_func(
@@ -31,15 +34,10 @@ def compare_tracks_by_track_number_func(
     b: "TrackModel",
     user_data: None,
 ) -> int:
-    if a.track_no < b.track_no:
-        return -1
-    elif a.track_no > b.track_no:
-        return 1
-
-    return compare_tracks_by_name_func(a, b, user_data)
+    return compare_sort_keys(track_key_by_track_number(a), track_key_by_track_number(b))
 
 
-class TrackModel(GObject.Object):
+class TrackModel(WithCachedSortKeys, GObject.Object):
     """Model for a track.
 
     Most properties are read-only.
@@ -1,9 +1,15 @@
+import difflib
+import logging
+from typing import Sequence
+
 from gi.repository import Gio, GObject
 
 from argos.dto import TlTrackDTO
 from argos.model.track import TrackModel
 from argos.model.utils import WithThreadSafePropertySetter
 
+LOGGER = logging.getLogger(__name__)
+
 
 class TracklistTrackModel(GObject.Object):
     """Model for a track in the tracklist."""
@@ -26,6 +32,9 @@ class TracklistModel(WithThreadSafePropertySetter, GObject.Object):
 
     Setters are provided to change properties from any thread.
 
+    Positions of tracks in the tracklist are indexed by tlid, the
+    index being maintained on changes of the tracks store.
+
     """
 
     consume = GObject.Property(type=bool, default=False)
@@ -40,6 +49,13 @@ class TracklistModel(WithThreadSafePropertySetter, GObject.Object):
         super().__init__(**kwargs)
         self.tracks = Gio.ListStore.new(TracklistTrackModel)
 
+        self._tlids: list[int] = []
+        self._positions: dict[int, int] | None = {}
+        # None means the index of positions must be rebuilt from
+        # self._tlids
+
+        self.tracks.connect("items-changed", self._on_tracks_changed)
+
     def set_consume(self, value: bool) -> None:
         self.set_property_in_gtk_thread("consume", value)
 
@@ -55,10 +71,57 @@ class TracklistModel(WithThreadSafePropertySetter, GObject.Object):
     def set_version(self, value: int) -> None:
         self.set_property_in_gtk_thread("version", value)
 
-    def get_tl_track(self, tlid: int) -> TracklistTrackModel | None:
-        for i in range(self.tracks.get_n_items()):
-            tl_track = self.tracks.get_item(i)
-            if tl_track.tlid == tlid:
-                return tl_track
+    def update_tracks(self, tl_tracks: Sequence[TracklistTrackModel]) -> None:
+        """Update tracks store to match given tracks.
 
-        return None
+        Changes are computed from tlids and applied with a few
+        splices, thus the tracks kept in the tracklist are not
+        replaced and the cost of an update is proportional to the
+        number of changes.
+
+        Must be called from the GTK thread.
+
+        """
+        tlids = [tl_track.tlid for tl_track in tl_tracks]
+        matcher = difflib.SequenceMatcher(None, self._tlids, tlids, autojunk=False)
+        opcodes = [op for op in matcher.get_opcodes() if op[0] != "equal"]
+        LOGGER.debug(f"Applying {len(opcodes)} changes to tracklist")
+
+        # apply changes from the end so that positions of the
+        # remaining changes are left unchanged
+        for _, i1, i2, j1, j2 in reversed(opcodes):
+            self.tracks.splice(i1, i2 - i1, list(tl_tracks[j1:j2]))
+
+    def get_position(self, tlid: int) -> int | None:
+        positions = self._positions
+        if positions is None:
+            positions = self._positions = {
+                tlid: position for position, tlid in enumerate(self._tlids)
+            }
+        return positions.get(tlid)
+
+    def get_tl_track(self, tlid: int) -> TracklistTrackModel | None:
+        position = self.get_position(tlid)
+        if position is None:
+            return None
+
+        return self.tracks.get_item(position)
+
+    def _on_tracks_changed(
+        self,
+        store: Gio.ListStore,
+        position: int,
+        removed: int,
+        added: int,
+    ) -> None:
+        added_tlids = [store.get_item(position + i).tlid for i in range(added)]
+        if position == len(self._tlids) and removed == 0:
+            if self._positions is not None:
+                for i, tlid in enumerate(added_tlids):
+                    self._positions[tlid] = position + i
+        elif position == 0 and removed == len(self._tlids) and added == 0:
+            self._positions = {}
+        else:
+            self._positions = None
+
+        self._tlids[position : position + removed] = added_tlids
@@ -1,9 +1,11 @@
+import bisect
 import contextlib
+import functools
 import logging
 from enum import IntEnum
-from typing import Any, ContextManager, Protocol
+from typing import Any, Callable, ContextManager, Protocol, Sequence, TypeVar
 
-from gi.repository import GLib
+from gi.repository import Gio, GLib
 
 LOGGER = logging.getLogger(__name__)
 
@@ -56,6 +58,70 @@ class WithThreadSafePropertySetter:
             LOGGER.debug(f"Property {name!r} already equal to {value!r}")
 
 
+def _clear_sort_keys(model: Any, _: Any) -> None:
+    model._sort_keys.clear()
+
+
+class WithCachedSortKeys:
+    """Mixin caching sort keys of a model.
+
+    Cached keys are cleared on any change of a property of the model.
+
+    """
+
+    def get_sort_key(self, key_func: Callable[[Any], Any]) -> Any:
+        sort_keys = self.__dict__.get("_sort_keys")
+        if sort_keys is None:
+            # no need to watch property changes of models that are
+            # never sorted
+            sort_keys = self.__dict__["_sort_keys"] = {}
+            self.connect("notify", _clear_sort_keys)  # type: ignore
+
+        sort_key = sort_keys.get(key_func)
+        if sort_key is None:
+            sort_key = sort_keys[key_func] = key_func(self)
+        return sort_key
+
+
+M = TypeVar("M", bound=WithCachedSortKeys)
+
+
+def cached_sort_key(key_func: Callable[[M], Any]) -> Callable[[M], Any]:
+    """Decorator caching the sort keys computed by ``key_func``."""
+
+    @functools.wraps(key_func)
+    def wrapper(model: M) -> Any:
+        return model.get_sort_key(key_func)
+
+    return wrapper
+
+
+def compare_sort_keys(a: Any, b: Any) -> int:
+    return (a > b) - (a < b)
+
+
+def insert_sorted(
+    store: Gio.ListStore, items: Sequence[M], sort_key: Callable[[M], Any]
+) -> None:
+    """Insert items in a store sorted by ``sort_key``.
+
+    Items inserted at the same position are inserted through a single
+    splice, thus emitting a single items-changed signal.
+
+    """
+    items = sorted(items, key=sort_key)
+    positions = [bisect.bisect_right(store, sort_key(i), key=sort_key) for i in items]
+    end = len(items)
+    while end > 0:
+        start = end - 1
+        while start > 0 and positions[start - 1] == positions[end - 1]:
+            start -= 1
+
+        # splicing from the end keeps positions of previous items valid
+        store.splice(positions[start], 0, items[start:end])
+        end = start
+
+
 class PlaybackState(IntEnum):
     UNKNOWN = 0
     PLAYING = 1
@@ -19,6 +19,10 @@ from argos.widgets.utils import default_image_pixbuf, scale_album_image
 
 LOGGER = logging.getLogger(__name__)
 
+_EXTENDED_STORE_UPDATE_INTERVAL = 500  # ms
+# Minimal interval between insertions of albums in the directory store
+# while the displayed directory is being extended
+
 
 class DirectoryStoreColumn(IntEnum):
     MARKUP = 0
@@ -62,6 +66,8 @@ class LibraryWindow(Gtk.Box):
         self._settings: Gio.Settings = application.props.settings
 
         self.props.directory_uri = self._model.library.props.default_uri
+        self._model.library.props.displayed_directory_uri = self.props.directory_uri
+        self.connect("notify::directory-uri", self._on_directory_uri_changed)
         self._home_parent_uris: list[str] = self._model.library.get_parent_uris(
             self.props.directory_uri
         )
@@ -75,6 +81,9 @@ class LibraryWindow(Gtk.Box):
 
         self.props.album_details_box = AlbumDetailsBox(application)
         self.library_stack.add_named(self.props.album_details_box, "album_details_page")
+        self.library_stack.connect(
+            "notify::visible-child-name", self._on_visible_page_changed
+        )
 
         self.props.tracks_view = TracksView(application)
         self.library_stack.add_named(self.props.tracks_view, "tracks_view_page")
@@ -105,6 +114,7 @@ class LibraryWindow(Gtk.Box):
                 model, directory_uri, context="directory-completed signal received"
             ),
         )
+        self._model.connect("directory-extended", self._on_directory_extended)
         self._model.connect(
             "albums-sorted",
             lambda model: self._update_store(
@@ -125,6 +135,11 @@ class LibraryWindow(Gtk.Box):
 
         self._ongoing_store_update = threading.Lock()
         self._abort_pixbufs_update = False
+        self._extended_store_update_source_id: int | None = None
+        self._store_directory_uri: str | None = None
+        self._store_album_uris: set[str] = set()
+        # directory and albums of the store, to only insert new albums
+        # when the displayed directory is extended
 
     def _init_default_images(self):
         self._default_images = {
@@ -252,10 +267,96 @@ class LibraryWindow(Gtk.Box):
                 LOGGER.warning(f"Invalid regular expression {pattern!r}")
         return True
 
+    def _on_directory_uri_changed(
+        self,
+        _1: GObject.GObject,
+        _2: GObject.GParamSpec,
+    ) -> None:
+        self._model.library.props.displayed_directory_uri = self.props.directory_uri
+
+    def _on_visible_page_changed(
+        self,
+        _1: GObject.GObject,
+        _2: GObject.GParamSpec,
+    ) -> None:
+        album_uri = (
+            self.props.album_details_box.props.uri
+            if self.library_stack.get_visible_child_name() == "album_details_page"
+            else ""
+        )
+        if self._model.library.props.displayed_album_uri != album_uri:
+            self._model.library.props.displayed_album_uri = album_uri
+
+    def _on_directory_extended(self, _1: Model, uri: str) -> None:
+        if uri != self.props.directory_uri:
+            return
+
+        if self._extended_store_update_source_id is None:
+            self._extended_store_update_source_id = GLib.timeout_add(
+                _EXTENDED_STORE_UPDATE_INTERVAL, self._update_extended_store
+            )
+
+    def _update_extended_store(self) -> bool:
+        self._extended_store_update_source_id = None
+
+        directory = self._model.get_directory(self.props.directory_uri)
+        if directory is None or directory.uri != self._store_directory_uri:
+            self._update_store(
+                self._model,
+                self.props.directory_uri,
+                context="directory-extended signal received",
+            )
+        else:
+            self._insert_extended_albums(directory)
+        return False
+
+    def _insert_extended_albums(self, directory: DirectoryModel) -> None:
+        """Insert albums missing from the store at their sorted position.
+
+        Albums come first in the store and in the same order as in the
+        directory, so an album position in the directory is its
+        position in the store once previous albums are inserted. Only
+        the images of inserted albums are fetched.
+
+        """
+        image_uris: list[str] = []
+        aborted = self._ongoing_store_update.locked()
+        if aborted:
+            self._abort_pixbufs_update = True
+            LOGGER.info("Pixbufs update thread has been requested to abort...")
+
+        with self._ongoing_store_update:
+            self._abort_pixbufs_update = False
+            store = self.props.filtered_directory_store.get_model()
+            for position, album in enumerate(directory.albums):
+                if album.uri in self._store_album_uris:
+                    continue
+
+                store.insert(
+                    position, self._build_store_item(album, DirectoryItemType.ALBUM)
+                )
+                self._store_album_uris.add(album.uri)
+                if album.image_uri:
+                    image_uris.append(album.image_uri)
+
+        LOGGER.debug(
+            f"Inserted {len(image_uris)} albums with image in directory store "
+            f"of directory {directory.name!r}"
+        )
+        if len(image_uris) > 0:
+            self._app.activate_action("fetch-images", GLib.Variant("as", image_uris))
+            # pixbufs are updated once images are downloaded
+        elif aborted:
+            self._update_store_pixbufs()
+
     def _update_store(self, _1: Model, uri: str | None = None, *, context: str) -> None:
         if uri is not None and uri != self.props.directory_uri:
             return
 
+        if self._extended_store_update_source_id is not None:
+            GLib.source_remove(self._extended_store_update_source_id)
+            self._extended_store_update_source_id = None
+
         directory = self._model.get_directory(self.props.directory_uri)
         if directory is None:
             LOGGER.warning("Library browser redirected to root directory")
@@ -267,6 +368,7 @@ class LibraryWindow(Gtk.Box):
         )
 
         if self._must_enter_tracks_view(directory):
+            self._store_directory_uri = None
             self.props.tracks_view.props.uri = directory.uri
             self.props.tracks_view.show_now()
             self.library_stack.set_visible_child_name("tracks_view_page")
@@ -283,6 +385,8 @@ class LibraryWindow(Gtk.Box):
                 self._abort_pixbufs_update = False
                 store = self.props.filtered_directory_store.get_model()
                 store.clear()
+                self._store_directory_uri = directory.uri
+                self._store_album_uris = {album.uri for album in directory.albums}
 
                 for source, item_type in [
                     (directory.albums, DirectoryItemType.ALBUM),
@@ -459,6 +563,8 @@ class LibraryWindow(Gtk.Box):
         LOGGER.debug(f"Selected {library_item_type.name!r} item with URI {uri!r}")
 
         if library_item_type == DirectoryItemType.ALBUM:
+            self._model.library.props.displayed_album_uri = uri
+            # set first since obsolete album descriptions aren't completed
             self._app.activate_action(
                 "complete-album-description", GLib.Variant("s", uri)
             )
@@ -24,6 +24,8 @@ class TracklistBox(Gtk.ListBox):
         self.bind_model(self._model.tracklist.tracks, self._create_tracklist_track_box)
         self.set_header_func(set_list_box_header_with_separator)
 
+        self._playing_tlid = self._model.playback.current_tl_track_tlid
+
         self.connect("row-activated", self._on_row_activated)
         self._model.playback.connect(
             "notify::current-tl-track-tlid", self._on_current_tl_track_tlid_changed
@@ -34,6 +36,7 @@ class TracklistBox(Gtk.ListBox):
         tl_track: TracklistTrackModel,
     ) -> Gtk.Widget:
         widget = TracklistTrackBox(self._app, tl_track=tl_track)
+        widget.playing_image.set_visible(tl_track.tlid == self._playing_tlid)
         return widget
 
     def _on_current_tl_track_tlid_changed(
@@ -41,14 +44,14 @@ class TracklistBox(Gtk.ListBox):
         _1: GObject.Object,
         _2: GObject.ParamSpec,
     ) -> None:
-        tlid = self._model.playback.current_tl_track_tlid
-        row_index = 0
-        row = self.get_row_at_index(row_index)
-        while row:
-            track_box = row.get_child()
-            track_box.playing_image.set_visible(tlid == track_box.props.tlid)
-            row_index += 1
-            row = self.get_row_at_index(row_index)
+        previous_tlid = self._playing_tlid
+        tlid = self._playing_tlid = self._model.playback.current_tl_track_tlid
+        for row_tlid in (previous_tlid, tlid):
+            position = self._model.tracklist.get_position(row_tlid)
+            row = self.get_row_at_index(position) if position is not None else None
+            if row is not None:
+                track_box = row.get_child()
+                track_box.playing_image.set_visible(tlid == track_box.props.tlid)
 
     def _on_row_activated(
         self,
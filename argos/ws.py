@@ -2,7 +2,9 @@ import asyncio
 import collections.abc
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Callable
+import random
+import time
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 from urllib.parse import urljoin
 
 import aiohttp
@@ -11,6 +13,12 @@ from gi.repository import Gio, GObject
 if TYPE_CHECKING:
     from argos.app import Application
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+from argos.metrics import CommandMetrics, CommandOutcome
 from argos.model import Model
 from argos.session import HTTPSessionManager
 
@@ -19,18 +27,54 @@ LOGGER = logging.getLogger(__name__)
 COMMAND_TIMEOUT: int = 10  # s
 CLOSE_TIMEOUT: int = 10  # s
 CONSECUTIVE_SEND_FAILURE_THRESHOLD = 5
+INITIAL_CONNECTION_RETRY_DELAY = 0.2  # s
+MAX_REPLAYED_COMMANDS = 64
 
 _COMMAND_ID: int = 0
 
+_READ_ONLY_METHODS = (
+    "core.library.browse",
+    "core.library.lookup",
+    "core.library.search",
+    "core.playlists.as_list",
+    "core.playlists.lookup",
+)
+
+
+def is_read_only_command(method: str) -> bool:
+    """Tell whether a JSON-RPC method leaves the server state unchanged."""
+    return method in _READ_ONLY_METHODS or method.rpartition(".")[2].startswith("get_")
+
+
+def decode_json(data: str) -> Any:
+    """Decode a JSON string.
+
+    The ``orjson`` decoder is used when available, since it's much
+    faster than the decoder of the standard library.
+
+    """
+    if orjson is not None:
+        return orjson.loads(data)
 
-def parse_msg(msg: aiohttp.WSMessage) -> dict[str, Any]:
+    return json.loads(data)
+
+
+def parse_data(data: str) -> dict[str, Any] | list[dict[str, Any]]:
     try:
-        return msg.json()
-    except json.JSONDecodeError:
-        LOGGER.error(f"Failed to decode JSON string {msg.data!r}")
+        return decode_json(data)
+    except ValueError:
+        LOGGER.error(f"Failed to decode JSON string {data!r}")
         return {}
 
 
+def parse_msg(msg: aiohttp.WSMessage) -> dict[str, Any] | list[dict[str, Any]]:
+    return parse_data(msg.data)
+
+
+def _is_event(parsed: dict[str, Any] | list[dict[str, Any]]) -> bool:
+    return isinstance(parsed, dict) and "event" in parsed
+
+
 class _URLUndefined(Exception):
     pass
 
@@ -61,13 +105,31 @@ class MopidyWSConnection(GObject.GObject):
         self._url = urljoin(mopidy_base_url, "/mopidy/ws") if mopidy_base_url else None
         settings.connect("changed::mopidy-base-url", self._on_mopidy_base_url_changed)
 
-        connection_retry_delay = settings.get_int("connection-retry-delay")
-        self._connection_retry_delay = connection_retry_delay
+        self._settings = settings
+        self._connection_retries = 0
         self._consecutive_send_failures = 0
 
         self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._connected = asyncio.Event()
+        self._waiting_command_count = 0
+        self._outage_deadline: float | None = None
+        # deadline shared by all commands issued while the connection
+        # is down, reset once the connection is established
         self._commands: dict[int, asyncio.Future] = {}
 
+        self._metrics = CommandMetrics()
+        self._responses: dict[int, tuple[float, int, bool]] = {}
+        # reception time, length and error status of responses, indexed
+        # by JSON-RPC identifiers
+
+        LOGGER.debug(
+            f"JSON decoder is {'orjson' if orjson is not None else 'json'} module"
+        )
+
+    @property
+    def metrics(self) -> CommandMetrics:
+        return self._metrics
+
     async def send_command(
         self,
         method: str,
@@ -85,62 +147,209 @@ class MopidyWSConnection(GObject.GObject):
         Returns:
             Result of the invoked method.
 
+        """
+        results = await self.send_commands([(method, params)], timeout=timeout)
+        return results[0]
+
+    async def send_commands(
+        self,
+        commands: Sequence[tuple[str, dict | None]],
+        *,
+        timeout: int | None = None,
+    ) -> list[Any | None]:
+        """Invoke JSON-RPC commands.
+
+        When more than one command is given, a JSON-RPC batch is sent,
+        thus all commands are sent in a single websocket frame; The
+        response array is then dispatched to each command.
+
+        Args:
+            commands: Methods to invoke with their optional parameters.
+
+            timeout: Timeout applied to the whole batch.
+
+        Returns:
+            Results of the invoked methods, in the order of
+            ``commands``. A result is ``None`` when the corresponding
+            command failed.
+
+        When the connection is down, commands are kept until the
+        connection is established again, but no longer than the
+        ``command-replay-deadline`` setting. The deadline is shared by
+        all commands issued during a connection loss: Once it's
+        exceeded, commands fail right away until the connection is
+        established again. Read-only commands interrupted by a
+        connection loss are sent again after reconnection, within the
+        same deadline.
+
+        """
+        loop = asyncio.get_running_loop()
+        replay_deadline = self._settings.get_int("command-replay-deadline")
+        deadline = loop.time() + replay_deadline
+        read_only = all(is_read_only_command(method) for method, _ in commands)
+        while True:
+            if not self._connected.is_set():
+                if self._outage_deadline is None:
+                    self._outage_deadline = loop.time() + replay_deadline
+
+                if not await self._wait_for_connection(
+                    min(deadline, self._outage_deadline), len(commands)
+                ):
+                    LOGGER.warning("Cannot send command!")
+                    return [None] * len(commands)
+            else:
+                self._outage_deadline = None
+
+            results, interrupted = await self._send_commands(commands, timeout=timeout)
+            if not interrupted or not read_only or loop.time() >= deadline:
+                return results
+
+            methods = ", ".join(method for method, _ in commands)
+            LOGGER.info(
+                f"Commands with methods {methods} interrupted by connection loss, "
+                "will send them again after reconnection"
+            )
+            await asyncio.sleep(INITIAL_CONNECTION_RETRY_DELAY)
+
+    async def _wait_for_connection(self, deadline: float, command_count: int) -> bool:
+        """Wait for connection to be established.
+
+        Returns:
+            Whether the connection has been established before the
+            deadline. Note that it's ``False`` when too many commands
+            are already waiting for connection.
+
+        """
+        delay = deadline - asyncio.get_running_loop().time()
+        if delay <= 0:
+            return False
+
+        if self._waiting_command_count + command_count > MAX_REPLAYED_COMMANDS:
+            LOGGER.warning("Too many commands waiting for connection")
+            return False
+
+        self._waiting_command_count += command_count
+        try:
+            await asyncio.wait_for(self._connected.wait(), delay)
+        except asyncio.exceptions.TimeoutError:
+            return False
+        finally:
+            self._waiting_command_count -= command_count
+
+        self._outage_deadline = None
+        return True
+
+    async def _send_commands(
+        self,
+        commands: Sequence[tuple[str, dict | None]],
+        *,
+        timeout: int | None = None,
+    ) -> tuple[list[Any | None], bool]:
+        """Send JSON-RPC commands.
+
+        Returns:
+            Results of the invoked methods and whether commands were
+            interrupted by a connection loss.
+
         """
         global _COMMAND_ID
 
         if not self._ws:
-            LOGGER.warning("Cannot send command!")
-            return None
-
-        _COMMAND_ID += 1
-        jsonrpc_id = _COMMAND_ID
+            return [None] * len(commands), True
 
         if timeout is None:
             timeout = COMMAND_TIMEOUT
 
-        data = {"jsonrpc": "2.0", "id": jsonrpc_id, "method": method}
-        if params is not None:
-            data["params"] = params
-
-        future: asyncio.Future = asyncio.Future()
-        self._commands[jsonrpc_id] = future
+        requests: list[str] = []
+        futures: dict[int, asyncio.Future] = {}
+        jsonrpc_methods: dict[int, str] = {}
+        for method, params in commands:
+            _COMMAND_ID += 1
+            jsonrpc_id = _COMMAND_ID
+
+            request: dict[str, Any] = {
+                "jsonrpc": "2.0",
+                "id": jsonrpc_id,
+                "method": method,
+            }
+            if params is not None:
+                request["params"] = params
+            encoded_request = json.dumps(request)
+            requests.append(encoded_request)
+            self._metrics.command_sent(method, len(encoded_request))
+
+            future: asyncio.Future = asyncio.Future()
+            self._commands[jsonrpc_id] = future
+            futures[jsonrpc_id] = future
+            jsonrpc_methods[jsonrpc_id] = method
+
+        methods = ", ".join(method for method, _ in commands)
+        jsonrpc_ids = ", ".join(str(jsonrpc_id) for jsonrpc_id in futures)
+        if len(requests) == 1:
+            LOGGER.debug(
+                f"Sending JSON-RPC command {jsonrpc_ids} with method {methods}"
+            )
+            data = requests[0]
+        else:
+            LOGGER.debug(
+                f"Sending JSON-RPC batch of commands {jsonrpc_ids} with methods {methods}"
+            )
+            data = f"[{','.join(requests)}]"
 
-        LOGGER.debug(f"Sending JSON-RPC command {jsonrpc_id} with method {method}")
+        sent_at = time.monotonic()
+        timed_out = False
         try:
             try:
-                await asyncio.wait_for(self._ws.send_json(data), timeout)
+                await asyncio.wait_for(self._ws.send_str(data), timeout)
             except ConnectionResetError:
                 LOGGER.warning(
-                    f"Connection reset while sending JSON-RPC command {jsonrpc_id}"
+                    f"Connection reset while sending JSON-RPC commands {jsonrpc_ids}"
                 )
-                future.cancel()
+                self._cancel_futures(futures)
             except asyncio.exceptions.TimeoutError:
                 LOGGER.warning(
                     f"Timeout {timeout}s exceeded while sending "
-                    f"JSON-RPC command {jsonrpc_id} with method {method}"
-                )
-                future.cancel()
-
-            try:
-                await asyncio.wait_for(future, timeout)
-            except asyncio.exceptions.TimeoutError:
-                LOGGER.warning(
-                    f"Timeout {timeout}s exceeded while waiting response of "
-                    f"JSON-RPC command {jsonrpc_id} with method {method}"
+                    f"JSON-RPC commands {jsonrpc_ids} with methods {methods}"
                 )
-                future.cancel()
-
-            result = future.result()
-
+                self._cancel_futures(futures)
+                timed_out = True
+
+            pending = [future for future in futures.values() if not future.done()]
+            if len(pending) > 0:
+                _, not_done = await asyncio.wait(pending, timeout=timeout)
+                if len(not_done) > 0:
+                    LOGGER.warning(
+                        f"Timeout {timeout}s exceeded while waiting response of "
+                        f"JSON-RPC commands {jsonrpc_ids} with methods {methods}"
+                    )
+                    self._cancel_futures(futures)
+                    timed_out = True
         except asyncio.exceptions.CancelledError:
-            LOGGER.debug(f"JSON-RPC command {jsonrpc_id} cancelled")
-            self._commands.pop(jsonrpc_id, None)
-            # the default None value must be provided since, if the
-            # future is cancelled due to network availability changed
-            # (see cancel_commands()), then it may have been removed
-            # from self._commands
-            result = None
+            LOGGER.debug(f"Sending of JSON-RPC commands {jsonrpc_ids} cancelled")
+            self._cancel_futures(futures)
+            for jsonrpc_id in futures:
+                self._commands.pop(jsonrpc_id, None)
+            self._record_outcomes(jsonrpc_methods, sent_at, timed_out=False)
+            raise
+
+        self._record_outcomes(jsonrpc_methods, sent_at, timed_out=timed_out)
+
+        results: list[Any | None] = []
+        failure = False
+        for jsonrpc_id, future in futures.items():
+            if future.cancelled():
+                LOGGER.debug(f"JSON-RPC command {jsonrpc_id} cancelled")
+                self._commands.pop(jsonrpc_id, None)
+                # the default None value must be provided since, if the
+                # future is cancelled due to network availability changed
+                # (see cancel_commands()), then it may have been removed
+                # from self._commands
+                results.append(None)
+                failure = True
+            else:
+                results.append(future.result())
 
+        if failure:
             self._consecutive_send_failures += 1
             if self._consecutive_send_failures >= CONSECUTIVE_SEND_FAILURE_THRESHOLD:
                 LOGGER.warning(
@@ -151,7 +360,31 @@ class MopidyWSConnection(GObject.GObject):
         else:
             self._consecutive_send_failures = 0
 
-        return result
+        return results, failure and not timed_out
+
+    def _record_outcomes(
+        self, jsonrpc_methods: dict[int, str], sent_at: float, *, timed_out: bool
+    ) -> None:
+        for jsonrpc_id, method in jsonrpc_methods.items():
+            response = self._responses.pop(jsonrpc_id, None)
+            if response is not None:
+                received_at, response_chars, error = response
+                self._metrics.command_done(
+                    method,
+                    CommandOutcome.ERROR if error else CommandOutcome.SUCCESS,
+                    latency=received_at - sent_at,
+                    response_chars=response_chars,
+                )
+            else:
+                self._metrics.command_done(
+                    method,
+                    CommandOutcome.TIMEOUT if timed_out else CommandOutcome.CANCELLED,
+                )
+
+    def _cancel_futures(self, futures: dict[int, asyncio.Future]) -> None:
+        for future in futures.values():
+            if not future.done():
+                future.cancel()
 
     def cancel_commands(self) -> None:
         for jsonrpc_id in list(self._commands.keys()):
@@ -173,6 +406,9 @@ class MopidyWSConnection(GObject.GObject):
                         assert self._ws
                         LOGGER.debug(f"Connected to mopidy websocket at {self._url}")
 
+                        self._connection_retries = 0
+                        self._outage_deadline = None
+                        self._connected.set()
                         self._model.set_property_in_gtk_thread("connected", True)
 
                         async for msg in self._ws:
@@ -194,10 +430,13 @@ class MopidyWSConnection(GObject.GObject):
                         aiohttp.client_exceptions.InvalidURL,
                         asyncio.exceptions.TimeoutError,
                     ) as error:
+                        self._connected.clear()
                         self._model.set_property_in_gtk_thread("connected", False)
 
                         self.cancel_commands()
 
+                        retry_delay = self._get_connection_retry_delay()
+
                         if isinstance(error, _WSClosed):
                             LOGGER.warning(
                                 "New connection to be established after connection closed"
@@ -208,45 +447,40 @@ class MopidyWSConnection(GObject.GObject):
                             )
                         else:
                             LOGGER.error(
-                                f"Connection error (retry in {self._connection_retry_delay}s): {error}"
+                                f"Connection error (retry in {retry_delay:.1f}s): {error}"
                             )
 
-                        await asyncio.sleep(self._connection_retry_delay)
+                        await asyncio.sleep(retry_delay)
         except asyncio.exceptions.CancelledError:
             LOGGER.debug("Won't listen to Mopidy websocket anymore")
 
+    def _get_connection_retry_delay(self) -> float:
+        """Compute delay before next connection try.
+
+        The delay grows exponentially with the number of consecutive
+        tries, starting from ``INITIAL_CONNECTION_RETRY_DELAY`` and
+        bounded by the ``connection-retry-delay`` setting. Random
+        jitter is applied to spread reconnections of clients.
+
+        """
+        max_delay = self._settings.get_int("connection-retry-delay")
+        delay = min(
+            max_delay, INITIAL_CONNECTION_RETRY_DELAY * 2**self._connection_retries
+        )
+        self._connection_retries += 1
+        return random.uniform(delay / 2, delay)
+
     async def _handle(self, msg: aiohttp.WSMessage) -> None:
         """Handle websocket message.
 
-        When ``msg`` is a text message, then it is parsed. If the
-        parsed message has an ``"event"`` key, then it is passed to
-        the event handler; Otherwise, it tries to identify a JSON-RPC
-        command the message is the response from.
+        When ``msg`` is a text message, then it is parsed and routed,
+        see ``_route()``.
 
         When ``msg`` isn't a text message, it simply logs.
 
         """
         if msg.type == aiohttp.WSMsgType.TEXT:
-            parsed = parse_msg(msg)
-            if "event" in parsed:
-                await self._event_handler(parsed)
-                return
-
-            jsonrpc_id = parsed.get("id") if "jsonrpc" in parsed else None
-            if jsonrpc_id:
-                future = self._commands.pop(jsonrpc_id, None)
-                # the default None value must be provided since, if
-                # the future is cancelled due to connection reset or
-                # timeout, then it may have been removed from
-                # self._commands
-                if future:
-                    LOGGER.debug(f"Received result of JSON-RPC command {jsonrpc_id}")
-                    future.set_result(parsed.get("result"))
-                    return
-                else:
-                    LOGGER.debug(f"Unknown JSON-RPC command {jsonrpc_id}")
-            else:
-                LOGGER.debug(f"Message without id nor event {parsed!r}")
+            await self._route(parse_msg(msg), len(msg.data))
 
         elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
             LOGGER.warning(f"Unexpected message {msg!r}")
@@ -254,6 +488,63 @@ class MopidyWSConnection(GObject.GObject):
         elif msg.type == aiohttp.WSMsgType.CLOSE:
             LOGGER.info(f"Close received with code {msg.data!r}, " f"{msg.extra!r}")
 
+    async def _route(
+        self, parsed: dict[str, Any] | list[dict[str, Any]], size: int
+    ) -> None:
+        """Route a parsed message.
+
+        If the parsed message has an ``"event"`` key, then it is
+        passed to the event handler; Otherwise, it tries to identify a
+        JSON-RPC command the message is the response from. A parsed
+        array is the response to a batch of commands, each of its item
+        is handled as a single response.
+
+        Args:
+            parsed: Parsed message.
+
+            size: Length of the message text; When the message is the
+                response to a batch of commands, it's evenly split
+                between the commands.
+
+        """
+        if isinstance(parsed, list):
+            for response in parsed:
+                self._resolve_command(response, size // max(1, len(parsed)))
+            return
+
+        if _is_event(parsed):
+            await self._event_handler(parsed)
+            return
+
+        self._resolve_command(parsed, size)
+
+    def _resolve_command(self, parsed: dict[str, Any], size: int = 0) -> None:
+        """Set result of the JSON-RPC command a parsed response is from."""
+        jsonrpc_id = (
+            parsed.get("id")
+            if isinstance(parsed, dict) and "jsonrpc" in parsed
+            else None
+        )
+        if jsonrpc_id:
+            future = self._commands.pop(jsonrpc_id, None)
+            # the default None value must be provided since, if
+            # the future is cancelled due to connection reset or
+            # timeout, then it may have been removed from
+            # self._commands
+            if future:
+                LOGGER.debug(f"Received result of JSON-RPC command {jsonrpc_id}")
+                if not future.done():
+                    self._responses[jsonrpc_id] = (
+                        time.monotonic(),
+                        size,
+                        "error" in parsed,
+                    )
+                    future.set_result(parsed.get("result"))
+            else:
+                LOGGER.debug(f"Unknown JSON-RPC command {jsonrpc_id}")
+        else:
+            LOGGER.debug(f"Message without id nor event {parsed!r}")
+
     def _on_mopidy_base_url_changed(
         self,
         settings: Gio.Settings,
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict
 
 if TYPE_CHECKING:
@@ -28,6 +29,34 @@ _WS_EVENT_TO_MESSAGE: Dict[str, MessageType] = {
 }
 
 
+@dataclass(frozen=True)
+class _CoalescingPolicy:
+    """Policy to coalesce a burst of events into the latest one.
+
+    An event is delayed until no other event of the same type is
+    received for ``delay`` seconds, but never more than ``max_delay``
+    seconds after the first event of the burst.
+
+    """
+
+    delay: float  # s
+    max_delay: float  # s
+
+
+_COALESCING_POLICIES: Dict[str, _CoalescingPolicy] = {
+    "tracklist_changed": _CoalescingPolicy(delay=0.2, max_delay=1.0),
+    "options_changed": _CoalescingPolicy(delay=0.1, max_delay=0.5),
+    "volume_changed": _CoalescingPolicy(delay=0.1, max_delay=0.3),
+}
+
+
+@dataclass
+class _PendingEvent:
+    message: Message
+    received_at: float
+    handle: asyncio.TimerHandle
+
+
 class MopidyWSEventHandler(GObject.Object):
     """Handle Mopidy events received through websocket.
 
@@ -37,6 +66,10 @@ class MopidyWSEventHandler(GObject.Object):
     The dispatch of message to their consumers is done by a dedicated task
     implemented in ``MessageDispatchTask``.
 
+    Events notifying a state change, like ``tracklist_changed``, are
+    coalesced: When such events are received in a burst, only the
+    latest is processed, see ``_COALESCING_POLICIES``.
+
     """
 
     def __init__(
@@ -45,13 +78,45 @@ class MopidyWSEventHandler(GObject.Object):
     ):
         super().__init__()
         self._message_queue: asyncio.Queue = application.message_queue
+        self._pending_events: Dict[str, _PendingEvent] = {}
 
     async def __call__(self, parsed_ws_msg: Dict[str, Any]) -> None:
         event = parsed_ws_msg.get("event")
         message_type = _WS_EVENT_TO_MESSAGE.get(event) if event else None
         if message_type:
             message = Message(message_type, parsed_ws_msg)
-            LOGGER.debug(f"Enqueuing message with type {message.type!r}")
-            await self._message_queue.put(message)
+            policy = _COALESCING_POLICIES.get(event) if event else None
+            if policy is not None and event is not None:
+                self._delay(event, message, policy)
+            else:
+                LOGGER.debug(f"Enqueuing message with type {message.type!r}")
+                await self._message_queue.put(message)
         else:
             LOGGER.debug(f"Unhandled event type {event!r}")
+
+    def _delay(self, event: str, message: Message, policy: _CoalescingPolicy) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        pending = self._pending_events.get(event)
+        if pending is None:
+            handle = loop.call_at(now + policy.delay, self._enqueue_pending, event)
+            self._pending_events[event] = _PendingEvent(message, now, handle)
+            return
+
+        LOGGER.debug(f"Coalescing event {event!r} with pending one")
+        pending.handle.cancel()
+        pending.message = message
+        pending.handle = loop.call_at(
+            min(now + policy.delay, pending.received_at + policy.max_delay),
+            self._enqueue_pending,
+            event,
+        )
+
+    def _enqueue_pending(self, event: str) -> None:
+        pending = self._pending_events.pop(event, None)
+        if pending is None:
+            return
+
+        message = pending.message
+        LOGGER.debug(f"Enqueuing message with type {message.type!r}")
+        self._message_queue.put_nowait(message)
@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from argos.controllers.albums import AlbumsController
+from argos.controllers.scheduler import LibraryWorkScheduler
+from argos.message import Message, MessageType
+from argos.model.album import AlbumModel
+from argos.model.backends import GenericBackend
+
+
+class TestAlbumsController(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        app = Mock()
+        app.library_work_scheduler = LibraryWorkScheduler(budget=1)
+        app.props.model.get_album = Mock(
+            side_effect=lambda uri: AlbumModel(
+                uri=uri, name=uri, backend=GenericBackend()
+            )
+        )
+        app.props.model.library.props.displayed_album_uri = "local:album:1"
+        self.app = app
+        self.controller = AlbumsController(app)
+
+    def _complete_album_description(self, album_uri: str) -> asyncio.Task:
+        return asyncio.create_task(
+            self.controller.complete_album_description(
+                Message(
+                    MessageType.COMPLETE_ALBUM_DESCRIPTION, {"album_uri": album_uri}
+                )
+            )
+        )
+
+    async def test_lookup_goes_through_scheduler(self):
+        self.app.props.http.lookup_library = AsyncMock(return_value={})
+
+        async with self.app.library_work_scheduler.slot("local:directory"):
+            task = self._complete_album_description("local:album:1")
+            await asyncio.sleep(0.01)
+            self.app.props.http.lookup_library.assert_not_called()
+
+        await task
+        self.app.props.http.lookup_library.assert_called_once_with(
+            ["local:album:1"], timeout=GenericBackend().props.timeout
+        )
+
+    async def test_obsolete_lookups_are_cancelled(self):
+        never = asyncio.Event()
+
+        async def lookup_library(uris, timeout=None):
+            await never.wait()
+
+        self.app.props.http.lookup_library = AsyncMock(side_effect=lookup_library)
+        tasks = [self._complete_album_description("local:album:1")]
+        await asyncio.sleep(0.01)
+
+        self.app.props.model.library.props.displayed_album_uri = "local:album:2"
+        tasks.append(self._complete_album_description("local:album:2"))
+        await asyncio.sleep(0.01)
+
+        self.controller._cancel_obsolete_lookups()
+        await asyncio.wait_for(tasks[0], timeout=1)
+        # the consumer returns once the lookup is cancelled
+
+        self.assertFalse(tasks[1].done())
+        self.app.props.model.complete_album_description.assert_not_called()
+
+        tasks[1].cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await tasks[1]
+
+    async def test_lookups_of_albums_no_longer_displayed_are_skipped(self):
+        self.app.props.http.lookup_library = AsyncMock(return_value={})
+        self.app.props.model.library.props.displayed_album_uri = "local:album:2"
+
+        await self._complete_album_description("local:album:1")
+
+        self.app.props.http.lookup_library.assert_not_called()
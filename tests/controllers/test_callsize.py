@@ -0,0 +1,144 @@
+import asyncio
+import json
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from argos.controllers.callsize import (
+    DEFAULT_CALL_SIZE,
+    MIN_CALL_SIZE,
+    CallSizeTuner,
+)
+from argos.controllers.utils import call_by_slice
+
+
+class TestCallSizeTuner(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.tmp_dir.name) / "call-sizes.json"
+        self.tuner = CallSizeTuner(self.path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_default_size(self):
+        policy = self.tuner.get_policy("Generic", "lookup_library")
+        self.assertEqual(policy.size, DEFAULT_CALL_SIZE)
+
+        policy = self.tuner.get_policy("Generic", "lookup_library", default_size=5)
+        self.assertEqual(policy.size, 5)
+
+    def test_grow_on_fast_calls(self):
+        policy = self.tuner.get_policy("Generic", "lookup_library")
+        policy.record(DEFAULT_CALL_SIZE, 0.1, {"a": [1, 2]})
+        self.assertGreater(policy.size, DEFAULT_CALL_SIZE)
+
+    def test_dont_grow_on_fast_calls_with_large_replies(self):
+        policy = self.tuner.get_policy("Generic", "lookup_library")
+        policy.record(DEFAULT_CALL_SIZE, 0.1, {"a": list(range(5000))})
+        self.assertEqual(policy.size, DEFAULT_CALL_SIZE)
+
+    def test_shrink_on_slow_or_failed_calls(self):
+        policy = self.tuner.get_policy("Generic", "lookup_library")
+        policy.record(DEFAULT_CALL_SIZE, 30, {"a": [1]})
+        self.assertEqual(policy.size, DEFAULT_CALL_SIZE // 2)
+
+        policy.record(DEFAULT_CALL_SIZE // 2, 60, None)
+        self.assertEqual(policy.size, DEFAULT_CALL_SIZE // 4)
+
+        for _ in range(10):
+            policy.record(policy.size, 60, None)
+        self.assertEqual(policy.size, MIN_CALL_SIZE)
+
+    def test_sizes_are_remembered(self):
+        policy = self.tuner.get_policy("Mopidy-Bandcamp", "lookup_library")
+        policy.record(DEFAULT_CALL_SIZE, 60, None)
+
+        with self.path.open() as fh:
+            self.assertDictEqual(
+                json.load(fh),
+                {
+                    "Mopidy-Bandcamp:lookup_library": {
+                        "size": DEFAULT_CALL_SIZE // 2,
+                        "initial_size": DEFAULT_CALL_SIZE,
+                    }
+                },
+            )
+
+        tuner = CallSizeTuner(self.path)
+        policy = tuner.get_policy("Mopidy-Bandcamp", "lookup_library")
+        self.assertEqual(policy.size, DEFAULT_CALL_SIZE // 2)
+        policy = tuner.get_policy("Generic", "lookup_library")
+        self.assertEqual(policy.size, DEFAULT_CALL_SIZE)
+
+    def test_sizes_are_forgotten_when_initial_size_changes(self):
+        policy = self.tuner.get_policy("Mopidy-Bandcamp", "lookup_library")
+        policy.record(DEFAULT_CALL_SIZE, 60, None)
+
+        tuner = CallSizeTuner(self.path)
+        policy = tuner.get_policy("Mopidy-Bandcamp", "lookup_library", default_size=8)
+        self.assertEqual(policy.size, 8)
+
+
+class TestCallBySliceWithPolicy(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.tmp_dir.name) / "call-sizes.json"
+        self.tuner = CallSizeTuner(self.path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    async def test_call_by_slice_with_growing_size(self):
+        call_sizes = []
+
+        async def func(params):
+            call_sizes.append(len(params))
+            return dict([(p, 1) for p in params])
+
+        params = [str(i) for i in range(100)]
+        policy = self.tuner.get_policy("Generic", "lookup_library", default_size=10)
+        results = await call_by_slice(func, params=params, call_size_policy=policy)
+        self.assertEqual(len(results), 100)
+        self.assertListEqual(call_sizes, [10, 15, 23, 35, 17])
+
+
+class TestCallSizeTunerWithLoop(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.tmp_dir.name) / "call-sizes.json"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    async def test_failures_while_disconnected_are_ignored(self):
+        tuner = CallSizeTuner(self.path, is_connected=lambda: False)
+        policy = tuner.get_policy("Generic", "lookup_library")
+        policy.record(DEFAULT_CALL_SIZE, 60, None)
+        self.assertEqual(policy.size, DEFAULT_CALL_SIZE)
+        self.assertFalse(self.path.exists())
+
+    async def test_sizes_are_saved_off_the_loop(self):
+        tuner = CallSizeTuner(self.path)
+        policy = tuner.get_policy("Generic", "lookup_library")
+        with patch("argos.controllers.callsize.SAVE_DELAY", 0):
+            policy.record(DEFAULT_CALL_SIZE, 60, None)
+            policy.record(DEFAULT_CALL_SIZE // 2, 60, None)
+            self.assertFalse(self.path.exists())
+
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if self.path.exists():
+                    break
+
+        with self.path.open() as fh:
+            self.assertDictEqual(
+                json.load(fh),
+                {
+                    "Generic:lookup_library": {
+                        "size": DEFAULT_CALL_SIZE // 4,
+                        "initial_size": DEFAULT_CALL_SIZE,
+                    }
+                },
+            )
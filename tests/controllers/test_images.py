@@ -16,7 +16,8 @@ class TestImagesController(unittest.IsolatedAsyncioTestCase):
                 "image_uris": [
                     "/local/b23fb74538aa914239bde443f7343632-220x220.jpeg",
                     "/local/b23fb74538aa914239bde443f7343633-220x220.jpeg",
-                ]
+                ],
+                "directory_uri": "local:directory",
             },
         )
         await controller.fetch_images(msg)
@@ -24,5 +25,6 @@ class TestImagesController(unittest.IsolatedAsyncioTestCase):
             [
                 "/local/b23fb74538aa914239bde443f7343632-220x220.jpeg",
                 "/local/b23fb74538aa914239bde443f7343633-220x220.jpeg",
-            ]
+            ],
+            directory_uri="local:directory",
         )
@@ -0,0 +1,479 @@
+import asyncio
+import pathlib
+import tempfile
+import time
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from argos.controllers.callsize import CallSizeTuner
+from argos.controllers.library import LibraryController
+from argos.controllers.scheduler import LibraryWorkScheduler
+from argos.dto import ImageDTO, RefDTO, RefType, TrackDTO
+from argos.message import Message, MessageType
+from argos.model.album import AlbumModel
+from argos.model.backends import GenericBackend
+from argos.model.directory import DirectoryModel
+from argos.model.library import MOPIDY_LOCAL_ALBUMS_URI
+from argos.model.snapshot import LibrarySnapshot, dump_directory
+from argos.model.track import TrackModel
+
+
+class TestLibraryController(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.backend = GenericBackend()
+
+        app = Mock()
+        app.call_size_tuner = CallSizeTuner(
+            pathlib.Path(self.tmp_dir.name) / "call-sizes.json"
+        )
+        app.library_work_scheduler = LibraryWorkScheduler()
+        app.props.model.backends = [self.backend]
+        app.props.settings.get_boolean = Mock(return_value=False)
+        app.props.http.get_images = AsyncMock(return_value={})
+        app.props.http.lookup_library = AsyncMock(return_value={})
+        self.app = app
+        self.controller = LibraryController(app)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _build_album(self, uri: str) -> AlbumModel:
+        return AlbumModel(
+            uri=uri,
+            name=uri,
+            backend=self.backend,
+            tracks=[TrackModel(uri=f"{uri}:track", name="Track")],
+        )
+
+    async def test_complete_directory_again_only_looks_up_new_albums(self):
+        uri = "local:directory?genre=Jazz&type=album"
+        directory = DirectoryModel(uri=uri, name="Albums")
+        kept_album = self._build_album("local:album:1")
+        directory.albums.append(kept_album)
+        directory.albums.append(self._build_album("local:album:2"))
+        self.app.props.model.get_directory = Mock(return_value=directory)
+        self.app.props.http.browse_library = AsyncMock(
+            return_value=[
+                RefDTO(type=RefType.ALBUM, uri="local:album:1", name="1"),
+                RefDTO(type=RefType.ALBUM, uri="local:album:3", name="3"),
+            ]
+        )
+
+        await self.controller._browse_directory(uri, force=True)
+
+        self.app.props.http.lookup_library.assert_called_once_with(
+            ["local:album:3"], timeout=60
+        )
+        self.app.props.http.get_images.assert_called_once_with(
+            ["local:album:3"], timeout=60
+        )
+
+        complete_directory = self.app.props.model.complete_directory
+        complete_directory.assert_called_once()
+        albums = complete_directory.call_args.kwargs["albums"]
+        self.assertListEqual(
+            [album.uri for album in albums], ["local:album:1", "local:album:3"]
+        )
+        self.assertIs(albums[0], kept_album)
+
+    def _prepare_local_albums_directory(self) -> DirectoryModel:
+        directory = DirectoryModel(uri=MOPIDY_LOCAL_ALBUMS_URI, name="Albums")
+        directory.albums.append(self._build_album("local:album:1"))
+        directory.albums.append(self._build_album("local:album:2"))
+        self.app.props.model.get_directory = Mock(return_value=directory)
+
+        async def browse_library(uri, timeout=None):
+            if uri == MOPIDY_LOCAL_ALBUMS_URI:
+                return [
+                    RefDTO(type=RefType.ALBUM, uri="local:album:1", name="1"),
+                    RefDTO(type=RefType.ALBUM, uri="local:album:2", name="2"),
+                ]
+            elif uri == "local:directory?max-age=604800&type=album":
+                return [RefDTO(type=RefType.ALBUM, uri="local:album:2", name="2")]
+            return None
+
+        self.app.props.http.browse_library = AsyncMock(side_effect=browse_library)
+        return directory
+
+    async def test_delta_synchronization_of_local_albums(self):
+        self._prepare_local_albums_directory()
+        self.controller._synced_at[MOPIDY_LOCAL_ALBUMS_URI] = time.time() - 3600
+
+        await self.controller._browse_directory(MOPIDY_LOCAL_ALBUMS_URI, force=True)
+
+        self.app.props.http.browse_library.assert_called_once_with(
+            "local:directory?max-age=604800&type=album", timeout=60
+        )
+        self.app.props.http.lookup_library.assert_called_once_with(
+            ["local:album:2"], timeout=60
+        )
+        albums = self.app.props.model.complete_directory.call_args.kwargs["albums"]
+        self.assertSetEqual(
+            {album.uri for album in albums}, {"local:album:1", "local:album:2"}
+        )
+        self.assertGreater(
+            self.controller._synced_at[MOPIDY_LOCAL_ALBUMS_URI], time.time() - 60
+        )
+
+    async def test_synchronization_of_local_albums_on_request(self):
+        self._prepare_local_albums_directory()
+        message = Message(
+            MessageType.BROWSE_DIRECTORY,
+            {"uri": MOPIDY_LOCAL_ALBUMS_URI, "sync": True},
+        )
+
+        await self.controller.browse_directory(message)
+        self.assertIsNone(self.controller._tasks.get(MOPIDY_LOCAL_ALBUMS_URI))
+
+        self.controller._synced_at[MOPIDY_LOCAL_ALBUMS_URI] = time.time() - 3600
+        await self.controller.browse_directory(message)
+        await self.controller._tasks[MOPIDY_LOCAL_ALBUMS_URI]
+
+        self.app.props.http.lookup_library.assert_called_once_with(
+            ["local:album:2"], timeout=60
+        )
+
+    async def test_full_synchronization_of_local_albums(self):
+        self._prepare_local_albums_directory()
+        self.controller._synced_at[MOPIDY_LOCAL_ALBUMS_URI] = time.time() - 3e6
+
+        await self.controller._browse_directory(MOPIDY_LOCAL_ALBUMS_URI, force=True)
+
+        self.app.props.http.lookup_library.assert_called_once_with(
+            ["local:album:1", "local:album:2"], timeout=60
+        )
+
+    async def test_albums_are_published_while_completing_directory(self):
+        uri = "local:directory?genre=Jazz&type=album"
+        directory = DirectoryModel(uri=uri, name="Jazz")
+        self.app.props.model.get_directory = Mock(return_value=directory)
+        self.app.props.http.browse_library = AsyncMock(
+            return_value=[
+                RefDTO(type=RefType.ALBUM, uri=f"local:album:{i}", name=str(i))
+                for i in range(50)
+            ]
+        )
+
+        async def lookup_library(uris, timeout=None):
+            return {uri: [] for uri in uris}
+
+        self.app.props.http.lookup_library = AsyncMock(side_effect=lookup_library)
+
+        await self.controller._browse_directory(uri)
+
+        extend_directory = self.app.props.model.extend_directory
+        published_uris = [
+            album.uri for c in extend_directory.call_args_list for album in c.args[1]
+        ]
+        self.assertGreater(extend_directory.call_count, 1)
+        self.assertListEqual(published_uris, [f"local:album:{i}" for i in range(50)])
+
+        albums = self.app.props.model.complete_directory.call_args.kwargs["albums"]
+        self.assertListEqual(
+            [album.uri for album in albums], [f"local:album:{i}" for i in range(50)]
+        )
+
+    async def test_background_preload_of_album_tracks(self):
+        self.app.props.settings.get_boolean = Mock(
+            side_effect=lambda key: key == "background-album-tracks-preload"
+        )
+        uri = "local:directory?genre=Jazz&type=album"
+        directory = DirectoryModel(uri=uri, name="Jazz")
+        self.app.props.model.get_directory = Mock(return_value=directory)
+        self.app.props.http.browse_library = AsyncMock(
+            return_value=[
+                RefDTO(type=RefType.ALBUM, uri=f"local:album:{i}", name=str(i))
+                for i in range(3)
+            ]
+        )
+
+        async def lookup_library(uris, timeout=None):
+            return {
+                uri: [
+                    TrackDTO.factory(
+                        {"__model__": "Track", "uri": f"{uri}:track", "name": "T"}
+                    )
+                ]
+                for uri in uris
+            }
+
+        self.app.props.http.lookup_library = AsyncMock(side_effect=lookup_library)
+
+        with patch.object(self.controller, "send_message") as send_message:
+            await self.controller._browse_directory(uri)
+
+            self.app.props.http.lookup_library.assert_not_called()
+            albums = self.app.props.model.complete_directory.call_args.kwargs["albums"]
+            self.assertListEqual([len(album.tracks) for album in albums], [0, 0, 0])
+            send_message.assert_called_once_with(MessageType.PRELOAD_ALBUM_TRACKS)
+
+            await self.controller.preload_album_tracks(
+                Message(MessageType.PRELOAD_ALBUM_TRACKS)
+            )
+
+        self.app.props.http.lookup_library.assert_called_once_with(
+            ["local:album:0", "local:album:1", "local:album:2"], timeout=60
+        )
+        complete_album_description = self.app.props.model.complete_album_description
+        self.assertEqual(complete_album_description.call_count, 3)
+        self.assertEqual(len(self.controller._album_tracks_to_preload), 0)
+
+    async def test_background_preload_is_resumed(self):
+        self.controller._album_tracks_to_preload["local:album:0"] = self.backend
+        self.app.props.http.lookup_library = AsyncMock(return_value=None)
+
+        with patch.object(self.controller, "send_message") as send_message:
+            self.controller._album_tracks_preloading = True
+            await self.controller.preload_album_tracks(
+                Message(MessageType.PRELOAD_ALBUM_TRACKS)
+            )
+            self.assertFalse(self.controller._album_tracks_preloading)
+            send_message.assert_not_called()
+
+            self.app.props.http.lookup_library = AsyncMock(return_value={})
+            await self.controller.preload_album_tracks(
+                Message(MessageType.PRELOAD_ALBUM_TRACKS, {"resume": True})
+            )
+            self.app.props.http.lookup_library.assert_called_once_with(
+                ["local:album:0"], timeout=60
+            )
+
+    async def test_images_and_tracks_are_fetched_concurrently(self):
+        uri = "local:directory?genre=Jazz&type=album"
+        directory = DirectoryModel(uri=uri, name="Jazz")
+        self.app.props.model.get_directory = Mock(return_value=directory)
+        self.app.props.http.browse_library = AsyncMock(
+            return_value=[
+                RefDTO(type=RefType.ALBUM, uri="local:album:1", name="1"),
+                RefDTO(type=RefType.TRACK, uri="local:track:1.mp3", name="1"),
+            ]
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def call(uris, timeout=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(in_flight, max_in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}
+
+        self.app.props.http.get_images = AsyncMock(side_effect=call)
+        self.app.props.http.lookup_library = AsyncMock(side_effect=call)
+
+        await self.controller._browse_directory(uri)
+
+        self.assertEqual(self.app.props.http.get_images.call_count, 2)
+        self.assertEqual(self.app.props.http.lookup_library.call_count, 2)
+        self.assertEqual(max_in_flight, 4)
+
+    async def test_images_and_tracks_failures_are_independent(self):
+        album_dtos = [
+            RefDTO(type=RefType.ALBUM, uri=f"local:album:{i}", name=str(i))
+            for i in range(40)
+        ]
+        failing_method = ""
+
+        async def get_images(uris, timeout=None):
+            if failing_method == "get_images":
+                return None
+            return {u: [ImageDTO.factory({"uri": f"/local/{u}.jpeg"})] for u in uris}
+
+        async def lookup_library(uris, timeout=None):
+            if failing_method == "lookup_library":
+                return None
+            return {
+                u: [TrackDTO.factory({"uri": f"{u}:track", "name": "Track"})]
+                for u in uris
+            }
+
+        self.app.props.http.get_images = AsyncMock(side_effect=get_images)
+        self.app.props.http.lookup_library = AsyncMock(side_effect=lookup_library)
+
+        failing_method = "lookup_library"
+        albums = await self.controller._complete_albums(
+            album_dtos, "local:directory?type=album", self.backend, notifier=None
+        )
+        self.assertTrue(all(album.image_uri for album in albums))
+        self.assertTrue(all(len(album.tracks) == 0 for album in albums))
+
+        failing_method = "get_images"
+        albums = await self.controller._complete_albums(
+            album_dtos, "local:directory?type=album", self.backend, notifier=None
+        )
+        self.assertTrue(all(not album.image_uri for album in albums))
+        self.assertTrue(all(len(album.tracks) == 1 for album in albums))
+
+    async def test_obsolete_browses_are_cancelled(self):
+        displayed_uri = "local:directory?genre=Rock&type=album"
+        partial_uri = "local:directory?genre=Jazz&type=album"
+        revalidated_uri = "local:directory?genre=Soul&type=album"
+        empty_uri = "local:directory?genre=Blues&type=album"
+        self.controller._publish_albums(
+            partial_uri, [self._build_album("local:album:1")]
+        )
+        self.controller._synced_at[revalidated_uri] = time.time()
+        self.app.props.model.library.props.displayed_directory_uri = displayed_uri
+        self.app.props.model.library.props.default_uri = ""
+
+        never = asyncio.Event()
+        tasks = {
+            uri: asyncio.create_task(never.wait())
+            for uri in (displayed_uri, partial_uri, revalidated_uri, empty_uri)
+        }
+        self.controller._tasks.update(tasks)
+
+        self.controller._cancel_obsolete_browses()
+        await asyncio.sleep(0)
+
+        self.assertFalse(tasks[displayed_uri].done())
+        self.assertTrue(tasks[partial_uri].cancelled())
+        self.assertTrue(tasks[empty_uri].cancelled())
+        self.assertTrue(tasks[revalidated_uri].cancelled())
+        self.assertSetEqual(
+            self.controller._stale_directory_uris, {partial_uri, revalidated_uri}
+        )
+        self.app.props.download.cancel_downloads.assert_called_once_with(
+            [partial_uri, revalidated_uri, empty_uri]
+        )
+
+        tasks[displayed_uri].cancel()
+
+    def test_backend_profiles_are_overridden_by_settings(self):
+        self.app.props.settings.get_value.return_value.unpack.return_value = {
+            "Generic": {"max-concurrency": 1, "timeout": 5}
+        }
+        self.controller._on_backend_profiles_changed(
+            self.app.props.settings, "backend-profiles"
+        )
+        self.assertEqual(self.backend.props.max_concurrency, 1)
+        self.assertEqual(self.backend.props.timeout, 5)
+        self.assertEqual(self.backend.props.call_size, 20)
+
+        self.app.props.settings.get_value.return_value.unpack.return_value = {}
+        self.controller._on_backend_profiles_changed(
+            self.app.props.settings, "backend-profiles"
+        )
+        self.assertEqual(self.backend.props.max_concurrency, 4)
+        self.assertEqual(self.backend.props.timeout, 60)
+
+    async def test_failed_calls_are_retried(self):
+        self.backend.props.retries = 1
+        self.backend.props.timeout = 30
+        self.app.props.http.lookup_library = AsyncMock(side_effect=[None, {}])
+
+        with patch("argos.controllers.base._RETRY_DELAY", 0):
+            result = await self.controller.schedule_library_call(
+                "local:directory",
+                self.backend,
+                self.app.props.http.lookup_library,
+                ["local:album:1"],
+            )
+
+        self.assertDictEqual(result, {})
+        self.assertEqual(self.app.props.http.lookup_library.call_count, 2)
+        self.app.props.http.lookup_library.assert_called_with(
+            ["local:album:1"], timeout=30
+        )
+
+    def test_directories_expire_after_cache_ttl(self):
+        uri = "local:directory?genre=Jazz&type=album"
+        directory = DirectoryModel(uri=uri, name="Jazz")
+        directory.albums.append(self._build_album("local:album:1"))
+        self.app.props.model.get_directory = Mock(return_value=directory)
+        self.controller._synced_at[uri] = time.time() - 7200
+
+        self.assertFalse(self.controller._is_expired(uri))
+
+        self.backend.props.cache_ttl = 3600
+        self.assertTrue(self.controller._is_expired(uri))
+
+        self.controller._synced_at[uri] = time.time()
+        self.assertFalse(self.controller._is_expired(uri))
+
+    async def test_restore_library_waits_for_model_update(self):
+        base_url = "http://127.0.0.1:6680"
+        self.app.props.settings.get_string = Mock(return_value=base_url)
+        snapshot = LibrarySnapshot(pathlib.Path(self.tmp_dir.name) / "library.json.gz")
+        root = DirectoryModel(uri="", name="root")
+        local = DirectoryModel(uri="local:directory", name="Local media")
+        root.directories.append(local)
+        local.albums.append(self._build_album("local:album:1"))
+        snapshot.save(base_url, dump_directory(root))
+        self.controller._snapshot = snapshot
+
+        await self.controller.restore_library(Message(MessageType.RESTORE_LIBRARY))
+
+        complete_directory = self.app.props.model.complete_directory
+        self.assertListEqual(
+            [c.args[0] for c in complete_directory.call_args_list],
+            ["", "local:directory"],
+        )
+        self.assertListEqual(
+            [
+                c.kwargs["wait_for_model_update"]
+                for c in complete_directory.call_args_list
+            ],
+            [False, True],
+        )
+
+    def test_snapshot_is_saved_once_outdated(self):
+        self.app.props.model.library.props.root_directory = DirectoryModel(
+            uri="", name="root"
+        )
+        self.controller._snapshot = Mock()
+        with (
+            patch("argos.controllers.library.GLib") as glib,
+            patch("argos.controllers.library.threading.Thread") as thread,
+        ):
+            self.controller._save_snapshot()
+            glib.idle_add.assert_not_called()
+
+            self.controller._on_album_completed(self.app.props.model, "local:album:1")
+            self.controller._save_snapshot()
+            glib.idle_add.assert_called_once()
+            dump_step, steps = glib.idle_add.call_args.args
+            while dump_step(steps):
+                pass
+            thread.assert_called_once()
+            self.assertEqual(thread.call_args.kwargs["args"][1]["name"], "root")
+
+            self.controller._save_snapshot()
+            glib.idle_add.assert_called_once()
+
+    async def test_albums_are_published_with_images_after_first_slice(self):
+        uri = "local:directory?genre=Jazz&type=album"
+        directory = DirectoryModel(uri=uri, name="Jazz")
+        self.app.props.model.get_directory = Mock(return_value=directory)
+        self.app.props.http.browse_library = AsyncMock(
+            return_value=[
+                RefDTO(type=RefType.ALBUM, uri=f"local:album:{i}", name=str(i))
+                for i in range(50)
+            ]
+        )
+        self.backend.props.max_concurrency = 1
+        events: list[str] = []
+
+        async def get_images(uris, timeout=None):
+            events.append("images")
+            return {
+                uri: [ImageDTO.factory({"uri": f"/local/{uri}.jpeg"})] for uri in uris
+            }
+
+        async def lookup_library(uris, timeout=None):
+            return {uri: [] for uri in uris}
+
+        def extend_directory(uri, albums):
+            events.append("published")
+            self.assertTrue(all(album.image_uri for album in albums))
+
+        self.app.props.http.get_images = AsyncMock(side_effect=get_images)
+        self.app.props.http.lookup_library = AsyncMock(side_effect=lookup_library)
+        self.app.props.model.extend_directory = Mock(side_effect=extend_directory)
+
+        await self.controller._browse_directory(uri)
+
+        self.assertGreater(events.count("images"), 1)
+        self.assertListEqual(events, ["images", "published"] * events.count("images"))
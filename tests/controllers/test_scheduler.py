@@ -0,0 +1,125 @@
+import asyncio
+import unittest
+
+from argos.controllers.scheduler import LibraryWorkScheduler
+
+
+class TestLibraryWorkScheduler(unittest.IsolatedAsyncioTestCase):
+    async def _run_calls(self, scheduler, keys):
+        served: list[str] = []
+        release = asyncio.Event()
+
+        async def call(key: str) -> None:
+            async with scheduler.slot(key):
+                served.append(key)
+                await release.wait()
+
+        async def blocker() -> None:
+            async with scheduler.slot("blocker"):
+                await release.wait()
+
+        blocking_task = asyncio.create_task(blocker())
+        await asyncio.sleep(0)
+
+        tasks = []
+        for key in keys:
+            tasks.append(asyncio.create_task(call(key)))
+            await asyncio.sleep(0)
+
+        self.assertEqual(scheduler.waiting, len(keys))
+        release.set()
+        await asyncio.gather(blocking_task, *tasks)
+        return served
+
+    async def test_budget_is_shared(self):
+        scheduler = LibraryWorkScheduler(budget=2)
+        max_in_flight = 0
+
+        async def call(key: str) -> None:
+            nonlocal max_in_flight
+            async with scheduler.slot(key):
+                max_in_flight = max(max_in_flight, scheduler.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call(key) for key in ("a", "a", "b", "c", "c")))
+        self.assertEqual(max_in_flight, 2)
+        self.assertEqual(scheduler.in_flight, 0)
+
+    async def test_directories_are_served_in_turn(self):
+        scheduler = LibraryWorkScheduler(budget=1)
+        served = await self._run_calls(scheduler, ["a", "a", "a", "b", "c"])
+        self.assertListEqual(served, ["a", "b", "c", "a", "a"])
+
+    async def test_prioritized_directory_is_served_first(self):
+        scheduler = LibraryWorkScheduler(budget=1, get_prioritized_keys=lambda: ("c",))
+        served = await self._run_calls(scheduler, ["a", "b", "c", "a", "c"])
+        self.assertListEqual(served, ["c", "c", "a", "b", "a"])
+
+    async def test_prioritized_keys_are_served_in_order(self):
+        scheduler = LibraryWorkScheduler(
+            budget=1, get_prioritized_keys=lambda: ("album", "", "c")
+        )
+        served = await self._run_calls(scheduler, ["a", "c", "album", "c"])
+        self.assertListEqual(served, ["album", "c", "c", "a"])
+
+    async def test_low_priority_calls_are_served_last(self):
+        scheduler = LibraryWorkScheduler(budget=1)
+        served: list[str] = []
+        release = asyncio.Event()
+
+        async def call(key: str, low_priority: bool) -> None:
+            async with scheduler.slot(key, low_priority=low_priority):
+                served.append(key)
+                await release.wait()
+
+        tasks = [asyncio.create_task(call("blocker", False))]
+        await asyncio.sleep(0)
+        for key, low_priority in [("preload", True), ("a", False), ("b", False)]:
+            tasks.append(asyncio.create_task(call(key, low_priority)))
+            await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertListEqual(served, ["blocker", "a", "b", "preload"])
+
+    async def test_cancelled_calls_release_their_turn(self):
+        scheduler = LibraryWorkScheduler(budget=1)
+        release = asyncio.Event()
+
+        async def call(key: str) -> None:
+            async with scheduler.slot(key):
+                await release.wait()
+
+        first = asyncio.create_task(call("a"))
+        second = asyncio.create_task(call("b"))
+        third = asyncio.create_task(call("c"))
+        await asyncio.sleep(0)
+        self.assertEqual(scheduler.waiting, 2)
+
+        second.cancel()
+        await asyncio.sleep(0)
+        self.assertEqual(scheduler.waiting, 1)
+
+        release.set()
+        await asyncio.gather(first, third)
+        self.assertEqual(scheduler.in_flight, 0)
+        self.assertEqual(scheduler.waiting, 0)
+
+    async def test_group_budget_leaves_slots_to_other_groups(self):
+        scheduler = LibraryWorkScheduler(budget=2)
+        release = asyncio.Event()
+
+        async def slow_call() -> None:
+            async with scheduler.slot("slow", group="slow", group_budget=1):
+                await release.wait()
+
+        slow_tasks = [asyncio.create_task(slow_call()) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.assertEqual(scheduler.in_flight, 1)
+
+        async with scheduler.slot("fast", group="fast", group_budget=1):
+            self.assertEqual(scheduler.in_flight, 2)
+
+        release.set()
+        await asyncio.gather(*slow_tasks)
+        self.assertEqual(scheduler.in_flight, 0)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import pathlib
 import unittest
@@ -74,6 +75,61 @@ class TestCallBySlice(unittest.IsolatedAsyncioTestCase):
         results = await call_by_slice(func, params=params, call_size=2)
         self.assertDictEqual(results, {"a": 1, "b": 1})
 
+    async def test_call_by_slice_concurrently(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def func(param):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(in_flight, max_in_flight)
+            await asyncio.sleep(0.01 if "a" in param else 0)
+            in_flight -= 1
+            return dict([(p, param[0]) for p in param])
+
+        params = ["a", "b", "c", "d", "e", "f"]
+        notifier = Mock()
+        results = await call_by_slice(
+            func, params=params, call_size=2, max_concurrency=3, notifier=notifier
+        )
+        self.assertDictEqual(
+            results, {"a": "a", "b": "a", "c": "c", "d": "c", "e": "e", "f": "e"}
+        )
+        self.assertEqual(max_in_flight, 3)
+        notifier.assert_has_calls([call(2), call(4), call(6)])
+
+    async def test_call_by_slice_concurrently_with_none(self):
+        async def func(param):
+            if "c" in param:
+                return None
+
+            return dict([(p, 1) for p in param])
+
+        params = ["a", "b", "c", "d", "e", "f"]
+        results = await call_by_slice(
+            func, params=params, call_size=2, max_concurrency=3
+        )
+        self.assertDictEqual(results, {"a": 1, "b": 1})
+
+    async def test_call_by_slice_with_on_result(self):
+        async def func(param):
+            await asyncio.sleep(0.01 if "a" in param else 0)
+            if "e" in param:
+                return None
+
+            return dict([(p, param[0]) for p in param])
+
+        params = ["a", "b", "c", "d", "e", "f", "g", "h"]
+        on_result = Mock()
+        results = await call_by_slice(
+            func, params=params, call_size=2, max_concurrency=4, on_result=on_result
+        )
+        self.assertDictEqual(results, {"a": "a", "b": "a", "c": "c", "d": "c"})
+        self.assertListEqual(
+            on_result.call_args_list,
+            [call({"a": "a", "b": "a"}), call({"c": "c", "d": "c"})],
+        )
+
 
 class TestParseTracks(unittest.TestCase):
     def test_parse_tracks(self):
@@ -0,0 +1,92 @@
+import unittest
+
+from argos.model.album import AlbumModel
+from argos.model.backends import GenericBackend
+from argos.model.directory import DirectoryModel
+from argos.model.library import LibraryModel
+from argos.model.track import TrackModel
+
+
+class TestLibraryModel(unittest.TestCase):
+    def setUp(self):
+        self.library = LibraryModel()
+        self.root = self.library.props.root_directory
+
+    def tearDown(self):
+        self.library.forget_directory_content(self.root)
+        self.root.directories.remove_all()
+
+    def _build_directory(self) -> DirectoryModel:
+        backend = GenericBackend()
+        directory = DirectoryModel(uri="local:directory", name="Local media")
+        album = AlbumModel(
+            uri="local:album:1",
+            name="Album",
+            backend=backend,
+            tracks=[TrackModel(uri="local:track:1.mp3", name="Track")],
+        )
+        directory.albums.append(album)
+        directory.tracks.append(TrackModel(uri="local:track:2.mp3", name="Track"))
+        return directory
+
+    def test_get_root_directory(self):
+        self.assertEqual(self.library.get_directory(""), self.root)
+        self.assertIsNone(self.library.get_directory(None))
+
+    def test_register_directory_content(self):
+        directory = self._build_directory()
+        self.root.directories.append(directory)
+        self.library.register_directory_content(self.root)
+
+        self.assertEqual(self.library.get_directory("local:directory"), directory)
+        self.assertEqual(self.library.get_album("local:album:1").uri, "local:album:1")
+        self.assertEqual(
+            self.library.get_track("local:track:1.mp3").uri, "local:track:1.mp3"
+        )
+        self.assertEqual(
+            self.library.get_track("local:track:2.mp3").uri, "local:track:2.mp3"
+        )
+        self.assertIsNone(self.library.get_track("local:track:3.mp3"))
+
+    def test_forget_directory_content(self):
+        directory = self._build_directory()
+        self.root.directories.append(directory)
+        self.library.register_directory_content(self.root)
+        self.library.forget_directory_content(self.root)
+
+        self.assertIsNone(self.library.get_directory("local:directory"))
+        self.assertIsNone(self.library.get_album("local:album:1"))
+        self.assertIsNone(self.library.get_track("local:track:1.mp3"))
+
+    def test_album_tracks(self):
+        directory = self._build_directory()
+        self.root.directories.append(directory)
+        self.library.register_directory_content(self.root)
+
+        album = self.library.get_album("local:album:1")
+        self.library.forget_album_tracks(album)
+        album.tracks.remove_all()
+        album.tracks.append(TrackModel(uri="local:track:3.mp3", name="Track"))
+        self.library.register_album_tracks(album)
+
+        self.assertIsNone(self.library.get_track("local:track:1.mp3"))
+        self.assertEqual(
+            self.library.get_track("local:track:3.mp3").uri, "local:track:3.mp3"
+        )
+
+    def test_same_uri_in_several_directories(self):
+        first = self._build_directory()
+        second = self._build_directory()
+        second.uri = "local:directory?type=album"
+        self.root.directories.append(first)
+        self.root.directories.append(second)
+        self.library.register_directory_content(self.root)
+
+        self.assertEqual(
+            self.library.get_album("local:album:1"), first.albums.get_item(0)
+        )
+
+        self.library.forget_directory_content(first)
+        self.assertEqual(
+            self.library.get_album("local:album:1"), second.albums.get_item(0)
+        )
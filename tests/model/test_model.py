@@ -0,0 +1,35 @@
+import unittest
+from unittest.mock import Mock
+
+from argos.model import Model, PlaylistModel
+
+
+class TestModelPlaylists(unittest.TestCase):
+    def setUp(self):
+        self.model = Model(Mock())
+        self.model._update_playlists(
+            [
+                PlaylistModel(uri="m3u:b.m3u8", name="B"),
+                PlaylistModel(uri="m3u:a.m3u8", name="A"),
+                PlaylistModel(uri="m3u:c.m3u8", name="C"),
+            ]
+        )
+
+    def test_get_playlist(self):
+        playlist = self.model.get_playlist("m3u:a.m3u8")
+        self.assertEqual(playlist.name, "A")
+        self.assertIsNone(self.model.get_playlist("m3u:d.m3u8"))
+
+    def test_delete_playlist(self):
+        self.model._delete_playlist("m3u:a.m3u8")
+        self.assertIsNone(self.model.get_playlist("m3u:a.m3u8"))
+        self.assertListEqual([p.name for p in self.model.playlists], ["B", "C"])
+
+    def test_ambiguous_playlist_uri(self):
+        with self.assertLogs("argos", "WARNING"):
+            self.model._insert_playlist(PlaylistModel(uri="m3u:a.m3u8", name="A'"))
+
+        self.model._delete_playlist("m3u:a.m3u8")
+        playlist = self.model.get_playlist("m3u:a.m3u8")
+        self.assertIsNotNone(playlist)
+        self.assertEqual(len(self.model.playlists), 3)
@@ -0,0 +1,114 @@
+import gzip
+import json
+import pathlib
+import tempfile
+import unittest
+
+from argos.model.album import AlbumModel
+from argos.model.backends import GenericBackend, MopidyBandcampBackend
+from argos.model.directory import DirectoryModel
+from argos.model.snapshot import LibrarySnapshot, dump_directory
+from argos.model.track import TrackModel
+
+BASE_URL = "http://127.0.0.1:6680"
+
+
+class TestLibrarySnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.tmp_dir.name) / "library.json.gz"
+        self.snapshot = LibrarySnapshot(self.path)
+        self.backends = [MopidyBandcampBackend(), GenericBackend()]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _build_root(self) -> DirectoryModel:
+        root = DirectoryModel(uri="", name="root")
+        local = DirectoryModel(uri="local:directory", name="Local media")
+        albums = DirectoryModel(uri="local:directory?type=album", name="Albums")
+        artists = DirectoryModel(uri="local:directory?type=artist", name="Artists")
+        root.directories.append(local)
+        local.directories.append(albums)
+        local.directories.append(artists)
+
+        albums.albums.append(
+            AlbumModel(
+                uri="local:album:1",
+                name="Album",
+                backend=self.backends[1],
+                image_path="/tmp/album.jpg",
+                artist_name="Artist",
+                num_tracks=2,
+                last_modified=1700000000.0,
+                tracks=[
+                    TrackModel(uri="local:track:1.mp3", name="First", track_no=1),
+                    TrackModel(uri="local:track:2.mp3", name="Second", track_no=2),
+                ],
+            )
+        )
+        return root
+
+    def test_round_trip(self):
+        self.snapshot.save(
+            BASE_URL,
+            dump_directory(self._build_root()),
+            {"local:directory?type=album": 1700000000.0},
+        )
+
+        library = self.snapshot.load(BASE_URL, self.backends)
+        self.assertDictEqual(
+            library.synced_at, {"local:directory?type=album": 1700000000.0}
+        )
+        restored = library.directories
+
+        self.assertListEqual(
+            [d.uri for d in restored],
+            ["", "local:directory", "local:directory?type=album"],
+        )
+        self.assertListEqual(
+            [d.uri for d in restored[1].directories],
+            ["local:directory?type=album", "local:directory?type=artist"],
+        )
+        self.assertFalse(restored[1].directories[0].is_complete())
+
+        album = restored[2].albums[0]
+        self.assertEqual(album.uri, "local:album:1")
+        self.assertEqual(album.artist_name, "Artist")
+        self.assertEqual(album.image_path, "/tmp/album.jpg")
+        self.assertEqual(album.num_tracks, 2)
+        self.assertEqual(album.last_modified, 1700000000.0)
+        self.assertEqual(album.backend, self.backends[1])
+        self.assertListEqual([t.track_no for t in album.tracks], [1, 2])
+        self.assertListEqual(
+            [t.uri for t in album.tracks], ["local:track:1.mp3", "local:track:2.mp3"]
+        )
+
+    def test_default_values_are_omitted(self):
+        root = dump_directory(self._build_root())
+
+        album = root["directories"][0]["directories"][0]["albums"][0]
+        self.assertNotIn("image_uri", album)
+        self.assertDictEqual(
+            album["tracks"][0],
+            {"uri": "local:track:1.mp3", "name": "First", "track_no": 1},
+        )
+
+    def test_ignore_snapshot_of_another_server(self):
+        self.snapshot.save(BASE_URL, dump_directory(self._build_root()))
+
+        self.assertIsNone(self.snapshot.load("http://192.168.1.2:6680", self.backends))
+
+    def test_ignore_snapshot_with_other_version(self):
+        with gzip.open(self.path, "wt") as fh:
+            json.dump({"version": 0, "base_url": BASE_URL, "root": {}}, fh)
+
+        self.assertIsNone(self.snapshot.load(BASE_URL, self.backends))
+
+    def test_ignore_corrupted_snapshot(self):
+        self.path.write_bytes(b"not a snapshot")
+
+        self.assertIsNone(self.snapshot.load(BASE_URL, self.backends))
+
+    def test_missing_snapshot(self):
+        self.assertIsNone(self.snapshot.load(BASE_URL, self.backends))
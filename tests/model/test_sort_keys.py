@@ -0,0 +1,151 @@
+import functools
+import locale
+import unittest
+
+from gi.repository import Gio
+
+from argos.model.album import (
+    AlbumModel,
+    album_key_by_artist_name,
+    album_key_by_last_modified_date_reversed,
+    album_key_by_name,
+    album_key_by_publication_date,
+    compare_albums_by_artist_name_func,
+    compare_albums_by_last_modified_date_reversed_func,
+    compare_albums_by_name_func,
+    compare_albums_by_publication_date_func,
+)
+from argos.model.directory import (
+    DirectoryModel,
+    compare_directories_func,
+    directory_key,
+)
+from argos.model.playlist import PlaylistModel, compare_playlists_func, playlist_key
+from argos.model.track import (
+    TrackModel,
+    compare_tracks_by_name_func,
+    compare_tracks_by_track_number_func,
+    track_key_by_name,
+    track_key_by_track_number,
+)
+from argos.model.utils import insert_sorted
+
+
+def sorted_with_compare_func(items, compare_func):
+    return sorted(
+        items, key=functools.cmp_to_key(lambda a, b: compare_func(a, b, None))
+    )
+
+
+class TestSortKeys(unittest.TestCase):
+    def assertSameOrder(self, items, key, compare_func):
+        self.assertListEqual(
+            [item.uri for item in sorted(items, key=key)],
+            [item.uri for item in sorted_with_compare_func(items, compare_func)],
+        )
+
+    def test_album_keys(self):
+        albums = [
+            AlbumModel(
+                uri=f"local:album:{i}",
+                name=name,
+                artist_name=artist_name,
+                date=date,
+                last_modified=last_modified,
+            )
+            for i, (name, artist_name, date, last_modified) in enumerate(
+                [
+                    ("Blue", "Joni Mitchell", "1971", 10),
+                    ("Court and Spark", "Joni Mitchell", "1974", 30),
+                    ("Blue", "Miles Davis", "1959", 20),
+                    ("Kind of Blue", "Miles Davis", "1959", 20),
+                    ("Blue", "Joni Mitchell", "1971", 10),
+                ]
+            )
+        ]
+        for key, compare_func in [
+            (album_key_by_name, compare_albums_by_name_func),
+            (album_key_by_artist_name, compare_albums_by_artist_name_func),
+            (
+                album_key_by_last_modified_date_reversed,
+                compare_albums_by_last_modified_date_reversed_func,
+            ),
+            (album_key_by_publication_date, compare_albums_by_publication_date_func),
+        ]:
+            with self.subTest(key=key.__name__):
+                self.assertSameOrder(albums, key, compare_func)
+
+    def test_track_keys(self):
+        tracks = [
+            TrackModel(
+                uri=f"local:track:{i}", name=name, artist_name=artist, track_no=no
+            )
+            for i, (name, artist, no) in enumerate(
+                [
+                    ("So What", "Miles Davis", 1),
+                    ("Blue", "Joni", 2),
+                    ("Blue", "Joni", 1),
+                ]
+            )
+        ]
+        for key, compare_func in [
+            (track_key_by_name, compare_tracks_by_name_func),
+            (track_key_by_track_number, compare_tracks_by_track_number_func),
+        ]:
+            with self.subTest(key=key.__name__):
+                self.assertSameOrder(tracks, key, compare_func)
+
+    def test_directory_and_playlist_keys(self):
+        directories = [
+            DirectoryModel(uri=f"local:directory:{i}", name=name)
+            for i, name in enumerate(["Jazz", "Folk", "Jazz"])
+        ]
+        self.assertSameOrder(directories, directory_key, compare_directories_func)
+
+        playlists = [
+            PlaylistModel(uri="argos:recent", name="Recent"),
+            PlaylistModel(uri="m3u:b.m3u8", name="B"),
+            PlaylistModel(uri="m3u:a.m3u8", name="A"),
+        ]
+        self.assertSameOrder(playlists, playlist_key, compare_playlists_func)
+
+    def test_cached_keys_are_cleared_on_change(self):
+        album = AlbumModel(uri="local:album:1", name="Blue", artist_name="Joni")
+        key = album_key_by_name(album)
+        self.assertIs(album_key_by_name(album), key)
+
+        album.artist_name = "Joni Mitchell"
+        self.assertEqual(album_key_by_name(album)[1], locale.strxfrm("Joni Mitchell"))
+
+    def test_sort_albums(self):
+        directory = DirectoryModel(uri="local:directory", name="Local")
+        for name in ("C", "A", "B"):
+            directory.albums.append(AlbumModel(uri=f"local:album:{name}", name=name))
+
+        directory.sort_albums(album_key_by_name)
+        self.assertListEqual([a.name for a in directory.albums], ["A", "B", "C"])
+
+    def test_insert_sorted(self):
+        store = Gio.ListStore.new(AlbumModel)
+        insert_sorted(
+            store,
+            [AlbumModel(uri=f"local:album:{n}", name=n) for n in ("D", "B", "F")],
+            album_key_by_name,
+        )
+
+        items_changed = []
+        store.connect(
+            "items-changed",
+            lambda _, position, removed, added: items_changed.append(
+                (position, removed, added)
+            ),
+        )
+        insert_sorted(
+            store,
+            [AlbumModel(uri=f"local:album:{n}", name=n) for n in ("G", "A", "C", "E")],
+            album_key_by_name,
+        )
+        self.assertListEqual(
+            [a.name for a in store], ["A", "B", "C", "D", "E", "F", "G"]
+        )
+        self.assertEqual(len(items_changed), 4)
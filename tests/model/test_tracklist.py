@@ -0,0 +1,57 @@
+import unittest
+
+from argos.model import TrackModel
+from argos.model.tracklist import TracklistModel, TracklistTrackModel
+
+
+def build_tl_track(tlid: int) -> TracklistTrackModel:
+    track = TrackModel(uri=f"local:track:{tlid}.mp3", name=f"Track {tlid}")
+    return TracklistTrackModel(tlid=tlid, track=track)
+
+
+class TestTracklistModel(unittest.TestCase):
+    def setUp(self):
+        self.tracklist = TracklistModel()
+        for tlid in range(1, 6):
+            self.tracklist.tracks.append(build_tl_track(tlid))
+
+    def test_get_tl_track(self):
+        self.assertEqual(self.tracklist.get_tl_track(3).tlid, 3)
+        self.assertEqual(self.tracklist.get_position(3), 2)
+        self.assertIsNone(self.tracklist.get_tl_track(10))
+
+    def test_positions_after_insertion_and_removal(self):
+        self.tracklist.tracks.insert(0, build_tl_track(10))
+        self.tracklist.tracks.remove(3)
+        self.assertListEqual(
+            [self.tracklist.get_position(tlid) for tlid in (10, 1, 2, 3, 4, 5)],
+            [0, 1, 2, None, 3, 4],
+        )
+
+    def test_positions_after_reload(self):
+        self.tracklist.tracks.remove_all()
+        self.assertIsNone(self.tracklist.get_position(1))
+
+        self.tracklist.tracks.splice(0, 0, [build_tl_track(7), build_tl_track(8)])
+        self.assertEqual(self.tracklist.get_position(8), 1)
+
+    def test_update_tracks(self):
+        changes = []
+        self.tracklist.tracks.connect(
+            "items-changed",
+            lambda _, position, removed, added: changes.append(
+                (position, removed, added)
+            ),
+        )
+        kept = self.tracklist.get_tl_track(2)
+
+        self.tracklist.update_tracks(
+            [build_tl_track(tlid) for tlid in (1, 2, 6, 4, 5, 7)]
+        )
+
+        self.assertListEqual(
+            [tl_track.tlid for tl_track in self.tracklist.tracks], [1, 2, 6, 4, 5, 7]
+        )
+        self.assertListEqual(changes, [(5, 0, 1), (2, 1, 1)])
+        self.assertIs(self.tracklist.get_tl_track(2), kept)
+        self.assertEqual(self.tracklist.get_position(7), 5)
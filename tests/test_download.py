@@ -91,6 +91,52 @@ class TestImageDownloader(unittest.IsolatedAsyncioTestCase):
 
         self.assertTrue(str(image_path).endswith(expected_image_path_end))
 
+    async def test_cancel_downloads(self):
+        app = Mock()
+        app.props.settings.get_string.return_value = "https://a.mopidy.server"
+        # get_string is the way to get mopidy-base-url setting
+
+        downloader = ImageDownloader(app)
+        never = asyncio.Event()
+
+        async def fetch_image(image_uri):
+            await never.wait()
+
+        downloader.fetch_image = AsyncMock(side_effect=fetch_image)
+
+        with patch.object(pathlib.Path, "exists", lambda p: False):
+            await downloader.fetch_images(
+                ["/local/image.jpeg"], directory_uri="local:directory"
+            )
+            await downloader.fetch_images(
+                ["/local/image.jpeg", "/local/other.jpeg"],
+                directory_uri="local:directory",
+            )
+            await downloader.fetch_images(
+                ["/local/kept.jpeg"], directory_uri="local:directory?type=album"
+            )
+            tasks = list(downloader._ongoing_tasks)
+            await asyncio.sleep(0)
+
+        self.assertEqual(len(tasks), 3)
+        self.assertListEqual(
+            [c.args[0] for c in downloader.fetch_image.call_args_list],
+            ["/local/image.jpeg", "/local/other.jpeg", "/local/kept.jpeg"],
+        )
+        # pending images aren't requested twice, previous downloads
+        # go on
+
+        downloader.cancel_downloads(["local:directory"])
+        for task in tasks[:2]:
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        self.assertListEqual(list(downloader._ongoing_tasks), tasks[2:])
+        self.assertSetEqual(downloader._pending_image_uris, {"/local/kept.jpeg"})
+        # downloads of other directories go on
+
+        tasks[2].cancel()
+
 
 class TestImageDownloaderWithTestServer(AioHTTPTestCase):
     async def asyncSetUp(self):
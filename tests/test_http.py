@@ -112,7 +112,7 @@ class TestMopidyHTTPClient(unittest.IsolatedAsyncioTestCase):
         ]
         images = await self.client.get_images(uris)
         self.app.props.ws.send_command.assert_called_once_with(
-            "core.library.get_images", params={"uris": uris}
+            "core.library.get_images", params={"uris": uris}, timeout=None
         )
         self.assertEqual([k for k in images.keys()], uris)
 
@@ -346,3 +346,94 @@ class TestMopidyHTTPClient(unittest.IsolatedAsyncioTestCase):
             "core.history.get_history", timeout=60
         )
         self.assertEqual(len(history), 617)
+
+    # Tests on batches
+    async def test_batch(self):
+        self.app.props.ws.send_commands.return_value = ["playing", 1000]
+        async with self.client.batch():
+            state, time_position = await asyncio.gather(
+                self.client.get_state(), self.client.get_time_position()
+            )
+        self.app.props.ws.send_commands.assert_called_once_with(
+            [
+                ("core.playback.get_state", None),
+                ("core.playback.get_time_position", None),
+            ],
+            timeout=None,
+        )
+        self.app.props.ws.send_command.assert_not_called()
+        self.assertEqual(state, "playing")
+        self.assertEqual(time_position, 1000)
+
+    async def test_batch_with_sequential_commands(self):
+        self.app.props.ws.send_commands.side_effect = [["playing"], [False]]
+        async with self.client.batch():
+            state = await self.client.get_state()
+            mute = await self.client.get_mute()
+        self.app.props.ws.send_commands.assert_has_calls(
+            [
+                call([("core.playback.get_state", None)], timeout=None),
+                call([("core.mixer.get_mute", None)], timeout=None),
+            ]
+        )
+        self.assertEqual(state, "playing")
+        self.assertEqual(mute, False)
+
+    async def test_batch_failure(self):
+        self.app.props.ws.send_commands.side_effect = ConnectionError()
+        async with self.client.batch():
+            results = await asyncio.gather(
+                self.client.get_state(),
+                self.client.get_time_position(),
+                return_exceptions=True,
+            )
+        self.assertIsInstance(results[0], ConnectionError)
+        self.assertIsInstance(results[1], ConnectionError)
+
+        self.app.props.ws.send_command.side_effect = ConnectionError()
+        with self.assertRaises(ConnectionError):
+            await self.client.get_state()
+
+    async def test_concurrent_identical_commands_are_shared(self):
+        async def lookup(method, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"uri": []}
+
+        self.app.props.ws.send_command.side_effect = lookup
+        results = await asyncio.gather(
+            self.client.lookup_library(["uri"]),
+            self.client.lookup_library(["uri"]),
+            self.client.lookup_library(["other_uri"]),
+        )
+        self.assertEqual(self.app.props.ws.send_command.await_count, 2)
+        self.assertEqual(results[0], results[1])
+
+        await self.client.lookup_library(["uri"])
+        self.assertEqual(self.app.props.ws.send_command.await_count, 3)
+
+    async def test_concurrent_commands_changing_state_are_not_shared(self):
+        await asyncio.gather(self.client.pause(), self.client.pause())
+        self.assertEqual(self.app.props.ws.send_command.await_count, 2)
+
+    async def test_shared_command_cancelled_with_last_caller(self):
+        cancelled = asyncio.Event()
+
+        async def get_state(method, **kwargs):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        self.app.props.ws.send_command.side_effect = get_state
+        first = asyncio.create_task(self.client.get_state())
+        second = asyncio.create_task(self.client.get_state())
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        self.assertFalse(cancelled.is_set())
+
+        second.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        self.assertEqual(self.app.props.ws.send_command.await_count, 1)
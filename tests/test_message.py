@@ -5,7 +5,13 @@ import pathlib
 import unittest
 from unittest.mock import Mock
 
-from argos.message import Message, MessageDispatchTask, MessageType, consume
+from argos.message import (
+    Message,
+    MessageDispatchTask,
+    MessageQueue,
+    MessageType,
+    consume,
+)
 
 
 def load_json_data(filename: str):
@@ -24,6 +30,18 @@ class TrackPlaybackStartedMessageCounter:
         self.counter += 1
 
 
+class AlbumDescriptionCompleter:
+    def __init__(self):
+        self.events = []
+
+    @consume(MessageType.COMPLETE_ALBUM_DESCRIPTION, concurrent=True, key="album_uri")
+    async def complete(self, msg):
+        album_uri = msg.data["album_uri"]
+        self.events.append(("start", album_uri))
+        await asyncio.sleep(0.01)
+        self.events.append(("end", album_uri))
+
+
 class TestMessageDispatchTask(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self.loop = asyncio.get_event_loop()
@@ -78,3 +96,54 @@ class TestMessageDispatchTask(unittest.IsolatedAsyncioTestCase):
 
         self.assertTrue(len(logs.output), 2)
         self.assertTrue(app.message_queue.empty())
+
+    async def test_dispatcher_with_concurrent_consumer(self):
+        app = Mock()
+        app.message_queue = asyncio.Queue()
+        consumer = AlbumDescriptionCompleter()
+        app.props.controllers = [consumer]
+
+        dispatcher = MessageDispatchTask(app)
+        self.task = self.loop.create_task(dispatcher())
+
+        for album_uri in ("a", "b", "a"):
+            await app.message_queue.put(
+                Message(
+                    MessageType.COMPLETE_ALBUM_DESCRIPTION, {"album_uri": album_uri}
+                )
+            )
+
+        await asyncio.sleep(0.1)
+
+        events = consumer.events
+        self.assertEqual(len(events), 6)
+        self.assertLess(events.index(("start", "b")), events.index(("end", "a")))
+        second_start = events.index(("start", "a"), 1)
+        self.assertLess(events.index(("end", "a")), second_start)
+
+
+class TestMessageQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_priorities(self):
+        queue = MessageQueue()
+        queue.put_nowait(Message(MessageType.FETCH_IMAGES, {"id": 1}))
+        queue.put_nowait(Message(MessageType.BROWSE_DIRECTORY, {"id": 2}))
+        queue.put_nowait(Message(MessageType.FETCH_IMAGES, {"id": 3}))
+        queue.put_nowait(Message(MessageType.TRACKLIST_CHANGED, {"id": 4}))
+        queue.put_nowait(Message(MessageType.TOGGLE_PLAYBACK_STATE, {"id": 5}))
+
+        ids = [(await queue.get()).data["id"] for _ in range(queue.qsize())]
+        self.assertListEqual(ids, [5, 4, 2, 1, 3])
+
+    async def test_stats(self):
+        queue = MessageQueue()
+        queue.put_nowait(Message(MessageType.FETCH_IMAGES))
+        queue.put_nowait(Message(MessageType.FETCH_IMAGES))
+        await queue.get()
+
+        stats = queue.stats()
+        self.assertEqual(stats["depth"], 1)
+        background_stats = stats["priorities"]["background"]
+        self.assertEqual(background_stats["depth"], 1)
+        self.assertEqual(background_stats["max_depth"], 2)
+        self.assertEqual(background_stats["count"], 1)
+        self.assertIsNone(stats["priorities"]["interactive"]["mean_wait_time"])
@@ -0,0 +1,60 @@
+import unittest
+
+from argos.metrics import LATENCY_BUCKETS, CommandMetrics, CommandOutcome
+
+
+class TestCommandMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = CommandMetrics()
+
+    def test_in_flight(self):
+        self.metrics.command_sent("core.library.browse", 100)
+        self.metrics.command_sent("core.library.lookup", 200)
+        self.assertEqual(self.metrics.in_flight, 2)
+
+        self.metrics.command_done(
+            "core.library.browse", CommandOutcome.SUCCESS, latency=0.2
+        )
+        self.assertEqual(self.metrics.in_flight, 1)
+
+    def test_outcomes(self):
+        method = "core.library.lookup"
+        for outcome in CommandOutcome:
+            self.metrics.command_sent(method, 10)
+
+        self.metrics.command_done(
+            method, CommandOutcome.SUCCESS, latency=0.02, response_chars=1000
+        )
+        self.metrics.command_done(
+            method, CommandOutcome.ERROR, latency=30, response_chars=50
+        )
+        self.metrics.command_done(method, CommandOutcome.TIMEOUT)
+        self.metrics.command_done(method, CommandOutcome.CANCELLED)
+
+        metrics = self.metrics.get(method)
+        self.assertEqual(metrics.calls, 4)
+        self.assertEqual(metrics.failures, 3)
+        self.assertEqual(metrics.errors, 1)
+        self.assertEqual(metrics.timeouts, 1)
+        self.assertEqual(metrics.cancellations, 1)
+        self.assertEqual(metrics.in_flight, 0)
+        self.assertEqual(metrics.request_chars, 40)
+        self.assertEqual(metrics.response_chars, 1050)
+        self.assertEqual(metrics.max_latency, 30)
+        self.assertAlmostEqual(metrics.mean_latency, 15.01)
+
+        expected_histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        expected_histogram[1] = 1
+        expected_histogram[-1] = 1
+        self.assertListEqual(metrics.latency_histogram, expected_histogram)
+
+    def test_snapshot(self):
+        self.metrics.command_sent("core.playback.get_state", 60)
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["in_flight"], 1)
+        self.assertEqual(
+            snapshot["methods"]["core.playback.get_state"]["request_chars"], 60
+        )
+        self.assertIsNone(
+            snapshot["methods"]["core.playback.get_state"]["mean_latency"]
+        )
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+import aiohttp
+
+from argos.ws import INITIAL_CONNECTION_RETRY_DELAY, MopidyWSConnection, parse_data
+
+
+def text_message(data) -> aiohttp.WSMessage:
+    return aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, json.dumps(data), None)
+
+
+class TestMopidyWSConnection(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.app = Mock()
+        self.app.props.settings.get_string.return_value = ""
+        self.app.props.settings.get_int.return_value = 5
+        self.app.props.ws_event_handler = AsyncMock()
+        self.ws = MopidyWSConnection(self.app)
+
+    def test_parse_data(self):
+        self.assertEqual(
+            parse_data('{"id": 1, "result": null}'), {"id": 1, "result": None}
+        )
+        self.assertEqual(parse_data('[{"id": 1}]'), [{"id": 1}])
+        self.assertEqual(parse_data("{"), {})
+
+    async def test_events_are_routed(self):
+        event = {"event": "volume_changed", "volume": 50}
+        await self.ws._handle(text_message(event))
+        self.app.props.ws_event_handler.assert_awaited_once_with(event)
+
+    async def test_batch_response_is_resolved(self):
+        futures = [asyncio.get_running_loop().create_future() for _ in range(2)]
+        self.ws._commands[1], self.ws._commands[2] = futures
+
+        await self.ws._handle(
+            text_message(
+                [
+                    {"jsonrpc": "2.0", "id": 2, "result": False},
+                    {"jsonrpc": "2.0", "id": 1, "result": ["x"]},
+                ]
+            )
+        )
+
+        self.assertListEqual(futures[0].result(), ["x"])
+        self.assertFalse(futures[1].result())
+
+    async def test_metrics_are_recorded(self):
+        async def reply(data):
+            for request in json.loads(data):
+                response = {"jsonrpc": "2.0", "id": request["id"]}
+                if request["method"] == "core.library.browse":
+                    response["error"] = {"code": -32603}
+                else:
+                    response["result"] = "ok"
+                asyncio.create_task(self.ws._handle(text_message(response)))
+
+        self.ws._ws = AsyncMock()
+        self.ws._connected.set()
+        self.ws._ws.send_str.side_effect = reply
+
+        results = await self.ws.send_commands(
+            [("core.playback.get_state", None), ("core.library.browse", {"uri": None})]
+        )
+        self.assertListEqual(results, ["ok", None])
+
+        snapshot = self.ws.metrics.snapshot()
+        self.assertEqual(snapshot["in_flight"], 0)
+        state_metrics = snapshot["methods"]["core.playback.get_state"]
+        self.assertEqual(state_metrics["calls"], 1)
+        self.assertEqual(state_metrics["failures"], 0)
+        self.assertGreater(state_metrics["request_chars"], 0)
+        self.assertGreater(state_metrics["response_chars"], 0)
+        browse_metrics = snapshot["methods"]["core.library.browse"]
+        self.assertEqual(browse_metrics["errors"], 1)
+
+    def _reply_with(self, result):
+        async def reply(data):
+            request = json.loads(data)
+            response = {"jsonrpc": "2.0", "id": request["id"], "result": result}
+            asyncio.create_task(self.ws._handle(text_message(response)))
+
+        return reply
+
+    async def test_command_sent_once_connected(self):
+        self.ws._ws = AsyncMock()
+        self.ws._ws.send_str.side_effect = self._reply_with("playing")
+
+        task = asyncio.create_task(self.ws.send_command("core.playback.get_state"))
+        await asyncio.sleep(0.01)
+        self.ws._ws.send_str.assert_not_called()
+
+        self.ws._connected.set()
+        self.assertEqual(await asyncio.wait_for(task, timeout=1), "playing")
+
+    async def test_command_dropped_after_replay_deadline(self):
+        self.app.props.settings.get_int.return_value = 0
+        self.ws._ws = AsyncMock()
+
+        with self.assertLogs("argos", "WARNING"):
+            result = await self.ws.send_command("core.playback.pause")
+
+        self.assertIsNone(result)
+        self.ws._ws.send_str.assert_not_called()
+
+    async def test_replay_deadline_is_shared_while_disconnected(self):
+        self.app.props.settings.get_int.return_value = 0.05
+        self.ws._ws = AsyncMock()
+        loop = asyncio.get_running_loop()
+
+        with self.assertLogs("argos", "WARNING"):
+            start = loop.time()
+            self.assertIsNone(await self.ws.send_command("core.playback.pause"))
+            self.assertGreaterEqual(loop.time() - start, 0.05)
+
+            start = loop.time()
+            self.assertIsNone(await self.ws.send_command("core.playback.pause"))
+            self.assertLess(loop.time() - start, 0.05)
+
+        self.ws._ws.send_str.side_effect = self._reply_with("playing")
+        self.ws._connected.set()
+        self.assertEqual(
+            await self.ws.send_command("core.playback.get_state"), "playing"
+        )
+
+        self.ws._connected.clear()
+        task = asyncio.create_task(self.ws.send_command("core.playback.get_state"))
+        await asyncio.sleep(0.01)
+        self.ws._connected.set()
+        self.assertEqual(await asyncio.wait_for(task, timeout=1), "playing")
+
+    async def test_interrupted_read_only_command_sent_again(self):
+        self.ws._ws = AsyncMock()
+        self.ws._connected.set()
+
+        async def interrupt(data):
+            self.ws._connected.clear()
+            self.ws.cancel_commands()
+            self.ws._ws.send_str.side_effect = self._reply_with("playing")
+            asyncio.get_running_loop().call_later(0.01, self.ws._connected.set)
+
+        self.ws._ws.send_str.side_effect = interrupt
+        result = await self.ws.send_command("core.playback.get_state")
+        self.assertEqual(result, "playing")
+        self.assertEqual(self.ws._ws.send_str.await_count, 2)
+
+    async def test_interrupted_command_not_sent_again(self):
+        self.ws._ws = AsyncMock()
+        self.ws._connected.set()
+
+        async def interrupt(data):
+            self.ws.cancel_commands()
+
+        self.ws._ws.send_str.side_effect = interrupt
+        result = await self.ws.send_command("core.playback.pause")
+        self.assertIsNone(result)
+        self.assertEqual(self.ws._ws.send_str.await_count, 1)
+
+    def test_connection_retry_delays(self):
+        delays = [self.ws._get_connection_retry_delay() for _ in range(10)]
+        self.assertLessEqual(delays[0], INITIAL_CONNECTION_RETRY_DELAY)
+        self.assertTrue(all(delay <= 5 for delay in delays))
+        self.assertGreaterEqual(delays[-1], 2.5)
@@ -2,10 +2,10 @@ import asyncio
 import json
 import pathlib
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from argos.message import Message, MessageType
-from argos.wseventhandler import MopidyWSEventHandler
+from argos.wseventhandler import MopidyWSEventHandler, _CoalescingPolicy
 
 
 def load_json_data(filename: str):
@@ -35,3 +35,34 @@ class TestWSEventHandler(unittest.IsolatedAsyncioTestCase):
         parsed_ws_msg = {"event": "started_playtrack_back"}
         await self.event_handler(parsed_ws_msg)
         self.assertEqual(self.message_queue.qsize(), 0)
+
+    async def test_call_with_burst_of_coalesced_events(self):
+        with patch.dict(
+            "argos.wseventhandler._COALESCING_POLICIES",
+            {"volume_changed": _CoalescingPolicy(delay=0.01, max_delay=0.05)},
+        ):
+            for volume in range(10):
+                await self.event_handler({"event": "volume_changed", "volume": volume})
+            self.assertEqual(self.message_queue.qsize(), 0)
+
+            await asyncio.sleep(0.1)
+            self.assertEqual(self.message_queue.qsize(), 1)
+            msg = await self.message_queue.get()
+            self.assertEqual(
+                msg,
+                Message(
+                    MessageType.VOLUME_CHANGED,
+                    {"event": "volume_changed", "volume": 9},
+                ),
+            )
+
+    async def test_coalesced_events_delay_is_bounded(self):
+        with patch.dict(
+            "argos.wseventhandler._COALESCING_POLICIES",
+            {"volume_changed": _CoalescingPolicy(delay=0.05, max_delay=0.1)},
+        ):
+            for volume in range(10):
+                await self.event_handler({"event": "volume_changed", "volume": volume})
+                await asyncio.sleep(0.02)
+
+            self.assertGreaterEqual(self.message_queue.qsize(), 1)